@@ -3,6 +3,7 @@ Conversor de Process para VisualDiagram.
 Transforma modelo lógico em modelo visual seguindo padrões BPMN.
 """
 
+import os
 from typing import Dict, Literal, Optional
 from src.models.process_model import Process, ProcessElement, ProcessFlow
 from src.models.visual_model import (
@@ -422,14 +423,13 @@ class ProcessToVisualConverter:
 
         # Obter estilo (da config BPMN ou padrão)
         if 'style' in bpmn_config:
-            style = bpmn_config['style'].model_copy()
+            style = bpmn_config['style']
         else:
-            event_type = element.metadata.get('event_type') if element.is_event() else None
-            style = get_visual_style(element.type, event_type)
+            style = get_visual_style(element.type, element.event_kind)
 
         # Obter tamanho (da config BPMN ou padrão)
         if 'size' in bpmn_config:
-            size = bpmn_config['size'].model_copy()
+            size = bpmn_config['size']
         else:
             size = get_element_size(element.type)
 
@@ -459,7 +459,12 @@ class ProcessToVisualConverter:
                 if icon_svg:
                     icon_path = self.icon_resolver.get_icon_path(element.type, bpmn_type)
                     if icon_path:
-                        icon_relative_path = str(icon_path)
+                        # get_icon_path retorna caminho absoluto
+                        try:
+                            icon_relative_path = os.path.relpath(icon_path)
+                        except ValueError:
+                            # Windows: ícones em outro drive que o cwd
+                            icon_relative_path = icon_path
                     logger.debug(f"Ícone SVG encontrado para {bpmn_type}")
 
             # Determinar conteúdo baseado no modo
@@ -529,8 +534,8 @@ class ProcessToVisualConverter:
             type='circle',
             content=config['internal_content'],
             position=Position(x=0, y=0),
-            size=config['size'].model_copy(),
-            style=config['style'].model_copy(),
+            size=config['size'],
+            style=config['style'],
             metadata={
                 'original_type': 'event',
                 'bpmn_type': bpmn_type,
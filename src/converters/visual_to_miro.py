@@ -29,7 +29,7 @@ class VisualToMiroConverter:
             miro_client: Cliente Miro configurado
         """
         self.miro_client = miro_client
-        self.element_id_map: Dict[str, str] = {}  # visual_id -> miro_item_id
+        self.element_id_map: Dict[str, str] = {}  # visual_id -> miro_item_id (último board criado)
         self._settings = get_settings()
 
     def _get_miro_shape_type(self, visual_type: str) -> str:
@@ -135,7 +135,8 @@ class VisualToMiroConverter:
     def _create_visual_element(
         self,
         board_id: str,
-        element: VisualElement
+        element: VisualElement,
+        element_id_map: Dict[str, str]
     ) -> Dict:
         """
         Cria elemento visual no Miro seguindo padrões BPMN.
@@ -143,6 +144,7 @@ class VisualToMiroConverter:
         Args:
             board_id: ID do board
             element: Elemento visual
+            element_id_map: Mapa visual_id -> miro_item_id do upload atual
 
         Returns:
             Item do Miro criado
@@ -241,7 +243,7 @@ class VisualToMiroConverter:
                     logger.warning(f"Falha ao criar ícone SVG para {element.id}: {e}")
 
         # Mapear ID
-        self.element_id_map[element.id] = item['id']
+        element_id_map[element.id] = item['id']
 
         # Criar label externo para eventos (abaixo do círculo)
         if element.metadata.get('show_label_below'):
@@ -262,7 +264,8 @@ class VisualToMiroConverter:
     def _create_connector(
         self,
         board_id: str,
-        connector: Connector
+        connector: Connector,
+        element_id_map: Dict[str, str]
     ) -> Dict:
         """
         Cria conector no Miro.
@@ -270,13 +273,14 @@ class VisualToMiroConverter:
         Args:
             board_id: ID do board
             connector: Conector a criar
+            element_id_map: Mapa visual_id -> miro_item_id do upload atual
 
         Returns:
             Conector do Miro criado
         """
         # Obter IDs dos elementos no Miro
-        start_id = self.element_id_map.get(connector.from_element)
-        end_id = self.element_id_map.get(connector.to_element)
+        start_id = element_id_map.get(connector.from_element)
+        end_id = element_id_map.get(connector.to_element)
 
         if not start_id or not end_id:
             logger.warning(
@@ -312,51 +316,43 @@ class VisualToMiroConverter:
         logger.debug(f"Connector created: {item.get('id')}")
         return item
 
-    def convert_and_create(
+    def convert_and_upload(
         self,
-        diagram: VisualDiagram,
-        board_name: Optional[str] = None
-    ) -> str:
+        board_id: str,
+        diagram: VisualDiagram
+    ) -> Dict[str, str]:
         """
-        Converte VisualDiagram completo e cria board no Miro.
+        Renderiza um VisualDiagram em um board já existente.
+
+        O mapa de IDs é local a cada chamada, então a mesma instância pode
+        enviar diagramas para boards diferentes em paralelo.
 
         Args:
+            board_id: ID do board
             diagram: Diagrama visual
-            board_name: Nome do board (usa diagram.name se não fornecido)
 
         Returns:
-            ID do board criado
+            Mapa visual_id -> miro_item_id dos elementos criados
         """
-        board_name = board_name or diagram.name
-
-        logger.info(f"Creating Miro board: {board_name}")
+        element_id_map: Dict[str, str] = {}
 
-        # 1. Criar board
-        board = self.miro_client.create_board(
-            name=board_name,
-            description=diagram.description
-        )
-        board_id = board['id']
-
-        logger.info(f"Board created: {board_id}")
-
-        # 2. Criar swimlanes (fundos)
+        # 1. Criar swimlanes (fundos)
         logger.info(f"Creating {len(diagram.swimlanes)} swimlanes...")
         for swimlane in diagram.swimlanes:
             self._create_swimlane_background(board_id, swimlane)
 
-        # 3. Criar elementos
+        # 2. Criar elementos
         logger.info(f"Creating {len(diagram.elements)} elements...")
         for element in diagram.elements:
-            self._create_visual_element(board_id, element)
+            self._create_visual_element(board_id, element, element_id_map)
 
-        # 4. Criar conectores
+        # 3. Criar conectores
         logger.info(f"Creating {len(diagram.connectors)} connectors...")
         connectors_created = 0
         connectors_failed = 0
         for connector in diagram.connectors:
             try:
-                self._create_connector(board_id, connector)
+                self._create_connector(board_id, connector, element_id_map)
                 connectors_created += 1
             except Exception as e:
                 connectors_failed += 1
@@ -369,6 +365,39 @@ class VisualToMiroConverter:
             f"Connectors: {connectors_created} created, {connectors_failed} failed"
         )
 
+        return element_id_map
+
+    def convert_and_create(
+        self,
+        diagram: VisualDiagram,
+        board_name: Optional[str] = None
+    ) -> str:
+        """
+        Converte VisualDiagram completo e cria board no Miro.
+
+        Args:
+            diagram: Diagrama visual
+            board_name: Nome do board (usa diagram.name se não fornecido)
+
+        Returns:
+            ID do board criado
+        """
+        board_name = board_name or diagram.name
+
+        logger.info(f"Creating Miro board: {board_name}")
+
+        # 1. Criar board
+        board = self.miro_client.create_board(
+            name=board_name,
+            description=diagram.description
+        )
+        board_id = board['id']
+
+        logger.info(f"Board created: {board_id}")
+
+        # 2. Renderizar swimlanes, elementos e conectores
+        self.element_id_map = self.convert_and_upload(board_id, diagram)
+
         logger.info(f"✓ Miro board created successfully: {board_id}")
         logger.info(f"  URL: https://miro.com/app/board/{board_id}")
 
@@ -7,7 +7,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from src.models.process_model import Process
 from src.models.hierarchy_model import SIPOC, SIPOCItem, Macroprocess
-from src.models.visual_model import VisualDiagram, VisualElement, Position, Size, VisualStyle, ElementColor
+from src.models.visual_model import VisualDiagram, VisualElement, Position, Size, VisualStyle, Color
 from src.generators.base_generator import DocumentGenerator
 from src.utils.logger import get_logger
 
@@ -275,11 +275,11 @@ class SIPOCGenerator(DocumentGenerator):
 
         # Cores por coluna
         colors = {
-            'suppliers': ElementColor(fill="#E3F2FD", border="#1976D2"),    # Azul
-            'inputs': ElementColor(fill="#E8F5E9", border="#388E3C"),       # Verde
-            'process': ElementColor(fill="#FFF9C4", border="#FBC02D"),      # Amarelo
-            'outputs': ElementColor(fill="#FCE4EC", border="#C2185B"),      # Rosa
-            'customers': ElementColor(fill="#F3E5F5", border="#7B1FA2")     # Roxo
+            'suppliers': Color(fill="#E3F2FD", border="#1976D2"),    # Azul
+            'inputs': Color(fill="#E8F5E9", border="#388E3C"),       # Verde
+            'process': Color(fill="#FFF9C4", border="#FBC02D"),      # Amarelo
+            'outputs': Color(fill="#FCE4EC", border="#C2185B"),      # Rosa
+            'customers': Color(fill="#F3E5F5", border="#7B1FA2")     # Roxo
         }
 
         columns = ['suppliers', 'inputs', 'process', 'outputs', 'customers']
@@ -341,7 +341,7 @@ class SIPOCGenerator(DocumentGenerator):
                         position=Position(x=x, y=y),
                         size=Size(width=column_width, height=row_height),
                         style=VisualStyle(
-                            color=ElementColor(
+                            color=Color(
                                 fill=colors[col].fill,
                                 border=colors[col].border
                             ),
@@ -360,8 +360,7 @@ class SIPOCGenerator(DocumentGenerator):
             elements=elements,
             connectors=[],
             swimlanes=[],
-            width=total_width,
-            height=total_height
+            canvas_size=Size(width=total_width, height=total_height)
         )
 
         logger.info(f"Diagrama SIPOC criado com {len(elements)} elementos")
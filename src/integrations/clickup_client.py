@@ -4,8 +4,9 @@ Cria espacos, pastas, listas e tarefas com checklists e descricoes.
 """
 
 import requests
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any
 from config.settings import get_settings
+from src.integrations.http_session import get_shared_session
 from src.utils.exceptions import ClickUpAPIError
 from src.utils.logger import get_logger
 
@@ -23,7 +24,8 @@ class ClickUpClient:
     def __init__(
         self,
         api_token: Optional[str] = None,
-        team_id: Optional[str] = None
+        team_id: Optional[str] = None,
+        session: Optional[requests.Session] = None
     ):
         """
         Inicializa cliente ClickUp.
@@ -31,10 +33,12 @@ class ClickUpClient:
         Args:
             api_token: Token de acesso (usa settings se nao fornecido)
             team_id: ID do time/workspace
+            session: Sessao HTTP (usa a sessao compartilhada se nao fornecida)
         """
         settings = get_settings()
         self.api_token = api_token or settings.CLICKUP_API_TOKEN
         self.team_id = team_id or settings.CLICKUP_TEAM_ID
+        self.session = session or get_shared_session()
 
         if not self.api_token:
             logger.warning("ClickUp API token not configured")
@@ -71,7 +75,7 @@ class ClickUpClient:
         url = f"{self.BASE_URL}{endpoint}"
 
         try:
-            response = requests.request(
+            response = self.session.request(
                 method=method,
                 url=url,
                 headers=self.headers,
@@ -726,7 +730,8 @@ class ClickUpClient:
         self,
         space_id: str,
         process_name: str,
-        activities: List[Dict[str, Any]]
+        activities: Iterable[Dict[str, Any]],
+        folder_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Cria estrutura completa para um processo.
@@ -735,7 +740,9 @@ class ClickUpClient:
         Args:
             space_id: ID do espaco
             process_name: Nome do processo
-            activities: Lista de atividades [{"name": ..., "description": ..., "checklist": [...]}]
+            activities: Atividades [{"name": ..., "description": ..., "checklist": [...]}];
+                aceita um gerador, consumido uma atividade por tarefa criada
+            folder_id: Pasta ja criada para o processo (cria uma nova se omitido)
 
         Returns:
             Dict com IDs criados
@@ -747,8 +754,9 @@ class ClickUpClient:
         }
 
         # Criar pasta
-        folder = self.create_folder(space_id, process_name)
-        result["folder_id"] = folder.get("id")
+        if folder_id is None:
+            folder_id = self.create_folder(space_id, process_name).get("id")
+        result["folder_id"] = folder_id
 
         # Criar lista de atividades
         activities_list = self.create_list(result["folder_id"], "Atividades")
@@ -0,0 +1,53 @@
+"""
+Sessão HTTP compartilhada pelos clientes de API (Miro, ClickUp).
+Reaproveita conexões (keep-alive/TLS) entre instâncias e chamadas.
+"""
+
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Conexões mantidas por host e número de hosts no pool
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 64
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def _create_session() -> requests.Session:
+    """Cria sessão com pool amplo e retry de conexão/status transitório."""
+    # Retry só repete métodos idempotentes (POST não é reenviado)
+    retry = Retry(
+        total=5,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_shared_session() -> requests.Session:
+    """
+    Retorna a sessão HTTP compartilhada do processo (criada no primeiro uso).
+
+    Returns:
+        requests.Session com pool de conexões
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _create_session()
+    return _session
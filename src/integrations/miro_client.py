@@ -4,8 +4,10 @@ Cria boards e adiciona elementos visuais (shapes, conectores, sticky notes).
 """
 
 import requests
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Any
 from config.settings import get_settings
+from src.integrations.http_session import get_shared_session
 from src.utils.exceptions import MiroAPIError
 from src.utils.logger import get_logger
 
@@ -20,15 +22,21 @@ class MiroClient:
 
     BASE_URL = "https://api.miro.com/v2"
 
-    def __init__(self, api_token: Optional[str] = None):
+    def __init__(
+        self,
+        api_token: Optional[str] = None,
+        session: Optional[requests.Session] = None
+    ):
         """
         Inicializa cliente Miro.
 
         Args:
             api_token: Token de acesso (usa settings se não fornecido)
+            session: Sessão HTTP (usa a sessão compartilhada se não fornecida)
         """
         settings = get_settings()
         self.api_token = api_token or settings.MIRO_API_TOKEN
+        self.session = session or get_shared_session()
 
         self.headers = {
             "Authorization": f"Bearer {self.api_token}",
@@ -63,7 +71,7 @@ class MiroClient:
         url = f"{self.BASE_URL}{endpoint}"
 
         try:
-            response = requests.request(
+            response = self.session.request(
                 method=method,
                 url=url,
                 headers=self.headers,
@@ -668,6 +676,43 @@ class MiroClient:
         response = self._request("GET", f"/boards/{board_id}/items", params=params)
         return response.get("data", [])
 
+    def iter_items(
+        self,
+        board_id: str,
+        item_type: Optional[str] = None,
+        page_size: int = 50
+    ) -> Iterator[Dict]:
+        """
+        Itera todos os itens de um board, seguindo o cursor de paginação.
+
+        A próxima página é buscada em segundo plano enquanto a atual é
+        consumida.
+
+        Args:
+            board_id: ID do board
+            item_type: Tipo de item (shape, sticky_note, card, etc)
+            page_size: Itens por página (máximo 50 na API)
+
+        Yields:
+            Dados de cada item
+        """
+        endpoint = f"/boards/{board_id}/items"
+        params = {"limit": page_size}
+        if item_type:
+            params["type"] = item_type
+
+        def fetch(cursor: Optional[str]) -> Dict:
+            page_params = dict(params, cursor=cursor) if cursor else params
+            return self._request("GET", endpoint, params=page_params)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            next_page = executor.submit(fetch, None)
+            while next_page is not None:
+                page = next_page.result()
+                cursor = page.get("cursor")
+                next_page = executor.submit(fetch, cursor) if cursor else None
+                yield from page.get("data", [])
+
     def get_item(self, board_id: str, item_id: str) -> Dict:
         """
         Obtem um item especifico.
@@ -8,7 +8,7 @@ from typing import Dict, List
 
 from config.settings import get_settings
 from src.models.process_model import Process
-from src.models.visual_model import VisualDiagram, VisualElement, Position, Swimlane
+from src.models.visual_model import VisualDiagram, VisualElement, Position, Size, Swimlane
 from src.utils.logger import get_logger
 
 logger = get_logger()
@@ -269,9 +269,11 @@ class AutoLayoutEngine:
         required_width = x_max + margin
         required_height = y_max + margin
 
-        # Atualizar canvas size se necessário
-        diagram.canvas_size.width = max(diagram.canvas_size.width, required_width)
-        diagram.canvas_size.height = max(diagram.canvas_size.height, required_height)
+        # Atualizar canvas size se necessário (Size é imutável)
+        diagram.canvas_size = Size(
+            width=max(diagram.canvas_size.width, required_width),
+            height=max(diagram.canvas_size.height, required_height)
+        )
 
         logger.debug(
             f"Canvas size adjusted to: {diagram.canvas_size.width}x{diagram.canvas_size.height}"
@@ -8,7 +8,7 @@ from typing import Dict, List, Optional, Tuple
 from src.models.hierarchy_model import SIPOC, SIPOCItem
 from src.models.visual_model import (
     VisualDiagram, VisualElement, Connector,
-    Position, Size, VisualStyle, ElementColor
+    Position, Size, VisualStyle, Color
 )
 from src.utils.logger import get_logger
 
@@ -32,13 +32,13 @@ class SIPOCLayout:
 
     # Cores por coluna SIPOC
     COLORS = {
-        'suppliers': ElementColor(fill="#E3F2FD", border="#1976D2"),    # Azul
-        'inputs': ElementColor(fill="#E8F5E9", border="#388E3C"),       # Verde
-        'process': ElementColor(fill="#FFF9C4", border="#FBC02D"),      # Amarelo
-        'outputs': ElementColor(fill="#FCE4EC", border="#C2185B"),      # Rosa
-        'customers': ElementColor(fill="#F3E5F5", border="#7B1FA2"),    # Roxo
-        'header': ElementColor(fill="#37474F", border="#37474F"),       # Cinza escuro
-        'title': ElementColor(fill="#263238", border="#263238")         # Cinza mais escuro
+        'suppliers': Color(fill="#E3F2FD", border="#1976D2"),    # Azul
+        'inputs': Color(fill="#E8F5E9", border="#388E3C"),       # Verde
+        'process': Color(fill="#FFF9C4", border="#FBC02D"),      # Amarelo
+        'outputs': Color(fill="#FCE4EC", border="#C2185B"),      # Rosa
+        'customers': Color(fill="#F3E5F5", border="#7B1FA2"),    # Roxo
+        'header': Color(fill="#37474F", border="#37474F"),       # Cinza escuro
+        'title': Color(fill="#263238", border="#263238")         # Cinza mais escuro
     }
 
     HEADERS = ['SUPPLIERS', 'INPUTS', 'PROCESS', 'OUTPUTS', 'CUSTOMERS']
@@ -131,8 +131,7 @@ class SIPOCLayout:
             elements=elements,
             connectors=connectors,
             swimlanes=[],
-            width=total_width + self.START_X * 2,
-            height=total_height + 50,
+            canvas_size=Size(width=total_width + self.START_X * 2, height=total_height + 50),
             metadata={
                 'type': 'sipoc',
                 'process_id': sipoc.metadata.get('process_id'),
@@ -281,7 +280,7 @@ class MacroprocessSIPOCLayout(SIPOCLayout):
         # Header da secao
         total_width = len(self.COLUMNS) * (self.column_width + self.column_spacing) - self.column_spacing
 
-        diagram.elements.append(VisualElement(
+        diagram.add_element(VisualElement(
             id="related_processes_header",
             element_id="related_header",
             type='rectangle',
@@ -308,7 +307,7 @@ class MacroprocessSIPOCLayout(SIPOCLayout):
             x = self.START_X + col * (card_width + card_spacing)
             y = start_y + 50 + row * (card_height + card_spacing)
 
-            diagram.elements.append(VisualElement(
+            diagram.add_element(VisualElement(
                 id=f"related_proc_{idx}",
                 element_id=proc.get('id', f'proc_{idx}'),
                 type='rectangle',
@@ -316,7 +315,7 @@ class MacroprocessSIPOCLayout(SIPOCLayout):
                 position=Position(x=x, y=y),
                 size=Size(width=card_width, height=card_height),
                 style=VisualStyle(
-                    color=ElementColor(fill="#E0E0E0", border="#9E9E9E"),
+                    color=Color(fill="#E0E0E0", border="#9E9E9E"),
                     font_size=10,
                     border_width=1
                 ),
@@ -328,7 +327,10 @@ class MacroprocessSIPOCLayout(SIPOCLayout):
             ))
 
         # Atualizar altura do diagrama
-        diagram.height = start_y + 50 + ((len(related_processes) // cards_per_row) + 1) * (card_height + card_spacing) + 50
+        diagram.canvas_size = Size(
+            width=diagram.canvas_size.width,
+            height=start_y + 50 + ((len(related_processes) // cards_per_row) + 1) * (card_height + card_spacing) + 50
+        )
 
         return diagram
 
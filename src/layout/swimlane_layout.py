@@ -11,7 +11,7 @@ from src.models.visual_model import (
     Swimlane,
     Position,
     Size,
-    VISUAL_STYLES
+    get_swimlane_color
 )
 from src.utils.logger import get_logger
 
@@ -68,7 +68,7 @@ class SwimlaneLayoutEngine:
                 actor=actor,
                 position=Position(x=self.margin_left, y=current_y),
                 size=Size(width=swimlane_width, height=self.swimlane_height),
-                color=VISUAL_STYLES['swimlane'],
+                color=get_swimlane_color(),
                 elements=[],
                 label_vertical=self.label_vertical,
                 label_width=self.label_width
@@ -102,7 +102,7 @@ class SwimlaneLayoutEngine:
                 actor="Eventos",
                 position=Position(x=self.margin_left, y=current_y),
                 size=Size(width=swimlane_width, height=self.swimlane_height),
-                color=VISUAL_STYLES['swimlane'],
+                color=get_swimlane_color(),
                 elements=[e.id for e in elements_without_actor],
                 label_vertical=self.label_vertical,
                 label_width=self.label_width
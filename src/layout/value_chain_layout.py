@@ -8,7 +8,7 @@ from typing import Dict, List, Optional, Tuple
 from src.models.hierarchy_model import ValueChain, Macroprocess, OrganizationHierarchy
 from src.models.visual_model import (
     VisualDiagram, VisualElement, Connector, Swimlane,
-    Position, Size, VisualStyle, ElementColor
+    Position, Size, VisualStyle, Color
 )
 from src.utils.logger import get_logger
 
@@ -34,14 +34,14 @@ class ValueChainLayout:
 
     # Cores por tipo de macroprocesso
     COLORS = {
-        'primario': ElementColor(fill="#E3F2FD", border="#1976D2"),    # Azul
-        'apoio': ElementColor(fill="#E8F5E9", border="#388E3C"),       # Verde
-        'gestao': ElementColor(fill="#FFF3E0", border="#F57C00"),      # Laranja
-        'frame_primario': ElementColor(fill="#BBDEFB", border="#1976D2"),
-        'frame_apoio': ElementColor(fill="#C8E6C9", border="#388E3C"),
-        'frame_gestao': ElementColor(fill="#FFE0B2", border="#F57C00"),
-        'header': ElementColor(fill="#FAFAFA", border="#9E9E9E"),
-        'title': ElementColor(fill="#37474F", border="#37474F")
+        'primario': Color(fill="#E3F2FD", border="#1976D2"),    # Azul
+        'apoio': Color(fill="#E8F5E9", border="#388E3C"),       # Verde
+        'gestao': Color(fill="#FFF3E0", border="#F57C00"),      # Laranja
+        'frame_primario': Color(fill="#BBDEFB", border="#1976D2"),
+        'frame_apoio': Color(fill="#C8E6C9", border="#388E3C"),
+        'frame_gestao': Color(fill="#FFE0B2", border="#F57C00"),
+        'header': Color(fill="#FAFAFA", border="#9E9E9E"),
+        'title': Color(fill="#37474F", border="#37474F")
     }
 
     def __init__(
@@ -156,8 +156,7 @@ class ValueChainLayout:
             elements=elements,
             connectors=connectors,
             swimlanes=[],
-            width=total_width,
-            height=total_height,
+            canvas_size=Size(width=total_width, height=total_height),
             metadata={
                 'type': 'value_chain',
                 'organization': value_chain.organization,
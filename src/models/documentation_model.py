@@ -8,6 +8,8 @@ from datetime import datetime
 from typing import Any, Dict, List, Literal, Optional
 from pydantic import BaseModel, Field, field_validator
 
+from src.models.types import IsoDatetime
+
 
 class DocumentBase(BaseModel):
     """
@@ -541,6 +543,9 @@ class DocumentationSet(BaseModel):
     Conjunto de documentacao de um processo.
     Agrupa todos os documentos relacionados.
     """
+    # Evita o slot __weakref__ por instancia (ver hierarchy_model.Macroprocess)
+    __slots__ = ()
+
     process_id: str = Field(..., description="ID do processo")
     process_name: str = Field(..., description="Nome do processo")
     pop: Optional[POP] = Field(None, description="POP do processo")
@@ -560,11 +565,11 @@ class DocumentationSet(BaseModel):
         default_factory=list,
         description="Politicas relacionadas"
     )
-    created_at: datetime = Field(
+    created_at: IsoDatetime = Field(
         default_factory=datetime.now,
         description="Data de criacao"
     )
-    updated_at: datetime = Field(
+    updated_at: IsoDatetime = Field(
         default_factory=datetime.now,
         description="Data de ultima atualizacao"
     )
@@ -588,14 +593,9 @@ class DocumentationSet(BaseModel):
         return (
             self.pop is not None and
             self.pop.is_approved() and
-            len(self.its) > 0
+            bool(self.its)
         )
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
-
 
 # Permitir referencia circular para ManualSection
 ManualSection.model_rebuild()
@@ -3,9 +3,29 @@ Modelos de hierarquia de processos BPM.
 Suporta Cadeia de Valor, Macroprocessos e SIPOC.
 """
 
+import sys
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Dict, List, Literal, Optional
-from pydantic import BaseModel, Field, field_validator
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Literal, Optional
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
+
+from src.models.types import IsoDatetime
+
+
+def _intern_ids(model: BaseModel, *fields: str) -> BaseModel:
+    """
+    Interna (sys.intern) os campos de ID informados, in-place.
+
+    IDs internados sao compartilhados entre a chave do dict e o campo do
+    modelo, e comparacoes como parent_id == macro_id viram comparacao de
+    ponteiro no caso comum.
+    """
+    for name in fields:
+        value = getattr(model, name)
+        if value is not None:
+            setattr(model, name, sys.intern(value))
+    return model
 
 
 class SIPOCItem(BaseModel):
@@ -80,20 +100,31 @@ class SIPOC(BaseModel):
 
     def is_complete(self) -> bool:
         """Verifica se o SIPOC esta completo (todos os campos preenchidos)."""
-        return (
-            len(self.suppliers) > 0 and
-            len(self.inputs) > 0 and
-            len(self.process_steps) > 0 and
-            len(self.outputs) > 0 and
-            len(self.customers) > 0
+        return bool(
+            self.suppliers and
+            self.inputs and
+            self.process_steps and
+            self.outputs and
+            self.customers
         )
 
 
+# Rotulos de exibicao dos tipos de macroprocesso
+_TYPE_DISPLAY = MappingProxyType({
+    'primario': 'Primario',
+    'apoio': 'Apoio',
+    'gestao': 'Gestao'
+})
+
+
 class Macroprocess(BaseModel):
     """
     Macroprocesso - nivel tatico da hierarquia.
     Agrupa processos relacionados com objetivo comum.
     """
+    # Sem __weakref__ por instancia; campos continuam no __dict__ do pydantic
+    __slots__ = ()
+
     id: str = Field(..., description="Identificador unico (ex: MACRO-PRI-001)")
     name: str = Field(..., description="Nome do macroprocesso")
     description: str = Field(default="", description="Descricao do macroprocesso")
@@ -151,12 +182,7 @@ class Macroprocess(BaseModel):
 
     def get_type_display(self) -> str:
         """Retorna o tipo formatado para exibicao."""
-        type_map = {
-            'primario': 'Primario',
-            'apoio': 'Apoio',
-            'gestao': 'Gestao'
-        }
-        return type_map.get(self.type, self.type)
+        return _TYPE_DISPLAY.get(self.type, self.type)
 
 
 class ValueChain(BaseModel):
@@ -164,6 +190,8 @@ class ValueChain(BaseModel):
     Cadeia de Valor - nivel estrategico da hierarquia.
     Visao completa de todos os macroprocessos da organizacao.
     """
+    __slots__ = ()
+
     id: str = Field(..., description="Identificador unico")
     name: str = Field(..., description="Nome da cadeia de valor")
     description: str = Field(default="", description="Descricao da cadeia de valor")
@@ -225,6 +253,8 @@ class ProcessHierarchy(BaseModel):
     Processo com suporte a hierarquia.
     Estende o conceito de processo para incluir relacionamentos hierarquicos.
     """
+    __slots__ = ()
+
     id: str = Field(..., description="Identificador unico (ex: PROC-MKT-001)")
     name: str = Field(..., description="Nome do processo")
     description: str = Field(default="", description="Descricao do processo")
@@ -383,11 +413,38 @@ class Task(BaseModel):
         return v.strip()
 
 
+def _construct_sipoc(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Reconstroi o SIPOC aninhado de um dict confiavel sem validacao."""
+    sipoc = data.get('sipoc')
+    if isinstance(sipoc, dict):
+        items = {
+            key: [SIPOCItem.model_construct(**item) for item in sipoc.get(key, [])]
+            for key in ('suppliers', 'inputs', 'outputs', 'customers')
+        }
+        data = {**data, 'sipoc': SIPOC.model_construct(**{**sipoc, **items})}
+    return data
+
+
+def _construct_activity(data: Dict[str, Any]) -> 'Activity':
+    """Reconstroi uma atividade (e suas tarefas) sem validacao."""
+    tasks = [Task.model_construct(**t) for t in data.get('tasks', [])]
+    return Activity.model_construct(**{**data, 'tasks': tasks})
+
+
+# Campos de ID internados por tipo de elemento da hierarquia
+_MACRO_ID_FIELDS = ('id', 'value_chain_id')
+_PROCESS_ID_FIELDS = ('id', 'parent_id')
+_ACTIVITY_ID_FIELDS = ('id', 'process_id')
+_TASK_ID_FIELDS = ('id', 'activity_id')
+
+
 class OrganizationHierarchy(BaseModel):
     """
     Hierarquia organizacional completa.
     Container para toda a estrutura de processos.
     """
+    __slots__ = ()
+
     value_chain: Optional[ValueChain] = Field(
         None,
         description="Cadeia de Valor da organizacao"
@@ -408,11 +465,11 @@ class OrganizationHierarchy(BaseModel):
         default_factory=dict,
         description="Tarefas indexadas por ID"
     )
-    created_at: datetime = Field(
+    created_at: IsoDatetime = Field(
         default_factory=datetime.now,
         description="Data de criacao"
     )
-    updated_at: datetime = Field(
+    updated_at: IsoDatetime = Field(
         default_factory=datetime.now,
         description="Data de ultima atualizacao"
     )
@@ -421,6 +478,49 @@ class OrganizationHierarchy(BaseModel):
         description="Metadados adicionais"
     )
 
+    # Controle de atualizacoes em lote (ver batch_updates)
+    _batch_depth: int = PrivateAttr(default=0)
+
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> 'OrganizationHierarchy':
+        """
+        Reconstroi a hierarquia a partir de dados ja validados, sem validacao.
+
+        Usa model_construct em todos os modelos aninhados. Destinado a
+        snapshots persistidos por esta mesma aplicacao (ex: model_dump_json);
+        os dados DEVEM seguir o schema. Para entrada nao confiavel use
+        model_validate.
+
+        Args:
+            data: Dict no formato de model_dump / model_dump_json
+
+        Returns:
+            OrganizationHierarchy reconstruida
+        """
+        data = dict(data)
+        if isinstance(data.get('value_chain'), dict):
+            data['value_chain'] = ValueChain.model_construct(**data['value_chain'])
+        data['macroprocesses'] = {
+            key: Macroprocess.model_construct(**_construct_sipoc(m))
+            for key, m in data.get('macroprocesses', {}).items()
+        }
+        data['processes'] = {
+            key: ProcessHierarchy.model_construct(**_construct_sipoc(p))
+            for key, p in data.get('processes', {}).items()
+        }
+        data['activities'] = {
+            key: _construct_activity(a)
+            for key, a in data.get('activities', {}).items()
+        }
+        data['tasks'] = {
+            key: Task.model_construct(**t)
+            for key, t in data.get('tasks', {}).items()
+        }
+        for field in ('created_at', 'updated_at'):
+            if isinstance(data.get(field), str):
+                data[field] = datetime.fromisoformat(data[field])
+        return cls.model_construct(**data)
+
     def get_macroprocess(self, macro_id: str) -> Optional[Macroprocess]:
         """Busca macroprocesso por ID."""
         return self.macroprocesses.get(macro_id)
@@ -449,6 +549,26 @@ class OrganizationHierarchy(BaseModel):
         """Retorna macroprocessos de gestao."""
         return [m for m in self.macroprocesses.values() if m.is_management()]
 
+    def snapshot(self) -> Dict[str, List[str]]:
+        """
+        Retorna os IDs dos macroprocessos agrupados por tipo.
+
+        Faz uma unica passada sobre os macroprocessos, ao inves das tres
+        passadas de get_primary/get_support/get_management_macroprocesses.
+        Util para exportacao da hierarquia completa.
+
+        Returns:
+            Dict com as chaves 'primary', 'support' e 'management'
+        """
+        groups: Dict[str, List[str]] = {'primario': [], 'apoio': [], 'gestao': []}
+        for macro_id, macro in self.macroprocesses.items():
+            groups[macro.type].append(macro_id)
+        return {
+            'primary': groups['primario'],
+            'support': groups['apoio'],
+            'management': groups['gestao']
+        }
+
     def get_processes_by_macroprocess(self, macro_id: str) -> List[ProcessHierarchy]:
         """Retorna processos de um macroprocesso."""
         return [p for p in self.processes.values() if p.parent_id == macro_id]
@@ -457,30 +577,95 @@ class OrganizationHierarchy(BaseModel):
         """Retorna atividades de um processo."""
         return [a for a in self.activities.values() if a.process_id == process_id]
 
+    def _touch(self) -> None:
+        """Atualiza updated_at, exceto dentro de batch_updates()."""
+        if not self._batch_depth:
+            self.updated_at = datetime.now()
+
+    def model_post_init(self, __context: Any) -> None:
+        """Interna os IDs dos elementos recebidos na construcao."""
+        self.macroprocesses = self._interned(self.macroprocesses, _MACRO_ID_FIELDS)
+        self.processes = self._interned(self.processes, _PROCESS_ID_FIELDS)
+        self.activities = self._interned(self.activities, _ACTIVITY_ID_FIELDS)
+        self.tasks = self._interned(self.tasks, _TASK_ID_FIELDS)
+
+    @staticmethod
+    def _interned(items: Dict[str, Any], fields: tuple) -> Dict[str, Any]:
+        """Retorna copia do dict com chaves e campos de ID internados."""
+        return {
+            sys.intern(key): _intern_ids(item, *fields)
+            for key, item in items.items()
+        }
+
     def add_macroprocess(self, macroprocess: Macroprocess):
         """Adiciona macroprocesso a hierarquia."""
+        _intern_ids(macroprocess, *_MACRO_ID_FIELDS)
         self.macroprocesses[macroprocess.id] = macroprocess
-        self.updated_at = datetime.now()
+        self._touch()
 
     def add_process(self, process: ProcessHierarchy):
         """Adiciona processo a hierarquia."""
+        _intern_ids(process, *_PROCESS_ID_FIELDS)
         self.processes[process.id] = process
-        self.updated_at = datetime.now()
+        self._touch()
 
     def add_activity(self, activity: Activity):
         """Adiciona atividade a hierarquia."""
+        _intern_ids(activity, *_ACTIVITY_ID_FIELDS)
         self.activities[activity.id] = activity
-        self.updated_at = datetime.now()
+        self._touch()
 
     def add_task(self, task: Task):
         """Adiciona tarefa a hierarquia."""
+        _intern_ids(task, *_TASK_ID_FIELDS)
         self.tasks[task.id] = task
-        self.updated_at = datetime.now()
-
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+        self._touch()
+
+    def bulk_load(
+        self,
+        macroprocesses: Optional[Dict[str, Macroprocess]] = None,
+        processes: Optional[Dict[str, ProcessHierarchy]] = None,
+        activities: Optional[Dict[str, Activity]] = None,
+        tasks: Optional[Dict[str, Task]] = None
+    ):
+        """
+        Carrega varios elementos de uma vez na hierarquia.
+
+        Atualiza updated_at uma unica vez, ao inves de uma vez por elemento
+        como acontece nos metodos add_*.
+
+        Args:
+            macroprocesses: Macroprocessos indexados por ID
+            processes: Processos indexados por ID
+            activities: Atividades indexadas por ID
+            tasks: Tarefas indexadas por ID
+        """
+        if macroprocesses:
+            self.macroprocesses.update(self._interned(macroprocesses, _MACRO_ID_FIELDS))
+        if processes:
+            self.processes.update(self._interned(processes, _PROCESS_ID_FIELDS))
+        if activities:
+            self.activities.update(self._interned(activities, _ACTIVITY_ID_FIELDS))
+        if tasks:
+            self.tasks.update(self._interned(tasks, _TASK_ID_FIELDS))
+        self._touch()
+
+    @contextmanager
+    def batch_updates(self) -> Iterator['OrganizationHierarchy']:
+        """
+        Agrupa varias chamadas add_* em uma unica atualizacao de updated_at.
+
+        Usage:
+            with hierarchy.batch_updates():
+                for macro in macros:
+                    hierarchy.add_macroprocess(macro)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            self._touch()
 
 
 # Permitir referencia circular para Activity.tasks
@@ -5,9 +5,12 @@ Este módulo define as estruturas de dados para gerenciar ícones customizados
 utilizados na representação visual de elementos BPMN.
 """
 
-from typing import Dict, Optional, Literal
+import os
+import sys
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Literal
 from pathlib import Path
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 
 
 class IconConfig(BaseModel):
@@ -95,9 +98,35 @@ class IconLibrary(BaseModel):
         default_factory=IconLibraryConfig, description="Configurações"
     )
 
+    @field_validator("tasks", "events", "gateways")
+    @classmethod
+    def intern_bpmn_types(cls, v: Dict[str, str]) -> Dict[str, str]:
+        """Interna as chaves de tipo BPMN para acelerar as buscas por tipo."""
+        return {sys.intern(bpmn_type): path for bpmn_type, path in v.items()}
+
+    # Caminho base absoluto e cache de existencia de arquivos (ver has_icon)
+    _base_str: str = PrivateAttr(default="")
+    _exists_cache: Dict[str, bool] = PrivateAttr(default_factory=dict)
+    # Cópias somente leitura das tabelas usadas em get_icon_path
+    _tasks_ro: Mapping[str, str] = PrivateAttr(default_factory=dict)
+    _events_ro: Mapping[str, str] = PrivateAttr(default_factory=dict)
+    _gateways_ro: Mapping[str, str] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context: Any) -> None:
+        """
+        Pré-calcula o caminho base absoluto e as tabelas de busca.
+
+        As tabelas são lidas apenas na construção; alterações posteriores em
+        tasks/events/gateways não são refletidas em get_icon_path.
+        """
+        self._base_str = str(Path(self.config.base_path).resolve())
+        self._tasks_ro = MappingProxyType(dict(self.tasks))
+        self._events_ro = MappingProxyType(dict(self.events))
+        self._gateways_ro = MappingProxyType(dict(self.gateways))
+
     def get_icon_path(
         self, element_type: str, bpmn_type: str
-    ) -> Optional[Path]:
+    ) -> Optional[str]:
         """
         Resolve o caminho do arquivo de ícone baseado no tipo BPMN.
 
@@ -106,19 +135,19 @@ class IconLibrary(BaseModel):
             bpmn_type: Tipo BPMN específico (ex: 'user_task', 'start_event')
 
         Returns:
-            Path absoluto do arquivo SVG ou None se não encontrado
+            Caminho absoluto do arquivo SVG ou None se não encontrado
 
         Examples:
             >>> library.get_icon_path('task', 'user_task')
-            Path('data/icons/tasks/user-task.svg')
+            '/path/to/data/icons/tasks/user-task.svg'
         """
         # Determina o dicionário correto baseado no tipo de elemento
-        if element_type == "task" or bpmn_type in self.tasks:
-            icon_map = self.tasks
-        elif element_type == "event" or bpmn_type in self.events:
-            icon_map = self.events
-        elif element_type == "gateway" or bpmn_type in self.gateways:
-            icon_map = self.gateways
+        if element_type == "task" or bpmn_type in self._tasks_ro:
+            icon_map = self._tasks_ro
+        elif element_type == "event" or bpmn_type in self._events_ro:
+            icon_map = self._events_ro
+        elif element_type == "gateway" or bpmn_type in self._gateways_ro:
+            icon_map = self._gateways_ro
         else:
             return None
 
@@ -131,11 +160,26 @@ class IconLibrary(BaseModel):
                 relative_path = icon_map.get(fallback_type)
 
         if relative_path:
-            base = Path(self.config.base_path)
-            return base / relative_path
+            return self._base_str + "/" + relative_path
 
         return None
 
+    def get_icon_path_obj(
+        self, element_type: str, bpmn_type: str
+    ) -> Optional[Path]:
+        """
+        Variante de get_icon_path que retorna Path.
+
+        Args:
+            element_type: Tipo do elemento ('task', 'event', 'gateway', 'annotation')
+            bpmn_type: Tipo BPMN específico (ex: 'user_task', 'start_event')
+
+        Returns:
+            Path absoluto do arquivo SVG ou None se não encontrado
+        """
+        icon_path = self.get_icon_path(element_type, bpmn_type)
+        return Path(icon_path) if icon_path else None
+
     def get_icon_size(self, element_type: str) -> int:
         """
         Retorna o tamanho apropriado para o ícone baseado no tipo.
@@ -170,9 +214,43 @@ class IconLibrary(BaseModel):
 
         Returns:
             True se o ícone existe
+
+        Note:
+            A existência de cada arquivo é verificada uma única vez e
+            mantida em cache, pois raramente muda durante a execução.
         """
         icon_path = self.get_icon_path(element_type, bpmn_type)
-        return icon_path is not None and icon_path.exists()
+        if icon_path is None:
+            return False
+
+        exists = self._exists_cache.get(icon_path)
+        if exists is None:
+            exists = self._exists_cache[icon_path] = os.path.exists(icon_path)
+        return exists
+
+
+# Mapeamentos padrão de metadata para tipos BPMN (copiados por TypeMapping)
+_DEFAULT_EVENT_TYPE = MappingProxyType({
+    "start": "start_event",
+    "end": "end_event",
+    "timer": "timer_event",
+    "message": "message_event",
+    "error": "error_event",
+})
+_DEFAULT_GATEWAY_TYPE = MappingProxyType({
+    "exclusive": "exclusive_gateway",
+    "inclusive": "inclusive_gateway",
+    "parallel": "parallel_gateway",
+    "event_based": "event_based_gateway",
+})
+_DEFAULT_TASK_TYPE = MappingProxyType({
+    "user": "user_task",
+    "manual": "manual_task",
+    "service": "service_task",
+    "script": "script_task",
+    "send": "send_task",
+    "receive": "receive_task",
+})
 
 
 class TypeMapping(BaseModel):
@@ -184,33 +262,27 @@ class TypeMapping(BaseModel):
     """
 
     event_type: Dict[str, str] = Field(
-        default_factory=lambda: {
-            "start": "start_event",
-            "end": "end_event",
-            "timer": "timer_event",
-            "message": "message_event",
-            "error": "error_event",
-        }
+        default_factory=lambda: dict(_DEFAULT_EVENT_TYPE)
     )
     gateway_type: Dict[str, str] = Field(
-        default_factory=lambda: {
-            "exclusive": "exclusive_gateway",
-            "inclusive": "inclusive_gateway",
-            "parallel": "parallel_gateway",
-            "event_based": "event_based_gateway",
-        }
+        default_factory=lambda: dict(_DEFAULT_GATEWAY_TYPE)
     )
     task_type: Dict[str, str] = Field(
-        default_factory=lambda: {
-            "user": "user_task",
-            "manual": "manual_task",
-            "service": "service_task",
-            "script": "script_task",
-            "send": "send_task",
-            "receive": "receive_task",
-        }
+        default_factory=lambda: dict(_DEFAULT_TASK_TYPE)
     )
 
+    @field_validator("event_type", "gateway_type", "task_type")
+    @classmethod
+    def intern_bpmn_types(cls, v: Dict[str, str]) -> Dict[str, str]:
+        """
+        Interna os tipos BPMN resolvidos.
+
+        Os valores retornados por resolve_bpmn_type passam a ser os mesmos
+        objetos usados como chave em IconLibrary, evitando comparações
+        caractere a caractere em get_icon_path.
+        """
+        return {sys.intern(key): sys.intern(bpmn_type) for key, bpmn_type in v.items()}
+
     def resolve_bpmn_type(
         self, element_type: str, metadata: Dict
     ) -> Optional[str]:
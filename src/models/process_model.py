@@ -3,26 +3,35 @@ Modelo intermediário de processo.
 Formato neutro entre parsing e visualização (Miro/ClickUp).
 """
 
+import sys
+import time
 from datetime import datetime
-from typing import Any, Dict, List, Literal, Optional
-from pydantic import BaseModel, Field, field_validator
+from typing import Annotated, Any, Dict, List, Literal, Optional, Tuple
+from pydantic import (
+    AfterValidator, BaseModel, ConfigDict, Field, PrivateAttr, model_validator
+)
+
+from src.models.types import InternedStr, IsoDatetime, NonEmptyStr
 
 
 class ProcessElement(BaseModel):
     """
     Elemento individual de um processo (tarefa, decisão, evento, anotação).
     """
-    id: str = Field(..., description="Identificador único do elemento")
+    id: NonEmptyStr = Field(..., description="Identificador único do elemento")
     type: Literal['task', 'gateway', 'event', 'annotation'] = Field(
         ...,
         description="Tipo do elemento"
     )
-    name: str = Field(..., description="Nome/título do elemento")
+    name: NonEmptyStr = Field(..., description="Nome/título do elemento")
     description: Optional[str] = Field(None, description="Descrição detalhada")
-    actor: Optional[str] = Field(None, description="Responsável pela execução (para swimlane)")
+    actor: Optional[InternedStr] = Field(None, description="Responsável pela execução (para swimlane)")
 
     # Campos hierárquicos (novos)
-    hierarchy_level: Optional[Literal['processo', 'subprocesso', 'atividade', 'tarefa']] = Field(
+    hierarchy_level: Optional[Annotated[
+        Literal['processo', 'subprocesso', 'atividade', 'tarefa'],
+        AfterValidator(sys.intern)
+    ]] = Field(
         None,
         description="Nível na hierarquia BPM"
     )
@@ -40,16 +49,17 @@ class ProcessElement(BaseModel):
         None,
         description="Referência ao documento (ex: POP-001, IT-001)"
     )
-    inputs: List[str] = Field(
-        default_factory=list,
+    # Tuplas: o default vazio é compartilhado, sem alocar uma lista por elemento
+    inputs: Tuple[str, ...] = Field(
+        default=(),
         description="Entradas necessárias para a atividade"
     )
-    outputs: List[str] = Field(
-        default_factory=list,
+    outputs: Tuple[str, ...] = Field(
+        default=(),
         description="Saídas/entregas da atividade"
     )
-    tools: List[str] = Field(
-        default_factory=list,
+    tools: Tuple[str, ...] = Field(
+        default=(),
         description="Ferramentas/sistemas utilizados"
     )
 
@@ -63,26 +73,44 @@ class ProcessElement(BaseModel):
         description="ID da tarefa no ClickUp"
     )
 
+    event_kind: Optional[Literal['start', 'end']] = Field(
+        None,
+        description="Início/fim para eventos (sincronizado com metadata['event_type'])"
+    )
+
     metadata: Dict[str, Any] = Field(
         default_factory=dict,
         description="Metadados adicionais específicos do tipo"
     )
 
-    @field_validator('id')
-    @classmethod
-    def validate_id(cls, v: str) -> str:
-        """Valida que o ID não está vazio."""
-        if not v or not v.strip():
-            raise ValueError("ID cannot be empty")
-        return v.strip()
+    @model_validator(mode='after')
+    def sync_event_kind(self) -> 'ProcessElement':
+        """
+        Sincroniza event_kind com metadata['event_type'] para eventos.
+
+        Executa uma vez na construção; alterações posteriores em metadata não
+        são refletidas em event_kind.
+        """
+        if self.type != 'event':
+            self.event_kind = None
+            return self
+        if self.event_kind is None:
+            event_type = self.metadata.get('event_type')
+            if event_type in ('start', 'end'):
+                self.event_kind = event_type
+        elif 'event_type' not in self.metadata:
+            self.metadata['event_type'] = self.event_kind
+        return self
 
-    @field_validator('name')
     @classmethod
-    def validate_name(cls, v: str) -> str:
-        """Valida que o nome não está vazio."""
-        if not v or not v.strip():
-            raise ValueError("Name cannot be empty")
-        return v.strip()
+    def from_trusted(cls, data: Dict[str, Any]) -> 'ProcessElement':
+        """
+        Cria o elemento sem validação (model_construct).
+
+        Use apenas com dados emitidos por este mesmo modelo (model_dump /
+        model_dump_json); para entrada externa use o construtor normal.
+        """
+        return cls.model_construct(**data)
 
     def is_task(self) -> bool:
         """Verifica se é uma tarefa."""
@@ -98,11 +126,11 @@ class ProcessElement(BaseModel):
 
     def is_start_event(self) -> bool:
         """Verifica se é um evento de início."""
-        return self.type == 'event' and self.metadata.get('event_type') == 'start'
+        return self.event_kind == 'start'
 
     def is_end_event(self) -> bool:
         """Verifica se é um evento de fim."""
-        return self.type == 'event' and self.metadata.get('event_type') == 'end'
+        return self.event_kind == 'end'
 
     def is_annotation(self) -> bool:
         """Verifica se é uma anotação."""
@@ -113,24 +141,16 @@ class ProcessFlow(BaseModel):
     """
     Fluxo/conexão entre elementos do processo.
     """
-    from_element: str = Field(..., description="ID do elemento de origem")
-    to_element: str = Field(..., description="ID do elemento de destino")
+    from_element: NonEmptyStr = Field(..., description="ID do elemento de origem")
+    to_element: NonEmptyStr = Field(..., description="ID do elemento de destino")
     condition: Optional[str] = Field(None, description="Condição para seguir este fluxo (para gateways)")
 
-    @field_validator('from_element', 'to_element')
-    @classmethod
-    def validate_element_ids(cls, v: str) -> str:
-        """Valida que os IDs não estão vazios."""
-        if not v or not v.strip():
-            raise ValueError("Element ID cannot be empty")
-        return v.strip()
-
 
 class Process(BaseModel):
     """
     Modelo completo de um processo de negócio.
     """
-    name: str = Field(..., description="Nome do processo")
+    name: NonEmptyStr = Field(..., description="Nome do processo")
     description: str = Field(default="", description="Descrição do processo")
     elements: List[ProcessElement] = Field(
         default_factory=list,
@@ -140,7 +160,7 @@ class Process(BaseModel):
         default_factory=list,
         description="Lista de fluxos entre elementos"
     )
-    actors: List[str] = Field(
+    actors: List[InternedStr] = Field(
         default_factory=list,
         description="Lista de atores/responsáveis (para swimlanes)"
     )
@@ -220,13 +240,95 @@ class Process(BaseModel):
         description="Metadados adicionais do processo"
     )
 
-    @field_validator('name')
+    # Índices construídos sob demanda (ver _build_indices / invalidate_indices)
+    _element_index: Optional[Dict[str, ProcessElement]] = PrivateAttr(default=None)
+    _out_index: Optional[Dict[str, List[ProcessFlow]]] = PrivateAttr(default=None)
+    _in_index: Optional[Dict[str, List[ProcessFlow]]] = PrivateAttr(default=None)
+    _actor_index: Optional[Dict[str, List[ProcessElement]]] = PrivateAttr(default=None)
+    _buckets: Optional[Dict[str, List[ProcessElement]]] = PrivateAttr(default=None)
+    _sipoc_task_names: Optional[List[str]] = PrivateAttr(default=None)
+
     @classmethod
-    def validate_name(cls, v: str) -> str:
-        """Valida que o nome não está vazio."""
-        if not v or not v.strip():
-            raise ValueError("Process name cannot be empty")
-        return v.strip()
+    def from_trusted(cls, data: Dict[str, Any]) -> 'Process':
+        """
+        Cria o processo, seus elementos e fluxos sem validação.
+
+        Use apenas com dados emitidos por este mesmo modelo (model_dump /
+        model_dump_json); para entrada externa use o construtor normal.
+
+        Args:
+            data: Dict no formato de model_dump
+
+        Returns:
+            Process reconstruído
+        """
+        elements = [ProcessElement.from_trusted(e) for e in data.get('elements', [])]
+        flows = [ProcessFlow.model_construct(**f) for f in data.get('flows', [])]
+        return cls.model_construct(**{**data, 'elements': elements, 'flows': flows})
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in ('elements', 'flows'):
+            self.invalidate_indices()
+
+    def _build_indices(self) -> None:
+        """Constrói os índices de elementos, fluxos e atores em uma passada."""
+        element_index: Dict[str, ProcessElement] = {}
+        actor_index: Dict[str, List[ProcessElement]] = {}
+        for element in self.elements:
+            # Mantém o primeiro elemento em caso de ID duplicado
+            element_index.setdefault(element.id, element)
+            actor_index.setdefault(element.actor, []).append(element)
+
+        out_index: Dict[str, List[ProcessFlow]] = {}
+        in_index: Dict[str, List[ProcessFlow]] = {}
+        for flow in self.flows:
+            out_index.setdefault(flow.from_element, []).append(flow)
+            in_index.setdefault(flow.to_element, []).append(flow)
+
+        self._element_index = element_index
+        self._actor_index = actor_index
+        self._out_index = out_index
+        self._in_index = in_index
+
+    def _build_buckets(self) -> Dict[str, List[ProcessElement]]:
+        """
+        Agrupa os elementos por tipo, tipo de evento, nível hierárquico e
+        numeração em uma única passada.
+        """
+        buckets: Dict[str, List[ProcessElement]] = {}
+        for element in self.elements:
+            buckets.setdefault(element.type, []).append(element)
+            if element.event_kind:
+                buckets.setdefault(f"event_{element.event_kind}", []).append(element)
+            if element.hierarchy_level:
+                buckets.setdefault(f"hl_{element.hierarchy_level}", []).append(element)
+            if element.numbering is not None:
+                buckets.setdefault('numbered', []).append(element)
+        self._buckets = buckets
+        return buckets
+
+    def _bucket(self, key: str) -> List[ProcessElement]:
+        """Retorna um grupo de elementos (compartilhado; não modificar)."""
+        buckets = self._buckets
+        if buckets is None:
+            buckets = self._build_buckets()
+        return buckets.get(key, [])
+
+    def invalidate_indices(self):
+        """
+        Descarta os índices de busca.
+
+        Atribuir elements/flows invalida automaticamente; chame este método
+        após alterar as listas in-place (append, remove...) ou mudar o id/ator
+        de um elemento.
+        """
+        self._element_index = None
+        self._out_index = None
+        self._in_index = None
+        self._actor_index = None
+        self._buckets = None
+        self._sipoc_task_names = None
 
     def get_element(self, element_id: str) -> Optional[ProcessElement]:
         """
@@ -238,26 +340,25 @@ class Process(BaseModel):
         Returns:
             ProcessElement ou None se não encontrado
         """
-        for element in self.elements:
-            if element.id == element_id:
-                return element
-        return None
+        if self._element_index is None:
+            self._build_indices()
+        return self._element_index.get(element_id)
 
     def get_start_events(self) -> List[ProcessElement]:
         """Retorna todos os eventos de início."""
-        return [e for e in self.elements if e.is_start_event()]
+        return self._bucket('event_start')
 
     def get_end_events(self) -> List[ProcessElement]:
         """Retorna todos os eventos de fim."""
-        return [e for e in self.elements if e.is_end_event()]
+        return self._bucket('event_end')
 
     def get_tasks(self) -> List[ProcessElement]:
         """Retorna todas as tarefas."""
-        return [e for e in self.elements if e.is_task()]
+        return self._bucket('task')
 
     def get_gateways(self) -> List[ProcessElement]:
         """Retorna todas as decisões."""
-        return [e for e in self.elements if e.is_gateway()]
+        return self._bucket('gateway')
 
     def get_outgoing_flows(self, element_id: str) -> List[ProcessFlow]:
         """
@@ -267,9 +368,11 @@ class Process(BaseModel):
             element_id: ID do elemento
 
         Returns:
-            Lista de fluxos de saída
+            Lista de fluxos de saída (compartilhada com o índice; não modificar)
         """
-        return [f for f in self.flows if f.from_element == element_id]
+        if self._out_index is None:
+            self._build_indices()
+        return self._out_index.get(element_id, [])
 
     def get_incoming_flows(self, element_id: str) -> List[ProcessFlow]:
         """
@@ -279,9 +382,11 @@ class Process(BaseModel):
             element_id: ID do elemento
 
         Returns:
-            Lista de fluxos de entrada
+            Lista de fluxos de entrada (compartilhada com o índice; não modificar)
         """
-        return [f for f in self.flows if f.to_element == element_id]
+        if self._in_index is None:
+            self._build_indices()
+        return self._in_index.get(element_id, [])
 
     def get_elements_by_actor(self, actor: str) -> List[ProcessElement]:
         """
@@ -291,9 +396,11 @@ class Process(BaseModel):
             actor: Nome do ator
 
         Returns:
-            Lista de elementos
+            Lista de elementos (compartilhada com o índice; não modificar)
         """
-        return [e for e in self.elements if e.actor == actor]
+        if self._actor_index is None:
+            self._build_indices()
+        return self._actor_index.get(actor, [])
 
     def is_subprocess(self) -> bool:
         """Verifica se é um subprocesso."""
@@ -309,7 +416,7 @@ class Process(BaseModel):
 
     def get_numbered_elements(self) -> List[ProcessElement]:
         """Retorna elementos com numeração hierárquica."""
-        return [e for e in self.elements if e.numbering is not None]
+        return self._bucket('numbered')
 
     def get_elements_by_hierarchy_level(
         self,
@@ -324,7 +431,7 @@ class Process(BaseModel):
         Returns:
             Lista de elementos
         """
-        return [e for e in self.elements if e.hierarchy_level == level]
+        return self._bucket(f"hl_{level}")
 
     def get_sipoc_summary(self) -> Dict[str, List[str]]:
         """
@@ -333,10 +440,12 @@ class Process(BaseModel):
         Returns:
             Dict com suppliers, inputs, process (nomes das tarefas), outputs, customers
         """
+        if self._sipoc_task_names is None:
+            self._sipoc_task_names = [e.name for e in self.get_tasks()]
         return {
             'suppliers': self.suppliers,
             'inputs': self.inputs,
-            'process': [e.name for e in self.get_tasks()],
+            'process': self._sipoc_task_names,
             'outputs': self.outputs,
             'customers': self.customers
         }
@@ -346,34 +455,63 @@ class Process(BaseModel):
         Atribui numeração hierárquica aos elementos baseado na ordem e swimlane.
         Elementos são numerados por swimlane: 1.1, 1.2 (swimlane 1), 2.1, 2.2 (swimlane 2).
         """
+        # A numeração altera o grupo 'numbered' (ver _build_buckets)
+        self._buckets = None
+
         if not self.actors:
             # Sem swimlanes, numerar sequencialmente
             counter = 1
             for element in self.elements:
-                if element.is_task():
+                if element.type == 'task':
                     element.numbering = str(counter)
                     counter += 1
             return
 
-        # Com swimlanes, numerar por ator
+        # Com swimlanes, agrupar tarefas por ator em uma passada e numerar
+        tasks_by_actor: Dict[str, List[ProcessElement]] = {a: [] for a in self.actors}
+        for element in self.elements:
+            if element.type == 'task':
+                actor_tasks = tasks_by_actor.get(element.actor)
+                if actor_tasks is not None:
+                    actor_tasks.append(element)
+
         for actor_idx, actor in enumerate(self.actors, start=1):
-            actor_elements = self.get_elements_by_actor(actor)
-            task_counter = 1
-            for element in actor_elements:
-                if element.is_task():
-                    element.numbering = f"{actor_idx}.{task_counter}"
-                    task_counter += 1
+            for task_counter, element in enumerate(tasks_by_actor[actor], start=1):
+                element.numbering = f"{actor_idx}.{task_counter}"
+
+
+# Último instante calculado por _fast_now: [time.time(), datetime]
+_now_cache: List[Any] = [0.0, None]
+
+
+def _fast_now() -> datetime:
+    """
+    datetime.now() com resolução de 50 ms, para criação em lote.
+
+    Reaproveita o último datetime calculado enquanto estiver dentro da
+    janela, evitando construir um datetime novo por objeto.
+    """
+    t = time.time()
+    if t - _now_cache[0] > 0.05:
+        _now_cache[0] = t
+        _now_cache[1] = datetime.fromtimestamp(t)
+    return _now_cache[1]
 
 
 class ProcessExtractionResult(BaseModel):
     """
     Resultado da extração de processo de uma transcrição.
     Inclui o processo e metadados sobre a extração.
+
+    Os extratores criam o resultado com model_construct: o Process já
+    chega validado e os demais campos são montados internamente.
     """
+    model_config = ConfigDict(extra='forbid', revalidate_instances='never')
+
     process: Process = Field(..., description="Processo extraído")
     source_file: Optional[str] = Field(None, description="Arquivo fonte da transcrição")
-    extraction_timestamp: datetime = Field(
-        default_factory=datetime.now,
+    extraction_timestamp: IsoDatetime = Field(
+        default_factory=_fast_now,
         description="Timestamp da extração"
     )
     llm_model: Optional[str] = Field(None, description="Modelo LLM usado na extração")
@@ -388,17 +526,14 @@ class ProcessExtractionResult(BaseModel):
         description="Avisos durante a extração"
     )
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
-
 
 class ProcessIntegrationMetadata(BaseModel):
     """
     Metadados de integração entre Miro e ClickUp.
     Mantém referências cruzadas para sincronização.
     """
+    model_config = ConfigDict(extra='forbid')
+
     process_id: str = Field(..., description="ID do processo")
     process_name: str = Field(..., description="Nome do processo")
 
@@ -427,11 +562,11 @@ class ProcessIntegrationMetadata(BaseModel):
     )
 
     # Timestamps
-    created_at: datetime = Field(
-        default_factory=datetime.now,
+    created_at: IsoDatetime = Field(
+        default_factory=_fast_now,
         description="Data de criação"
     )
-    last_synced_at: Optional[datetime] = Field(
+    last_synced_at: Optional[IsoDatetime] = Field(
         None,
         description="Última sincronização"
     )
@@ -460,8 +595,3 @@ class ProcessIntegrationMetadata(BaseModel):
     def mark_synced(self):
         """Marca como sincronizado agora."""
         self.last_synced_at = datetime.now()
-
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
@@ -0,0 +1,22 @@
+"""
+Tipos anotados compartilhados entre os modelos.
+"""
+
+import sys
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import AfterValidator, PlainSerializer, StringConstraints
+
+
+# Datetime serializado como string ISO 8601 em JSON (substitui json_encoders)
+IsoDatetime = Annotated[
+    datetime,
+    PlainSerializer(lambda v: v.isoformat(), return_type=str, when_used="json")
+]
+
+# String obrigatoria: remove espacos nas bordas e rejeita vazio (validado no pydantic-core)
+NonEmptyStr = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+
+# String internada (sys.intern): valores repetidos compartilham um único objeto
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
@@ -3,31 +3,84 @@ Modelo de elementos visuais para representação no Miro.
 Usa formas simples e intuitivas (não BPMN complexo).
 """
 
-from typing import Dict, List, Literal, Optional, Tuple
-from pydantic import BaseModel, Field
-
-
-class Position(BaseModel):
+import functools
+from dataclasses import dataclass
+from typing import Any, Dict, List, Literal, Optional, Tuple
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+try:
+    import numpy as np
+except ImportError:  # numpy é opcional; get_bounds usa Python puro
+    np = None
+
+try:
+    import numba
+except ImportError:  # numba é opcional; usado só em diagramas grandes
+    numba = None
+
+# Acima deste número de elementos get_bounds usa o kernel Numba (se disponível)
+_NUMBA_MIN_ELEMENTS = 1000
+
+if numba is not None and np is not None:
+    @numba.njit(cache=True)
+    def _bounds_kernel(arr):
+        """Calcula (x_min, y_min, x_max, y_max) em uma única passada."""
+        x_min = arr[0, 0]
+        y_min = arr[0, 1]
+        x_max = arr[0, 2]
+        y_max = arr[0, 3]
+        for i in range(1, arr.shape[0]):
+            if arr[i, 0] < x_min:
+                x_min = arr[i, 0]
+            if arr[i, 1] < y_min:
+                y_min = arr[i, 1]
+            if arr[i, 2] > x_max:
+                x_max = arr[i, 2]
+            if arr[i, 3] > y_max:
+                y_max = arr[i, 3]
+        return x_min, y_min, x_max, y_max
+else:
+    _bounds_kernel = None
+
+
+@dataclass(frozen=True, slots=True)
+class Position:
     """Posição de um elemento visual (coordenadas x, y)."""
-    x: float = Field(..., description="Coordenada X (horizontal)")
-    y: float = Field(..., description="Coordenada Y (vertical)")
+    x: float  # Coordenada X (horizontal)
+    y: float  # Coordenada Y (vertical)
+
+    def to_dict(self) -> Dict[str, float]:
+        """Retorna a posição como dict (equivalente ao model_dump)."""
+        return {'x': self.x, 'y': self.y}
 
 
-class Size(BaseModel):
+@dataclass(frozen=True, slots=True)
+class Size:
     """Tamanho de um elemento visual."""
-    width: float = Field(..., description="Largura em pixels")
-    height: float = Field(..., description="Altura em pixels")
+    width: float  # Largura em pixels
+    height: float  # Altura em pixels
 
+    def to_dict(self) -> Dict[str, float]:
+        """Retorna o tamanho como dict (equivalente ao model_dump)."""
+        return {'width': self.width, 'height': self.height}
 
-class Color(BaseModel):
+
+@dataclass(frozen=True, slots=True)
+class Color:
     """Cor de um elemento visual."""
-    fill: str = Field(..., description="Cor de preenchimento (hex)")
-    border: str = Field(..., description="Cor da borda (hex)")
-    text: str = Field(default="#1a1a1a", description="Cor do texto (hex)")
+    fill: str  # Cor de preenchimento (hex)
+    border: str  # Cor da borda (hex)
+    text: str = "#1a1a1a"  # Cor do texto (hex)
+
+    def to_dict(self) -> Dict[str, str]:
+        """Retorna a cor como dict (equivalente ao model_dump)."""
+        return {'fill': self.fill, 'border': self.border, 'text': self.text}
 
 
 class VisualStyle(BaseModel):
     """Estilo visual de um elemento."""
+    model_config = ConfigDict(frozen=True)
+
     color: Color
     border_width: int = Field(default=2, description="Espessura da borda")
     font_size: int = Field(default=14, description="Tamanho da fonte")
@@ -40,6 +93,8 @@ class VisualElement(BaseModel):
     Elemento visual genérico.
     Representa uma forma no Miro (retângulo, círculo, diamante, sticky note).
     """
+    model_config = ConfigDict(extra='forbid')
+
     id: str = Field(..., description="ID único do elemento visual")
     element_id: str = Field(..., description="ID do ProcessElement original")
     type: Literal['rectangle', 'circle', 'diamond', 'sticky_note', 'text'] = Field(
@@ -53,27 +108,46 @@ class VisualElement(BaseModel):
     layer: int = Field(default=0, description="Camada (Z-index)")
     metadata: Dict = Field(default_factory=dict)
 
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> 'VisualElement':
+        """
+        Cria o elemento visual sem validação (model_construct).
+
+        Use apenas com dados emitidos por este mesmo modelo (model_dump /
+        model_dump_json); para entrada externa use o construtor normal.
+        """
+        style = data['style']
+        if isinstance(style, dict):
+            style = VisualStyle.model_construct(**{**style, 'color': Color(**style['color'])})
+        return cls.model_construct(**{
+            **data,
+            'position': Position(**data['position']),
+            'size': Size(**data['size']),
+            'style': style
+        })
+
     def get_center(self) -> Position:
         """Retorna o centro do elemento."""
+        position, size = self.position, self.size
         return Position(
-            x=self.position.x + self.size.width / 2,
-            y=self.position.y + self.size.height / 2
+            x=position.x + size.width / 2,
+            y=position.y + size.height / 2
         )
 
     def get_bounds(self) -> Tuple[float, float, float, float]:
         """Retorna os limites do elemento (x_min, y_min, x_max, y_max)."""
-        return (
-            self.position.x,
-            self.position.y,
-            self.position.x + self.size.width,
-            self.position.y + self.size.height
-        )
+        position, size = self.position, self.size
+        x: float = position.x
+        y: float = position.y
+        return (x, y, x + size.width, y + size.height)
 
 
 class Connector(BaseModel):
     """
     Conector visual entre elementos (seta).
     """
+    model_config = ConfigDict(extra='forbid')
+
     id: str = Field(..., description="ID único do conector")
     flow_id: Optional[str] = Field(None, description="ID do ProcessFlow original")
     from_element: str = Field(..., description="ID do elemento visual de origem")
@@ -90,6 +164,8 @@ class Swimlane(BaseModel):
     """
     Swimlane (raia) para agrupar elementos por responsável.
     """
+    model_config = ConfigDict(extra='forbid')
+
     id: str = Field(..., description="ID único da swimlane")
     actor: str = Field(..., description="Nome do responsável/ator")
     position: Position = Field(..., description="Posição da swimlane")
@@ -114,6 +190,8 @@ class VisualDiagram(BaseModel):
     Diagrama visual completo.
     Representa um processo como elementos visuais no Miro.
     """
+    model_config = ConfigDict(extra='forbid')
+
     name: str = Field(..., description="Nome do diagrama")
     description: str = Field(default="", description="Descrição do diagrama")
     elements: List[VisualElement] = Field(
@@ -134,19 +212,70 @@ class VisualDiagram(BaseModel):
     )
     metadata: Dict = Field(default_factory=dict)
 
+    # Índices construídos sob demanda (ver invalidate)
+    _element_index: Optional[Dict[str, VisualElement]] = PrivateAttr(default=None)
+    _swimlane_index: Optional[Dict[str, Swimlane]] = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in ('elements', 'swimlanes'):
+            self.invalidate()
+
+    def invalidate(self):
+        """
+        Descarta os índices de elementos e swimlanes.
+
+        Atribuir elements/swimlanes invalida automaticamente; chame este
+        método após alterar as listas in-place (prefira add_element).
+        """
+        self._element_index = None
+        self._swimlane_index = None
+
+    def add_element(self, element: VisualElement):
+        """Adiciona um elemento visual mantendo o índice por ID."""
+        self.elements.append(element)
+        if self._element_index is not None:
+            self._element_index.setdefault(element.id, element)
+
+    def _elements_by_id(self) -> Dict[str, VisualElement]:
+        """Retorna (construindo se preciso) o índice de elementos por ID."""
+        if self._element_index is None:
+            index: Dict[str, VisualElement] = {}
+            for element in self.elements:
+                index.setdefault(element.id, element)
+            self._element_index = index
+        return self._element_index
+
     def get_element(self, element_id: str) -> Optional[VisualElement]:
         """Busca um elemento visual pelo ID."""
-        for element in self.elements:
-            if element.id == element_id:
-                return element
-        return None
+        return self._elements_by_id().get(element_id)
+
+    def resolve_connectors(self) -> List[Tuple[VisualElement, VisualElement, Connector]]:
+        """
+        Resolve os elementos de origem e destino de todos os conectores.
+
+        Conectores cujas extremidades não existem no diagrama são ignorados.
+
+        Returns:
+            Lista de tuplas (origem, destino, conector)
+        """
+        index = self._elements_by_id()
+        resolved = []
+        for connector in self.connectors:
+            source = index.get(connector.from_element)
+            target = index.get(connector.to_element)
+            if source is not None and target is not None:
+                resolved.append((source, target, connector))
+        return resolved
 
     def get_swimlane_for_actor(self, actor: str) -> Optional[Swimlane]:
         """Busca swimlane de um ator."""
-        for lane in self.swimlanes:
-            if lane.actor == actor:
-                return lane
-        return None
+        if self._swimlane_index is None:
+            index: Dict[str, Swimlane] = {}
+            for lane in self.swimlanes:
+                index.setdefault(lane.actor, lane)
+            self._swimlane_index = index
+        return self._swimlane_index.get(actor)
 
     def get_bounds(self) -> Tuple[float, float, float, float]:
         """
@@ -156,83 +285,59 @@ class VisualDiagram(BaseModel):
         if not self.elements:
             return (0, 0, 0, 0)
 
-        x_min = min(e.position.x for e in self.elements)
-        y_min = min(e.position.y for e in self.elements)
-        x_max = max(e.position.x + e.size.width for e in self.elements)
-        y_max = max(e.position.y + e.size.height for e in self.elements)
-
-        return (x_min, y_min, x_max, y_max)
-
-
-# Estilos visuais pré-definidos para cada tipo de elemento
-VISUAL_STYLES = {
-    'task': VisualStyle(
-        color=Color(
-            fill="#E3F2FD",      # Azul claro
-            border="#1976D2",    # Azul escuro
-            text="#1a1a1a"
-        ),
-        border_width=2,
-        font_size=14,
-        font_weight='normal'
-    ),
-    'gateway': VisualStyle(
-        color=Color(
-            fill="#FFF9C4",      # Amarelo claro
-            border="#F57F17",    # Amarelo escuro
-            text="#1a1a1a"
-        ),
-        border_width=2,
-        font_size=13,
-        font_weight='bold'
-    ),
-    'event_start': VisualStyle(
-        color=Color(
-            fill="#C8E6C9",      # Verde claro
-            border="#388E3C",    # Verde escuro
-            text="#1a1a1a"
-        ),
-        border_width=3,
-        font_size=13,
-        font_weight='bold'
-    ),
-    'event_end': VisualStyle(
-        color=Color(
-            fill="#FFCDD2",      # Vermelho claro
-            border="#D32F2F",    # Vermelho escuro
-            text="#1a1a1a"
-        ),
-        border_width=4,
-        font_size=13,
-        font_weight='bold'
-    ),
-    'annotation': VisualStyle(
-        color=Color(
-            fill="#FFF9C4",      # Amarelo (sticky note)
-            border="#FFD54F",    # Amarelo claro
-            text="#1a1a1a"
-        ),
-        border_width=0,
-        font_size=12,
-        font_weight='normal'
-    ),
-    'swimlane': Color(
-        fill="#F5F5F5",          # Cinza muito claro
-        border="#BDBDBD",        # Cinza médio
-        text="#424242"           # Cinza escuro
-    )
+        # Uma única passada pelos elementos; as reduções rodam em C
+        bounds = [e.get_bounds() for e in self.elements]
+        if np is not None:
+            arr = np.array(bounds, dtype=float)
+            if _bounds_kernel is not None and len(bounds) > _NUMBA_MIN_ELEMENTS:
+                x_min, y_min, x_max, y_max = _bounds_kernel(arr)
+                return (float(x_min), float(y_min), float(x_max), float(y_max))
+            mins = arr[:, :2].min(axis=0)
+            maxs = arr[:, 2:].max(axis=0)
+            return (float(mins[0]), float(mins[1]), float(maxs[0]), float(maxs[1]))
+
+        x_mins, y_mins, x_maxs, y_maxs = zip(*bounds)
+        return (min(x_mins), min(y_mins), max(x_maxs), max(y_maxs))
+
+
+# Especificações dos estilos pré-definidos, instanciados sob demanda:
+# (fill, border, text, border_width, font_size, font_weight)
+_STYLE_SPECS: Dict[str, Tuple[str, str, str, int, int, str]] = {
+    'task': ("#E3F2FD", "#1976D2", "#1a1a1a", 2, 14, 'normal'),         # Azul
+    'gateway': ("#FFF9C4", "#F57F17", "#1a1a1a", 2, 13, 'bold'),        # Amarelo
+    'event_start': ("#C8E6C9", "#388E3C", "#1a1a1a", 3, 13, 'bold'),    # Verde
+    'event_end': ("#FFCDD2", "#D32F2F", "#1a1a1a", 4, 13, 'bold'),      # Vermelho
+    'annotation': ("#FFF9C4", "#FFD54F", "#1a1a1a", 0, 12, 'normal'),   # Sticky note
 }
 
-# Tamanhos padrão para cada tipo de elemento
-ELEMENT_SIZES = {
-    'task': Size(width=160, height=80),
-    'gateway': Size(width=80, height=80),
-    'event_start': Size(width=50, height=50),
-    'event_end': Size(width=50, height=50),
-    'annotation': Size(width=200, height=100)
+# Cores das swimlanes (fill, border, text): cinzas claro, médio e escuro
+_SWIMLANE_COLOR_SPEC = ("#F5F5F5", "#BDBDBD", "#424242")
+
+# Tamanhos padrão (width, height) para cada tipo de elemento
+_SIZE_SPECS: Dict[str, Tuple[float, float]] = {
+    'task': (160, 80),
+    'gateway': (80, 80),
+    'event_start': (50, 50),
+    'event_end': (50, 50),
+    'annotation': (200, 100)
 }
 
 
+@functools.cache
+def _build_style(style_key: str) -> VisualStyle:
+    """Instancia (uma única vez) um estilo pré-definido ou o estilo padrão."""
+    fill, border, text, border_width, font_size, font_weight = _STYLE_SPECS.get(
+        style_key, ("#FFFFFF", "#000000", "#1a1a1a", 2, 14, 'normal')
+    )
+    return VisualStyle(
+        color=Color(fill=fill, border=border, text=text),
+        border_width=border_width,
+        font_size=font_size,
+        font_weight=font_weight
+    )
+
+
+@functools.cache
 def get_visual_style(element_type: str, event_type: Optional[str] = None) -> VisualStyle:
     """
     Retorna o estilo visual para um tipo de elemento.
@@ -242,24 +347,25 @@ def get_visual_style(element_type: str, event_type: Optional[str] = None) -> Vis
         event_type: Subtipo do evento (start, end) se aplicável
 
     Returns:
-        VisualStyle apropriado
+        VisualStyle apropriado (imutável e compartilhado)
     """
     if element_type == 'event' and event_type:
         style_key = f'event_{event_type}'
-        if style_key in VISUAL_STYLES:
-            return VISUAL_STYLES[style_key].model_copy()
+        if style_key in _STYLE_SPECS:
+            return _build_style(style_key)
 
-    if element_type in VISUAL_STYLES:
-        return VISUAL_STYLES[element_type].model_copy()
+    # Tipos sem estilo pré-definido usam o estilo padrão
+    return _build_style(element_type)
 
-    # Fallback: estilo padrão
-    return VisualStyle(
-        color=Color(fill="#FFFFFF", border="#000000", text="#1a1a1a"),
-        border_width=2,
-        font_size=14
-    )
 
+@functools.cache
+def get_swimlane_color() -> Color:
+    """Retorna as cores padrão das swimlanes (imutável e compartilhado)."""
+    fill, border, text = _SWIMLANE_COLOR_SPEC
+    return Color(fill=fill, border=border, text=text)
 
+
+@functools.cache
 def get_element_size(element_type: str) -> Size:
     """
     Retorna o tamanho padrão para um tipo de elemento.
@@ -268,10 +374,8 @@ def get_element_size(element_type: str) -> Size:
         element_type: Tipo do elemento
 
     Returns:
-        Size apropriado
+        Size apropriado (imutável e compartilhado)
     """
-    if element_type in ELEMENT_SIZES:
-        return ELEMENT_SIZES[element_type].model_copy()
-
     # Fallback: tamanho padrão
-    return Size(width=120, height=60)
+    width, height = _SIZE_SPECS.get(element_type, (120, 60))
+    return Size(width=width, height=height)
@@ -3,17 +3,27 @@ Extrator usando Claude Code (modo interativo).
 Elimina necessidade de API key do Anthropic.
 """
 
-import json
+import os
+import shutil
+import subprocess
 import time
 from pathlib import Path
 from typing import Dict, Optional
 
+import pydantic
+
 from src.models.process_model import Process, ProcessExtractionResult
+from src.parsers.prompts import build_prompt, extract_json_object
 from src.utils.exceptions import LLMExtractionError
 from src.utils.logger import get_logger
 from rich.console import Console
 from rich.panel import Panel
 
+try:
+    from watchfiles import watch
+except ImportError:  # watchfiles é opcional; sem ele usamos polling
+    watch = None
+
 logger = get_logger()
 console = Console()
 
@@ -24,6 +34,9 @@ class ClaudeCodeExtractor:
     Permite usar Claude.ai ou este ambiente ao invés da API paga.
     """
 
+    MAX_WAIT = 600  # 10 minutos
+    PROGRESS_INTERVAL = 30  # segundos entre mensagens de progresso
+
     def __init__(self):
         self.prompt_file = Path("data/intermediate/extraction_prompt.txt")
         self.response_file = Path("data/intermediate/extraction_response.json")
@@ -56,8 +69,7 @@ class ClaudeCodeExtractor:
         logger.info("Starting interactive extraction with Claude Code...")
 
         # 1. Preparar prompt (usar template existente)
-        from src.parsers.llm_extractor import EXTRACTION_PROMPT_TEMPLATE
-        prompt = EXTRACTION_PROMPT_TEMPLATE.format(markdown_content=markdown_content)
+        prompt = build_prompt(markdown_content)
 
         # 2. Salvar prompt
         self.prompt_file.parent.mkdir(parents=True, exist_ok=True)
@@ -69,17 +81,20 @@ class ClaudeCodeExtractor:
             self.response_file.unlink()
             logger.debug("Cleaned previous response file")
 
-        # 4. Exibir instruções
-        self._show_instructions()
-
-        # 5. Aguardar resposta
-        self._wait_for_response()
+        # 4-5. Com AUTO_CLAUDE_CLI e o Claude CLI instalado, gera a resposta
+        # direto; senão exibe instruções e aguarda o usuário
+        claude_bin = shutil.which("claude") if os.environ.get("AUTO_CLAUDE_CLI") else None
+        if claude_bin:
+            self._run_claude_cli(claude_bin)
+        else:
+            self._show_instructions()
+            self._wait_for_response()
 
         # 6. Ler e validar
         process = self._parse_response()
 
         # 7. Retornar resultado
-        result = ProcessExtractionResult(
+        result = ProcessExtractionResult.model_construct(
             process=process,
             source_file=metadata.get('file_path') if metadata else None,
             llm_model="claude-code-interactive",
@@ -89,6 +104,41 @@ class ClaudeCodeExtractor:
         logger.info(f"Interactive extraction completed: {process.name}")
         return result
 
+    def _run_claude_cli(self, claude_bin: str):
+        """
+        Gera a resposta chamando o Claude CLI em modo não interativo.
+
+        Args:
+            claude_bin: Caminho do executável claude
+
+        Raises:
+            LLMExtractionError: Se o CLI falhar ou exceder MAX_WAIT
+        """
+        console.print(f"\n[yellow]⏳ Gerando resposta com Claude CLI ({claude_bin})...[/yellow]")
+        logger.info(f"Running Claude CLI: {claude_bin}")
+
+        try:
+            with open(self.prompt_file, 'rb') as stdin, open(self.response_file, 'wb') as stdout:
+                subprocess.run(
+                    [claude_bin, "-p"],
+                    stdin=stdin,
+                    stdout=stdout,
+                    stderr=subprocess.PIPE,
+                    check=True,
+                    timeout=self.MAX_WAIT
+                )
+        except subprocess.TimeoutExpired:
+            raise LLMExtractionError(
+                f"Timeout: Claude CLI não respondeu após {self.MAX_WAIT}s"
+            )
+        except subprocess.CalledProcessError as e:
+            stderr = e.stderr.decode('utf-8', errors='replace').strip() if e.stderr else ''
+            raise LLMExtractionError(
+                f"Claude CLI falhou (código {e.returncode}): {stderr[:500]}"
+            )
+
+        console.print("[green]✓ Resposta gerada![/green]\n")
+
     def _show_instructions(self):
         """Exibe instruções formatadas para o usuário."""
         instructions = f"""
@@ -110,6 +160,7 @@ O prompt foi preparado e salvo em:
 
 [bold]OPÇÃO 3 - Linha de comando (se tiver Claude CLI):[/bold]
 [green]cat {self.prompt_file} | claude > {self.response_file}[/green]
+[dim](ou defina AUTO_CLAUDE_CLI=1 para executar automaticamente)[/dim]
 
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
@@ -128,21 +179,10 @@ Depois de obter a resposta JSON, salve-a em:
         console.print("   [dim](Pressione Ctrl+C para cancelar)[/dim]\n")
 
         try:
-            max_wait = 600  # 10 minutos
-            elapsed = 0
-            check_interval = 2  # segundos
-
-            while not self.response_file.exists():
-                time.sleep(check_interval)
-                elapsed += check_interval
-
-                if elapsed % 30 == 0:  # A cada 30 segundos
-                    console.print(f"   [dim]Aguardando há {elapsed}s...[/dim]")
-
-                if elapsed >= max_wait:
-                    raise LLMExtractionError(
-                        f"Timeout: resposta não recebida após {max_wait}s"
-                    )
+            if watch is not None:
+                self._watch_for_response()
+            else:
+                self._poll_for_response()
 
             console.print("[green]✓ Resposta recebida![/green]\n")
             logger.info("Response file detected")
@@ -152,6 +192,52 @@ Depois de obter a resposta JSON, salve-a em:
             logger.warning("Extraction cancelled by user")
             raise LLMExtractionError("Extraction cancelled by user")
 
+    def _watch_for_response(self):
+        """
+        Aguarda o arquivo de resposta via notificações do sistema de arquivos
+        (inotify/FSEvents, através do watchfiles).
+        """
+        if self.response_file.exists():
+            return
+
+        self.response_file.parent.mkdir(parents=True, exist_ok=True)
+        start = time.monotonic()
+
+        # rust_timeout + yield_on_timeout: acorda a cada 30s sem mudanças
+        # para exibir o progresso e checar o timeout
+        for changes in watch(
+            self.response_file.parent,
+            rust_timeout=self.PROGRESS_INTERVAL * 1000,
+            yield_on_timeout=True
+        ):
+            if self.response_file.exists():
+                return
+
+            elapsed = int(time.monotonic() - start)
+            if elapsed >= self.MAX_WAIT:
+                raise LLMExtractionError(
+                    f"Timeout: resposta não recebida após {self.MAX_WAIT}s"
+                )
+            if not changes:
+                console.print(f"   [dim]Aguardando há {elapsed}s...[/dim]")
+
+    def _poll_for_response(self):
+        """Aguarda o arquivo de resposta verificando periodicamente."""
+        elapsed = 0
+        check_interval = 2  # segundos
+
+        while not self.response_file.exists():
+            time.sleep(check_interval)
+            elapsed += check_interval
+
+            if elapsed % self.PROGRESS_INTERVAL == 0:
+                console.print(f"   [dim]Aguardando há {elapsed}s...[/dim]")
+
+            if elapsed >= self.MAX_WAIT:
+                raise LLMExtractionError(
+                    f"Timeout: resposta não recebida após {self.MAX_WAIT}s"
+                )
+
     def _parse_response(self) -> Process:
         """Lê e valida resposta JSON."""
         logger.info(f"Parsing response from {self.response_file}")
@@ -163,23 +249,24 @@ Depois de obter a resposta JSON, salve-a em:
             if not response_text:
                 raise LLMExtractionError("Response file is empty")
 
-            # Parse JSON
-            try:
-                process_data = json.loads(response_text)
-            except json.JSONDecodeError as e:
-                logger.error(f"Invalid JSON: {e}")
-                logger.error(f"Response preview: {response_text[:200]}...")
-                raise LLMExtractionError(
-                    f"Resposta não é JSON válido: {e}\n"
-                    f"Verifique se copiou apenas o JSON, sem texto adicional."
-                )
+            # Remover cercas de markdown / texto ao redor do JSON
+            json_text = extract_json_object(response_text)
+            trimmed = len(response_text) - len(json_text)
+            if trimmed:
+                logger.warning(f"Trimmed {trimmed} chars around the JSON response")
 
-            # Criar modelo Process
+            # Parse JSON + criar modelo Process em uma única etapa (pydantic-core)
             try:
-                process = Process(**process_data)
-            except Exception as e:
+                process = Process.model_validate_json(json_text)
+            except pydantic.ValidationError as e:
+                logger.error(f"Response preview: {response_text[:200]}...")
+                if any(err['type'] == 'json_invalid' for err in e.errors()):
+                    logger.error(f"Invalid JSON: {e}")
+                    raise LLMExtractionError(
+                        f"Resposta não é JSON válido: {e}\n"
+                        f"Verifique se copiou apenas o JSON, sem texto adicional."
+                    )
                 logger.error(f"Failed to create Process model: {e}")
-                logger.error(f"Data: {process_data}")
                 raise LLMExtractionError(
                     f"Erro ao criar modelo de processo: {e}\n"
                     f"Verifique se a estrutura JSON está correta."
@@ -3,148 +3,48 @@ Extrator de processos usando LLM (Claude API).
 Converte transcrições em markdown para modelos estruturados de processo.
 """
 
-import json
-from typing import Dict, Optional
+import asyncio
+import hashlib
+import os
+import random
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
 
-import anthropic
-from anthropic import Anthropic
+import pydantic
 
 from config.settings import get_settings
 from src.models.process_model import Process, ProcessExtractionResult
+from src.parsers.prompts import (  # noqa: F401 (EXTRACTION_PROMPT_TEMPLATE reexportado)
+    EXTRACTION_PROMPT_TEMPLATE,
+    build_prompt,
+    extract_json_object,
+)
 from src.utils.exceptions import LLMExtractionError
 from src.utils.logger import get_logger
 
 logger = get_logger()
 
 
-# Prompt principal para extração de processos
-EXTRACTION_PROMPT_TEMPLATE = """Você é um especialista em análise de processos de negócio. Sua tarefa é analisar uma transcrição de processo e extrair elementos estruturados.
-
-IMPORTANTE: Esta empresa tem baixa maturidade em modelagem de processos, então use elementos SIMPLES e intuitivos:
-- Tarefas: atividades que alguém executa
-- Decisões: pontos onde há escolha entre caminhos
-- Eventos: início e fim do processo
-- Notas: observações importantes sobre o processo
-
-TRANSCRIÇÃO:
-{markdown_content}
-
-Extraia os elementos do processo no formato JSON seguindo EXATAMENTE esta estrutura:
-
-{{
-  "process_name": "Nome claro e descritivo do processo",
-  "description": "Breve descrição do que o processo faz",
-  "actors": ["Lista", "de", "responsáveis/atores"],
-  "elements": [
-    {{
-      "id": "identificador_unico",
-      "type": "task",
-      "name": "Nome da tarefa",
-      "description": "Descrição detalhada (opcional)",
-      "actor": "Nome do responsável",
-      "metadata": {{}}
-    }},
-    {{
-      "id": "gateway_1",
-      "type": "gateway",
-      "name": "Pergunta ou decisão a ser tomada",
-      "description": "Contexto da decisão",
-      "actor": "Quem decide",
-      "metadata": {{
-        "gateway_type": "exclusive",
-        "conditions": ["Opção 1", "Opção 2", "Opção 3"]
-      }}
-    }},
-    {{
-      "id": "event_start",
-      "type": "event",
-      "name": "Descrição do que inicia o processo",
-      "description": null,
-      "actor": null,
-      "metadata": {{
-        "event_type": "start"
-      }}
-    }},
-    {{
-      "id": "event_end",
-      "type": "event",
-      "name": "Descrição do que finaliza o processo",
-      "description": null,
-      "actor": null,
-      "metadata": {{
-        "event_type": "end"
-      }}
-    }},
-    {{
-      "id": "annotation_1",
-      "type": "annotation",
-      "name": "Nota ou observação importante",
-      "description": "Detalhes da nota",
-      "actor": null,
-      "metadata": {{
-        "attached_to": "id_do_elemento_relacionado"
-      }}
-    }}
-  ],
-  "flows": [
-    {{
-      "from_element": "event_start",
-      "to_element": "task_1",
-      "condition": null
-    }},
-    {{
-      "from_element": "gateway_1",
-      "to_element": "task_2",
-      "condition": "Se aprovado"
-    }},
-    {{
-      "from_element": "task_3",
-      "to_element": "event_end",
-      "condition": null
-    }}
-  ]
-}}
-
-REGRAS IMPORTANTES:
-
-1. **Tipos de elementos:**
-   - "task": atividades executadas por alguém
-   - "gateway": pontos de decisão (sempre com tipo "exclusive" para simplicidade)
-   - "event": início ou fim do processo (event_type: "start" ou "end")
-   - "annotation": notas, observações, lembretes
-
-2. **IDs únicos:**
-   - Use formato: task_1, task_2, gateway_1, event_start, event_end, annotation_1
-   - IDs devem ser únicos e descritivos
-
-3. **Atores (responsáveis):**
-   - Identifique claramente quem faz cada tarefa
-   - Use nomes de cargos ou departamentos
-   - Eventos e anotações não têm ator (usar null)
-
-4. **Decisões (gateways):**
-   - Sempre use "exclusive" para gateway_type
-   - Liste todas as opções possíveis em "conditions"
-   - Cada opção deve ter um flow correspondente
-
-5. **Fluxos (flows):**
-   - Conecte elementos na ordem correta
-   - Todo processo deve ter: event_start → tarefas → event_end
-   - Gateways devem ter múltiplos flows de saída (um para cada condição)
-   - Flows de gateways DEVEM ter "condition" preenchida
-
-6. **Completude:**
-   - Todo processo deve ter pelo menos 1 evento de início
-   - Todo processo deve ter pelo menos 1 evento de fim
-   - Todos os elementos devem estar conectados (alcançáveis do início)
-
-7. **Simplicidade:**
-   - Evite complexidade desnecessária
-   - Use linguagem clara e direta
-   - Foque no fluxo principal
-
-Retorne APENAS o JSON válido, sem markdown, sem comentários, sem explicações adicionais.
-"""
+# Na API, as instruções (idênticas em toda chamada) vão no system prompt com
+# cache_control, e a mensagem do usuário carrega apenas a transcrição
+_SYSTEM_PROMPT_BLOCKS = [
+    {
+        "type": "text",
+        "text": build_prompt("[a transcrição é enviada na mensagem do usuário]"),
+        "cache_control": {"type": "ephemeral"},
+    }
+]
+
+# Semente da chave do cache em disco: respostas só são reaproveitadas se as
+# instruções enviadas forem as mesmas
+_CACHE_KEY_SEED = hashlib.sha256(_SYSTEM_PROMPT_BLOCKS[0]["text"].encode('utf-8'))
+
+# Instrução anexada ao reenviar uma transcrição cuja resposta não era JSON
+_JSON_RETRY_HINT = (
+    "IMPORTANTE: a resposta anterior não era um JSON válido. "
+    "Retorne APENAS o objeto JSON, começando com { e sem nenhum texto adicional."
+)
 
 
 class LLMExtractor:
@@ -152,6 +52,8 @@ class LLMExtractor:
     Extrator de processos usando Claude API.
     """
 
+    RETRY_BASE_DELAY = 1.0  # segundos; dobra a cada tentativa (+ jitter de até 1s)
+
     def __init__(self, api_key: Optional[str] = None, model: Optional[str] = None):
         """
         Inicializa o extrator.
@@ -167,15 +69,202 @@ class LLMExtractor:
         self.max_tokens = settings.LLM_MAX_TOKENS
         self.temperature = settings.LLM_TEMPERATURE
 
-        # Inicializar cliente Anthropic
+        # Inicializar cliente Anthropic (import tardio: o SDK é pesado e só
+        # o fluxo via API precisa dele)
+        from anthropic import Anthropic
         self.client = Anthropic(api_key=self.api_key)
+        self._async_client = None  # criado sob demanda em extract_many
+
+        # Cache em disco de extrações: sha256(prompt, modelo, transcrição) -> Process JSON
+        self.cache_dir = settings.get_intermediate_path() / "llm_cache"
 
         logger.info(f"LLM Extractor initialized with model: {self.model}")
 
-    def extract(
+    def _request_params(
         self,
         markdown_content: str,
+        retry_hint: Optional[str] = None
+    ) -> Dict:
+        """
+        Monta os parâmetros de messages.create para uma transcrição.
+
+        Args:
+            markdown_content: Conteúdo markdown pré-processado
+            retry_hint: Instrução extra anexada à mensagem do usuário
+
+        Returns:
+            Dict de parâmetros da chamada
+        """
+        content = f"TRANSCRIÇÃO:\n{markdown_content}"
+        if retry_hint:
+            content = f"{content}\n\n{retry_hint}"
+        return {
+            "model": self.model,
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+            "system": _SYSTEM_PROMPT_BLOCKS,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": content
+                }
+            ],
+        }
+
+    def _build_result(
+        self,
+        message,
+        metadata: Optional[Dict] = None
+    ) -> ProcessExtractionResult:
+        """
+        Converte a resposta da API em ProcessExtractionResult.
+
+        Args:
+            message: Resposta de messages.create
+            metadata: Metadados opcionais sobre a transcrição
+
+        Returns:
+            ProcessExtractionResult com processo extraído
+
+        Raises:
+            LLMExtractionError: Se a resposta não for um processo válido
+        """
+        # Extrair resposta
+        response_text = message.content[0].text
+        logger.debug(
+            f"Received response ({len(response_text)} chars, "
+            f"cache read: {getattr(message.usage, 'cache_read_input_tokens', None)} tokens)"
+        )
+
+        # Remover cercas de markdown / texto ao redor do JSON
+        json_text = extract_json_object(response_text)
+        trimmed = len(response_text.strip()) - len(json_text)
+        if trimmed:
+            logger.warning(f"Trimmed {trimmed} chars around the JSON response")
+
+        # Parse JSON + criar modelo Process em uma única etapa (pydantic-core)
+        try:
+            process = Process.model_validate_json(json_text)
+        except pydantic.ValidationError as e:
+            if any(err['type'] == 'json_invalid' for err in e.errors()):
+                logger.error(f"Failed to parse JSON response: {e}")
+                error_message = f"Invalid JSON response from LLM: {e}"
+            else:
+                logger.error(f"Failed to create Process model: {e}")
+                error_message = f"Invalid process data structure: {e}"
+            logger.error(f"Response: {response_text[:500]}...")
+            raise LLMExtractionError(
+                error_message,
+                raw_response=response_text,
+                model=self.model
+            ) from e
+
+        # Criar resultado
+        result = ProcessExtractionResult.model_construct(
+            process=process,
+            source_file=metadata.get('file_path') if metadata else None,
+            llm_model=self.model,
+            warnings=[]
+        )
+
+        logger.info(f"Successfully extracted process: {process.name}")
+        logger.info(f"  - {len(process.elements)} elements")
+        logger.info(f"  - {len(process.flows)} flows")
+        logger.info(f"  - {len(process.actors)} actors")
+
+        return result
+
+    def _cache_path(self, markdown_content: str) -> Path:
+        """
+        Caminho do cache em disco para uma transcrição.
+
+        Args:
+            markdown_content: Conteúdo markdown pré-processado
+
+        Returns:
+            Path do arquivo <sha256>.json
+        """
+        key = _CACHE_KEY_SEED.copy()
+        key.update(self.model.encode('utf-8'))
+        key.update(b'\0')
+        key.update(markdown_content.encode('utf-8'))
+        return self.cache_dir / f"{key.hexdigest()}.json"
+
+    def _load_cached(
+        self,
+        cache_path: Path,
         metadata: Optional[Dict] = None
+    ) -> Optional[ProcessExtractionResult]:
+        """
+        Carrega uma extração anterior do cache em disco.
+
+        Args:
+            cache_path: Caminho retornado por _cache_path
+            metadata: Metadados opcionais sobre a transcrição
+
+        Returns:
+            ProcessExtractionResult (llm_model com sufixo "(cached)") ou None
+            se não houver cache válido
+        """
+        try:
+            process = Process.model_validate_json(cache_path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, pydantic.ValidationError) as e:
+            logger.warning(f"Ignoring invalid extraction cache {cache_path.name}: {e}")
+            return None
+
+        logger.info(f"Using cached extraction: {process.name} ({cache_path.name})")
+        # Sufixo "(cached)" distingue uma extração reaproveitada de uma chamada real à API
+        return ProcessExtractionResult.model_construct(
+            process=process,
+            source_file=metadata.get('file_path') if metadata else None,
+            llm_model=f"{self.model}(cached)",
+            warnings=[]
+        )
+
+    def _store_cached(self, cache_path: Path, result: ProcessExtractionResult) -> None:
+        """
+        Grava uma extração no cache em disco (escrita atômica).
+
+        Args:
+            cache_path: Caminho retornado por _cache_path
+            result: Resultado da extração
+        """
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix('.tmp')
+            tmp_path.write_text(result.process.model_dump_json(), encoding='utf-8')
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Failed to write extraction cache: {e}")
+
+    def _wrap_error(self, error: Exception) -> LLMExtractionError:
+        """
+        Converte erros da chamada/parse em LLMExtractionError.
+
+        Args:
+            error: Exceção capturada
+
+        Returns:
+            LLMExtractionError correspondente
+        """
+        from anthropic import APIError
+
+        if isinstance(error, LLMExtractionError):
+            return error
+        if isinstance(error, APIError):
+            logger.error(f"Anthropic API error: {error}")
+            return LLMExtractionError(f"API error: {error}", model=self.model)
+        logger.error(f"Unexpected error during extraction: {error}")
+        return LLMExtractionError(f"Extraction failed: {error}", model=self.model)
+
+    def extract(
+        self,
+        markdown_content: str,
+        metadata: Optional[Dict] = None,
+        cache: bool = True,
+        retry_hint: Optional[str] = None
     ) -> ProcessExtractionResult:
         """
         Extrai processo de uma transcrição markdown.
@@ -183,6 +272,8 @@ class LLMExtractor:
         Args:
             markdown_content: Conteúdo markdown pré-processado
             metadata: Metadados opcionais sobre a transcrição
+            cache: Reaproveitar/gravar a extração no cache em disco
+            retry_hint: Instrução extra anexada à mensagem (usada em retries)
 
         Returns:
             ProcessExtractionResult com processo extraído
@@ -192,83 +283,75 @@ class LLMExtractor:
         """
         logger.info("Starting LLM extraction...")
 
-        # Criar prompt com conteúdo
-        prompt = EXTRACTION_PROMPT_TEMPLATE.format(
-            markdown_content=markdown_content
-        )
+        if cache:
+            cache_path = self._cache_path(markdown_content)
+            cached = self._load_cached(cache_path, metadata)
+            if cached is not None:
+                return cached
 
         try:
-            # Chamar Claude API
+            # Chamar Claude API em streaming
             logger.debug(f"Calling Claude API (model={self.model})...")
-            message = self.client.messages.create(
-                model=self.model,
-                max_tokens=self.max_tokens,
-                temperature=self.temperature,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ]
-            )
-
-            # Extrair resposta
-            response_text = message.content[0].text
-            logger.debug(f"Received response ({len(response_text)} chars)")
-
-            # Parse JSON
-            try:
-                process_data = json.loads(response_text)
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse JSON response: {e}")
-                logger.error(f"Response: {response_text[:500]}...")
-                raise LLMExtractionError(
-                    f"Invalid JSON response from LLM: {e}",
-                    raw_response=response_text,
-                    model=self.model
-                )
-
-            # Criar modelo Process
+            with self.client.messages.stream(
+                **self._request_params(markdown_content, retry_hint)
+            ) as stream:
+                message = stream.get_final_message()
+            result = self._build_result(message, metadata)
+        except LLMExtractionError:
+            raise
+        except Exception as e:
+            raise self._wrap_error(e) from e
+
+        if cache:
+            self._store_cached(cache_path, result)
+        return result
+
+    async def extract_many(
+        self,
+        items: List[Tuple[str, Optional[Dict]]],
+        max_concurrency: int = 10
+    ) -> List[Union[ProcessExtractionResult, LLMExtractionError]]:
+        """
+        Extrai vários processos em paralelo (AsyncAnthropic).
+
+        As chamadas rodam concorrentemente, limitadas por um semáforo para
+        respeitar o rate limit. Uma falha não interrompe as demais.
+        Transcrições já extraídas são lidas do cache em disco.
+
+        Args:
+            items: Lista de (markdown_content, metadata)
+            max_concurrency: Máximo de chamadas simultâneas à API
+
+        Returns:
+            Lista na mesma ordem de items, com ProcessExtractionResult ou o
+            LLMExtractionError da transcrição que falhou
+        """
+        if self._async_client is None:
+            from anthropic import AsyncAnthropic
+            self._async_client = AsyncAnthropic(api_key=self.api_key)
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def extract_one(markdown_content: str, metadata: Optional[Dict]):
+            cache_path = self._cache_path(markdown_content)
+            cached = self._load_cached(cache_path, metadata)
+            if cached is not None:
+                return cached
             try:
-                process = Process(**process_data)
+                async with semaphore:
+                    message = await self._async_client.messages.create(
+                        **self._request_params(markdown_content)
+                    )
+                result = self._build_result(message, metadata)
             except Exception as e:
-                logger.error(f"Failed to create Process model: {e}")
-                logger.error(f"Data: {process_data}")
-                raise LLMExtractionError(
-                    f"Invalid process data structure: {e}",
-                    raw_response=response_text,
-                    model=self.model
-                )
-
-            # Criar resultado
-            result = ProcessExtractionResult(
-                process=process,
-                source_file=metadata.get('file_path') if metadata else None,
-                llm_model=self.model,
-                warnings=[]
-            )
-
-            logger.info(f"Successfully extracted process: {process.name}")
-            logger.info(f"  - {len(process.elements)} elements")
-            logger.info(f"  - {len(process.flows)} flows")
-            logger.info(f"  - {len(process.actors)} actors")
-
+                return self._wrap_error(e)
+            self._store_cached(cache_path, result)
             return result
 
-        except anthropic.APIError as e:
-            logger.error(f"Anthropic API error: {e}")
-            raise LLMExtractionError(
-                f"API error: {e}",
-                model=self.model
-            )
-        except Exception as e:
-            if isinstance(e, LLMExtractionError):
-                raise
-            logger.error(f"Unexpected error during extraction: {e}")
-            raise LLMExtractionError(
-                f"Extraction failed: {e}",
-                model=self.model
-            )
+        logger.info(f"Starting LLM extraction of {len(items)} transcripts...")
+        return await asyncio.gather(
+            *(extract_one(markdown_content, metadata) for markdown_content, metadata in items)
+        )
 
     def extract_with_retry(
         self,
@@ -279,6 +362,11 @@ class LLMExtractor:
         """
         Extrai processo com retry automático em caso de falha.
 
+        Erros transitórios da API (rate limit, conexão, 5xx) são repetidos
+        com backoff exponencial; uma resposta que não é JSON é repetida uma
+        vez, com instrução reforçando o formato; os demais erros (schema
+        inválido, autenticação...) não são repetidos.
+
         Args:
             markdown_content: Conteúdo markdown
             metadata: Metadados opcionais
@@ -288,24 +376,75 @@ class LLMExtractor:
             ProcessExtractionResult
 
         Raises:
-            LLMExtractionError: Se todas as tentativas falharem
+            LLMExtractionError: Se todas as tentativas falharem ou o erro
+                não for recuperável
         """
         last_error = None
+        retry_hint = None
 
         for attempt in range(1, max_retries + 1):
             try:
                 logger.info(f"Extraction attempt {attempt}/{max_retries}")
-                return self.extract(markdown_content, metadata)
+                return self.extract(markdown_content, metadata, retry_hint=retry_hint)
             except LLMExtractionError as e:
                 last_error = e
-                if attempt < max_retries:
-                    logger.warning(f"Attempt {attempt} failed, retrying...")
-                else:
+                if attempt == max_retries:
                     logger.error(f"All {max_retries} attempts failed")
+                    break
+
+                if self._is_transient(e):
+                    # Rate limit / indisponibilidade: backoff exponencial com jitter
+                    delay = self.RETRY_BASE_DELAY * 2 ** (attempt - 1) + random.random()
+                    logger.warning(f"Attempt {attempt} failed ({e}), retrying in {delay:.1f}s...")
+                    time.sleep(delay)
+                elif self._is_json_syntax_error(e) and retry_hint is None:
+                    # Resposta não-JSON: uma nova tentativa imediata, reforçando o formato
+                    logger.warning(f"Attempt {attempt} returned invalid JSON, retrying with format hint...")
+                    retry_hint = _JSON_RETRY_HINT
+                else:
+                    # Erro de schema, autenticação, requisição inválida...: repetir
+                    # só gastaria tokens com o mesmo resultado
+                    logger.error(f"Attempt {attempt} failed with a non-retryable error")
+                    break
 
-        # Se chegou aqui, todas as tentativas falharam
         raise last_error
 
+    @staticmethod
+    def _is_transient(error: LLMExtractionError) -> bool:
+        """
+        Verifica se a falha veio de um erro transitório da API
+        (rate limit, timeout/conexão ou erro 5xx).
+
+        Args:
+            error: Erro da extração
+
+        Returns:
+            True se vale repetir a chamada após um backoff
+        """
+        from anthropic import APIConnectionError, APIStatusError, RateLimitError
+
+        cause = error.__cause__
+        if isinstance(cause, (RateLimitError, APIConnectionError)):
+            return True
+        return isinstance(cause, APIStatusError) and cause.status_code >= 500
+
+    @staticmethod
+    def _is_json_syntax_error(error: LLMExtractionError) -> bool:
+        """
+        Verifica se a falha foi uma resposta que não é JSON (ao contrário de
+        um JSON válido fora do schema de Process).
+
+        Args:
+            error: Erro da extração
+
+        Returns:
+            True se a resposta não era JSON
+        """
+        cause = error.__cause__
+        if isinstance(cause, pydantic.ValidationError):
+            return any(err['type'] == 'json_invalid' for err in cause.errors())
+        return False
+
 
 def extract_process_from_markdown(
     markdown_content: str,
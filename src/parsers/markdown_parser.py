@@ -7,12 +7,55 @@ import re
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
-from src.utils.exceptions import FileNotFoundError, InvalidFileFormatError, ParsingError
+from src.utils.exceptions import InvalidFileFormatError, ParsingError, ProcessFileNotFoundError
 from src.utils.logger import get_logger
 
+try:
+    import re2 as _keyword_re
+except ImportError:  # google-re2 é opcional
+    _keyword_re = re
+
 logger = get_logger()
 
 
+# Padrões compilados uma única vez (evita o lookup no cache do re a cada chamada)
+_RE_H1 = re.compile(r'^#\s+(.+)$', re.MULTILINE)
+_RE_H2_SPLIT = re.compile(r'^##\s+(.+)$', re.MULTILINE)
+_RE_BULLET = re.compile(r'^\s*[-*]\s+(.+)$', re.MULTILINE)
+_RE_NUMBERED = re.compile(r'^\s*\d+\.\s+(.+)$', re.MULTILINE)
+_RE_NUMBERED_PREFIX = re.compile(r'\d+\.\s')
+
+# Padrões de palavras-chave: usam o motor DFA do RE2 (google-re2) quando
+# instalado, sem backtracking; flags ficam inline para valer nos dois motores
+_RE_RESPONSAVEIS = _keyword_re.compile(
+    r'(?i)\(([A-Z][^)]+)\)|(?:Responsável|Executor|Ator):\s*([^\n]+)'
+)
+_RE_DECISOES = _keyword_re.compile(
+    r'(?im)(?:Decisão|Decision|Gateway):\s*([^\n]+)|^(?:Se|Caso|If)\s+([^\n]+)'
+)
+_RE_CONDICOES = _keyword_re.compile(
+    r'(?i)(?:Se|Caso|If)\s+([^:]+):|(?:então|then|otherwise):\s*([^\n]+)'
+)
+_RE_EVENTOS = _keyword_re.compile(
+    r'(?i)(?:Início|Start|Começo|Begin|Fim|End|Finalização|Término):\s*([^\n]+)'
+)
+
+_RE_HTML_COMMENT = re.compile(r'<!--.*?-->', re.DOTALL)
+# Limpeza de espaços em uma única passada (ver _clean_whitespace):
+# 1) sequência de 2+ linhas vazias (ou só com espaços), 2) espaços no fim da
+# linha, 3) espaços múltiplos
+_RE_WHITESPACE = re.compile(r'(\n(?:[ \t]*\n){2,})|([ \t]+(?=\n|\Z))|[ \t]{2,}')
+
+
+def _clean_whitespace(match: re.Match) -> str:
+    """Substituição para _RE_WHITESPACE, conforme o grupo que casou."""
+    if match.lastindex == 1:
+        return '\n\n'
+    if match.lastindex == 2:
+        return ''
+    return ' '
+
+
 class MarkdownParser:
     """
     Parser para arquivos Markdown de transcrições de processos.
@@ -21,6 +64,10 @@ class MarkdownParser:
     def __init__(self):
         self.content: str = ""
         self.file_path: Optional[str] = None
+        # (conteúdo varrido, resultado) de _scan_content
+        self._scan_cache: Optional[Tuple[str, Dict[str, any]]] = None
+        # (conteúdo original, resultado) de preprocess_for_llm
+        self._preprocess_cache: Optional[Tuple[str, str]] = None
 
     def load_file(self, file_path: str) -> str:
         """
@@ -33,7 +80,7 @@ class MarkdownParser:
             Conteúdo do arquivo
 
         Raises:
-            FileNotFoundError: Se o arquivo não existe
+            ProcessFileNotFoundError: Se o arquivo não existe
             InvalidFileFormatError: Se não é um arquivo .md
             ParsingError: Se há erro ao ler o arquivo
         """
@@ -42,7 +89,7 @@ class MarkdownParser:
         # Verificar se arquivo existe
         if not path.exists():
             logger.error(f"File not found: {file_path}")
-            raise FileNotFoundError(file_path)
+            raise ProcessFileNotFoundError(file_path)
 
         # Verificar extensão
         if path.suffix.lower() != '.md':
@@ -51,15 +98,153 @@ class MarkdownParser:
 
         # Ler conteúdo
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                self.content = f.read()
-            self.file_path = file_path
-            logger.info(f"Loaded markdown file: {file_path} ({len(self.content)} chars)")
-            return self.content
+            # Leitura única + decode (sem os buffers incrementais do modo texto)
+            content = path.read_bytes().decode('utf-8')
+        except UnicodeDecodeError as e:
+            logger.error(f"File is not valid UTF-8: {e}")
+            raise ParsingError(f"File is not valid UTF-8: {e}", file_path=file_path)
         except Exception as e:
             logger.error(f"Error reading file: {e}")
             raise ParsingError(f"Failed to read file: {e}", file_path=file_path)
 
+        # Modo texto normalizava \r\n e \r para \n
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+
+        self.content = content
+        self.file_path = file_path
+        self._scan_cache = None
+        self._preprocess_cache = None
+        logger.info(f"Loaded markdown file: {file_path} ({len(self.content)} chars)")
+        return self.content
+
+    def _scan_content(self) -> Dict[str, any]:
+        """
+        Varre o conteúdo uma única vez, classificando cada linha.
+
+        Título, seções, listas e contagens de estatísticas saem da mesma
+        passada linha a linha. O resultado fica em cache enquanto
+        self.content não mudar.
+
+        Os padrões de palavras-chave atravessam linhas e se sobrepõem entre
+        categorias, então continuam como buscas no conteúdo inteiro (feitas
+        uma vez e guardadas no mesmo cache).
+
+        Returns:
+            Dicionário com os resultados da varredura
+        """
+        content = self.content
+        if self._scan_cache is not None and self._scan_cache[0] is content:
+            return self._scan_cache[1]
+
+        title = None
+        sections: Dict[str, str] = {}
+        section_title = None
+        section_lines: List[str] = []
+        bullet_items: List[str] = []
+        numbered_items: List[str] = []
+        num_h1 = num_h2 = num_h3 = num_bullets = num_numbered = 0
+
+        for line in content.split('\n'):
+            if not line:
+                if section_title is not None:
+                    section_lines.append(line)
+                continue
+
+            if line[0] == '#':
+                if line[1:2].isspace():
+                    num_h1 += 1
+                    if title is None and (match := _RE_H1.match(line)):
+                        title = match.group(1).strip()
+                elif line.startswith('##'):
+                    if line[2:3].isspace():
+                        num_h2 += 1
+                        if match := _RE_H2_SPLIT.match(line):
+                            if section_title is not None:
+                                sections[section_title] = '\n'.join(section_lines).strip()
+                            section_title = match.group(1).strip()
+                            section_lines = []
+                            continue
+                    elif line.startswith('###') and line[3:4].isspace():
+                        num_h3 += 1
+            else:
+                # Só linhas indentadas pagam o lstrip (cópia da linha)
+                first = line[0]
+                if first.isspace():
+                    stripped = line.lstrip()
+                    first = stripped[:1]
+                else:
+                    stripped = line
+                if first == '-' or first == '*':
+                    if stripped[1:2].isspace():
+                        num_bullets += 1
+                        if match := _RE_BULLET.match(line):
+                            bullet_items.append(match.group(1))
+                elif first.isdigit() and _RE_NUMBERED_PREFIX.match(stripped):
+                    num_numbered += 1
+                    if match := _RE_NUMBERED.match(line):
+                        numbered_items.append(match.group(1))
+
+            if section_title is not None:
+                section_lines.append(line)
+
+        if section_title is not None:
+            sections[section_title] = '\n'.join(section_lines).strip()
+
+        scan = {
+            'title': title,
+            'sections': sections,
+            'lists': bullet_items + numbered_items,
+            'keywords': self._find_keywords(),
+            'statistics': {
+                'total_chars': len(content),
+                'total_lines': len(content.splitlines()),
+                'total_words': len(content.split()),
+                'num_headers_h1': num_h1,
+                'num_headers_h2': num_h2,
+                'num_headers_h3': num_h3,
+                'num_bullet_points': num_bullets,
+                'num_numbered_items': num_numbered,
+            },
+        }
+        self._scan_cache = (content, scan)
+        return scan
+
+    def _find_keywords(self) -> Dict[str, List[str]]:
+        """
+        Busca as palavras-chave de processo no conteúdo.
+
+        Returns:
+            Dicionário com tipo de keyword e lista de matches
+        """
+        content = self.content
+
+        # Walrus: cada match é normalizado com um único strip()
+        keywords = {
+            # Ex: "(Gerente)", "Responsável: João", "Executor: Maria"
+            'responsaveis': [
+                resp for match in _RE_RESPONSAVEIS.findall(content)
+                if (resp := (match[0] or match[1]).strip())
+            ],
+            # Ex: "Decisão:", "Se...", "Caso..."
+            'decisoes': [
+                dec for match in _RE_DECISOES.findall(content)
+                if (dec := (match[0] or match[1]).strip())
+            ],
+            # Ex: "Se sim:", "Se aprovado:", "Caso contrário:"
+            'condicoes': [
+                cond for match in _RE_CONDICOES.findall(content)
+                if (cond := (match[0] or match[1]).strip())
+            ],
+            # Ex: "Início:", "Fim:", "Finalização:"
+            'eventos': [
+                event for match in _RE_EVENTOS.findall(content)
+                if (event := match.strip())
+            ],
+        }
+
+        return keywords
+
     def extract_title(self) -> Optional[str]:
         """
         Extrai o título principal (primeiro # H1).
@@ -67,12 +252,10 @@ class MarkdownParser:
         Returns:
             Título ou None se não encontrado
         """
-        match = re.search(r'^#\s+(.+)$', self.content, re.MULTILINE)
-        if match:
-            title = match.group(1).strip()
+        title = self._scan_content()['title']
+        if title is not None:
             logger.debug(f"Extracted title: {title}")
-            return title
-        return None
+        return title
 
     def extract_sections(self) -> Dict[str, str]:
         """
@@ -81,20 +264,7 @@ class MarkdownParser:
         Returns:
             Dicionário com título da seção e conteúdo
         """
-        sections = {}
-
-        # Split por headers ##
-        parts = re.split(r'^##\s+(.+)$', self.content, flags=re.MULTILINE)
-
-        # Primeira parte é o conteúdo antes do primeiro ##
-        if len(parts) > 1:
-            # Pares: título, conteúdo, título, conteúdo...
-            for i in range(1, len(parts), 2):
-                if i + 1 < len(parts):
-                    section_title = parts[i].strip()
-                    section_content = parts[i + 1].strip()
-                    sections[section_title] = section_content
-
+        sections = dict(self._scan_content()['sections'])
         logger.debug(f"Extracted {len(sections)} sections: {list(sections.keys())}")
         return sections
 
@@ -103,18 +273,9 @@ class MarkdownParser:
         Extrai todas as listas (itens que começam com -, *, ou números).
 
         Returns:
-            Lista de itens
+            Lista de itens (primeiro os com - ou *, depois os numerados)
         """
-        items = []
-
-        # Itens com - ou *
-        bullet_items = re.findall(r'^\s*[-*]\s+(.+)$', self.content, re.MULTILINE)
-        items.extend(bullet_items)
-
-        # Itens numerados
-        numbered_items = re.findall(r'^\s*\d+\.\s+(.+)$', self.content, re.MULTILINE)
-        items.extend(numbered_items)
-
+        items = list(self._scan_content()['lists'])
         logger.debug(f"Extracted {len(items)} list items")
         return items
 
@@ -125,60 +286,7 @@ class MarkdownParser:
         Returns:
             Dicionário com tipo de keyword e lista de matches
         """
-        keywords = {
-            'responsaveis': [],
-            'decisoes': [],
-            'condicoes': [],
-            'eventos': []
-        }
-
-        # Padrões para identificar responsáveis
-        # Ex: "(Gerente)", "Responsável: João", "Executor: Maria"
-        responsaveis = re.findall(
-            r'\(([A-Z][^)]+)\)|(?:Responsável|Executor|Ator):\s*([^\n]+)',
-            self.content,
-            re.IGNORECASE
-        )
-        for match in responsaveis:
-            resp = match[0] or match[1]
-            if resp.strip():
-                keywords['responsaveis'].append(resp.strip())
-
-        # Padrões para decisões
-        # Ex: "Decisão:", "Se...", "Caso..."
-        decisoes = re.findall(
-            r'(?:Decisão|Decision|Gateway):\s*([^\n]+)|^(?:Se|Caso|If)\s+([^\n]+)',
-            self.content,
-            re.MULTILINE | re.IGNORECASE
-        )
-        for match in decisoes:
-            dec = match[0] or match[1]
-            if dec.strip():
-                keywords['decisoes'].append(dec.strip())
-
-        # Padrões para condições
-        # Ex: "Se sim:", "Se aprovado:", "Caso contrário:"
-        condicoes = re.findall(
-            r'(?:Se|Caso|If)\s+([^:]+):|(?:então|then|otherwise):\s*([^\n]+)',
-            self.content,
-            re.IGNORECASE
-        )
-        for match in condicoes:
-            cond = match[0] or match[1]
-            if cond.strip():
-                keywords['condicoes'].append(cond.strip())
-
-        # Padrões para eventos
-        # Ex: "Início:", "Fim:", "Finalização:"
-        eventos = re.findall(
-            r'(?:Início|Start|Começo|Begin|Fim|End|Finalização|Término):\s*([^\n]+)',
-            self.content,
-            re.IGNORECASE
-        )
-        for match in eventos:
-            if match.strip():
-                keywords['eventos'].append(match.strip())
-
+        keywords = {k: list(v) for k, v in self._scan_content()['keywords'].items()}
         logger.debug(f"Identified keywords: {[(k, len(v)) for k, v in keywords.items()]}")
         return keywords
 
@@ -189,17 +297,7 @@ class MarkdownParser:
         Returns:
             Dicionário com estatísticas
         """
-        stats = {
-            'total_chars': len(self.content),
-            'total_lines': len(self.content.splitlines()),
-            'total_words': len(self.content.split()),
-            'num_headers_h1': len(re.findall(r'^#\s+', self.content, re.MULTILINE)),
-            'num_headers_h2': len(re.findall(r'^##\s+', self.content, re.MULTILINE)),
-            'num_headers_h3': len(re.findall(r'^###\s+', self.content, re.MULTILINE)),
-            'num_bullet_points': len(re.findall(r'^\s*[-*]\s+', self.content, re.MULTILINE)),
-            'num_numbered_items': len(re.findall(r'^\s*\d+\.\s+', self.content, re.MULTILINE)),
-        }
-        return stats
+        return dict(self._scan_content()['statistics'])
 
     def preprocess_for_llm(self) -> str:
         """
@@ -210,25 +308,29 @@ class MarkdownParser:
         - Remove comentários HTML
         - Mantém estrutura importante
 
+        O resultado fica em cache enquanto self.content não mudar.
+
         Returns:
             Conteúdo pré-processado
         """
-        processed = self.content
-
-        # Remover comentários HTML
-        processed = re.sub(r'<!--.*?-->', '', processed, flags=re.DOTALL)
+        content = self.content
+        if self._preprocess_cache is not None and self._preprocess_cache[0] is content:
+            return self._preprocess_cache[1]
 
-        # Normalizar múltiplas linhas vazias para uma única
-        processed = re.sub(r'\n{3,}', '\n\n', processed)
+        processed = content
 
-        # Remover espaços em branco no final das linhas
-        processed = '\n'.join(line.rstrip() for line in processed.splitlines())
+        # Remover comentários HTML (pula a passada quando não há nenhum)
+        if '<!--' in processed:
+            processed = _RE_HTML_COMMENT.sub('', processed)
 
-        # Remover espaços múltiplos (mas manter indentação)
-        processed = re.sub(r'[ \t]{2,}', ' ', processed)
+        # Linhas vazias múltiplas -> uma, espaços no fim das linhas e espaços
+        # múltiplos (inclusive na indentação) em uma única passada
+        processed = _RE_WHITESPACE.sub(_clean_whitespace, processed)
 
-        logger.debug(f"Preprocessed content: {len(self.content)} -> {len(processed)} chars")
-        return processed.strip()
+        processed = processed.strip()
+        logger.debug(f"Preprocessed content: {len(content)} -> {len(processed)} chars")
+        self._preprocess_cache = (content, processed)
+        return processed
 
     def parse(self, file_path: str) -> Tuple[str, Dict[str, any]]:
         """
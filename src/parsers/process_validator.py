@@ -3,14 +3,164 @@ Validador de processos.
 Verifica integridade e consistência de processos extraídos.
 """
 
-from typing import List, Set
+import os
+from collections import defaultdict, deque
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Set
 
-from src.models.process_model import Process, ProcessElement
+from src.models.process_model import Process, ProcessElement, ProcessFlow
 from src.utils.exceptions import ValidationError
 from src.utils.logger import get_logger
 
+try:
+    import numpy as np
+except ImportError:  # numpy é opcional; a BFS usa Python puro
+    np = None
+
+try:
+    from numba import njit
+    maybe_njit = njit(cache=True)
+    HAS_NUMBA = True
+except ImportError:  # numba é opcional; sem ele os kernels rodam em Python
+    def maybe_njit(func):
+        """Fallback sem Numba: devolve a função sem compilar."""
+        return func
+    HAS_NUMBA = False
+
 logger = get_logger()
 
+# Acima deste número de elementos a BFS de alcançabilidade usa o kernel Numba
+# (se disponível)
+_NUMBA_MIN_ELEMENTS = 1000
+_numba_fallback_warned = False
+
+if np is not None:
+    @maybe_njit
+    def _bfs_kernel(indptr, indices, starts, n):
+        """BFS sobre adjacência CSR; retorna máscara de nós alcançados."""
+        visited = np.zeros(n, dtype=np.bool_)
+        queue = np.empty(n, dtype=np.int32)
+        head = 0
+        tail = 0
+        for s in starts:
+            if not visited[s]:
+                visited[s] = True
+                queue[tail] = s
+                tail += 1
+        while head < tail:
+            node = queue[head]
+            head += 1
+            for k in range(indptr[node], indptr[node + 1]):
+                target = indices[k]
+                if not visited[target]:
+                    visited[target] = True
+                    queue[tail] = target
+                    tail += 1
+        return visited
+
+    # Compilação antecipada (opcional): evita pagar o JIT na primeira validação
+    if HAS_NUMBA and os.environ.get("PROCESS_VALIDATOR_JIT_WARMUP"):
+        _bfs_kernel(
+            np.zeros(2, dtype=np.int32),
+            np.zeros(0, dtype=np.int32),
+            np.zeros(1, dtype=np.int32),
+            1
+        )
+else:
+    _bfs_kernel = None
+
+
+def _use_jit_kernels() -> bool:
+    """
+    Indica se os kernels compilados estão disponíveis.
+
+    Sem Numba o kernel CSR rodaria como Python puro (mais lento que a BFS
+    com dicts), então a BFS em Python é usada; avisa uma única vez.
+    """
+    global _numba_fallback_warned
+    if HAS_NUMBA and _bfs_kernel is not None:
+        return True
+    if not _numba_fallback_warned:
+        _numba_fallback_warned = True
+        logger.warning("numba/numpy not installed; validating large processes with pure-Python BFS")
+    return False
+
+
+class _ProcessIndex(NamedTuple):
+    """Visões dos elementos de um processo, montadas em uma única passada."""
+    element_ids: FrozenSet[str]
+    id_to_elem: Dict[str, ProcessElement]
+    annotations: List[ProcessElement]
+    non_annotation_ids: FrozenSet[str]
+    start_events: List[ProcessElement]
+    end_events: List[ProcessElement]
+    gateways: List[ProcessElement]
+    used_actors: FrozenSet[str]
+    outgoing: Dict[str, List[ProcessFlow]]
+    connected_ids: FrozenSet[str]
+
+
+def _build_index(process: Process) -> _ProcessIndex:
+    """
+    Percorre elementos e fluxos uma vez e monta as visões usadas pelas
+    validações.
+
+    A adjacência e os eventos de início/fim são montados a partir das listas
+    atuais (e não dos índices do Process), refletindo também alterações
+    feitas in-place nas listas.
+
+    Args:
+        process: Processo a indexar
+
+    Returns:
+        _ProcessIndex do processo
+    """
+    id_to_elem: Dict[str, ProcessElement] = {}
+    annotations: List[ProcessElement] = []
+    non_annotation_ids: Set[str] = set()
+    start_events: List[ProcessElement] = []
+    end_events: List[ProcessElement] = []
+    gateways: List[ProcessElement] = []
+    used_actors: Set[str] = set()
+
+    for element in process.elements:
+        # Mantém o primeiro elemento em caso de ID duplicado
+        id_to_elem.setdefault(element.id, element)
+        if element.actor:
+            used_actors.add(element.actor)
+        element_type = element.type
+        if element_type == 'annotation':
+            annotations.append(element)
+            continue
+        non_annotation_ids.add(element.id)
+        if element_type == 'event':
+            if element.event_kind == 'start':
+                start_events.append(element)
+            elif element.event_kind == 'end':
+                end_events.append(element)
+        elif element_type == 'gateway':
+            gateways.append(element)
+
+    outgoing: Dict[str, List[ProcessFlow]] = defaultdict(list)
+    # Pontas de qualquer flow (grau de entrada ou saída > 0)
+    connected_ids: Set[str] = set()
+    for flow in process.flows:
+        outgoing[flow.from_element].append(flow)
+        connected_ids.add(flow.from_element)
+        connected_ids.add(flow.to_element)
+
+    return _ProcessIndex(
+        element_ids=frozenset(id_to_elem),
+        id_to_elem=id_to_elem,
+        annotations=annotations,
+        non_annotation_ids=frozenset(non_annotation_ids),
+        start_events=start_events,
+        end_events=end_events,
+        gateways=gateways,
+        used_actors=frozenset(used_actors),
+        outgoing=dict(outgoing),
+        connected_ids=frozenset(connected_ids),
+    )
+
 
 class ProcessValidator:
     """
@@ -18,6 +168,21 @@ class ProcessValidator:
     Aplica regras de negócio e verifica consistência.
     """
 
+    # Nomes dos métodos de validação, na ordem de execução
+    _CRITICAL_CHECKS = (
+        '_validate_has_start_event',
+        '_validate_has_end_event',
+        '_validate_unique_ids',
+        '_validate_flows_reference_valid_elements',
+    )
+    _ADVISORY_CHECKS = (
+        '_validate_gateways_have_multiple_outputs',
+        '_validate_elements_are_reachable',
+        '_validate_no_orphan_elements',
+        '_validate_actors_exist',
+        '_validate_annotations_reference_valid_elements',
+    )
+
     def __init__(self, strict: bool = False):
         """
         Inicializa o validador.
@@ -30,6 +195,9 @@ class ProcessValidator:
         self.errors: List[str] = []
         self.warnings: List[str] = []
 
+        # Visões do processo, montadas uma vez por validate()
+        self._index: Optional[_ProcessIndex] = None
+
     def validate(self, process: Process) -> bool:
         """
         Valida um processo completo.
@@ -48,27 +216,27 @@ class ProcessValidator:
         self.errors = []
         self.warnings = []
 
-        # Executar todas as validações
-        self._validate_has_start_event(process)
-        self._validate_has_end_event(process)
-        self._validate_unique_ids(process)
-        self._validate_flows_reference_valid_elements(process)
-        self._validate_gateways_have_multiple_outputs(process)
-        self._validate_elements_are_reachable(process)
-        self._validate_no_orphan_elements(process)
-        self._validate_actors_exist(process)
-        self._validate_annotations_reference_valid_elements(process)
-
-        # Log resultados
+        self._index = _build_index(process)
+
+        # Validações críticas primeiro; em modo strict, se alguma falhar o
+        # processo já é inválido e as demais são puladas
+        for check in self._CRITICAL_CHECKS:
+            getattr(self, check)(process)
+        if not (self.strict and self.errors):
+            for check in self._ADVISORY_CHECKS:
+                getattr(self, check)(process)
+
+        # Log resultados (argumentos em vez de f-strings: o loguru só formata
+        # a mensagem se algum handler aceitar o nível)
         if self.errors:
-            logger.error(f"Validation failed with {len(self.errors)} error(s)")
+            logger.error("Validation failed with {} error(s)", len(self.errors))
             for error in self.errors:
-                logger.error(f"  - {error}")
+                logger.error("  - {}", error)
 
         if self.warnings:
-            logger.warning(f"Validation completed with {len(self.warnings)} warning(s)")
+            logger.warning("Validation completed with {} warning(s)", len(self.warnings))
             for warning in self.warnings:
-                logger.warning(f"  - {warning}")
+                logger.warning("  - {}", warning)
 
         # Se strict, lançar exceção com erros
         if self.strict and self.errors:
@@ -78,7 +246,7 @@ class ProcessValidator:
 
     def _validate_has_start_event(self, process: Process):
         """Valida que o processo tem pelo menos um evento de início."""
-        start_events = process.get_start_events()
+        start_events = self._index.start_events
         if not start_events:
             self.errors.append("Process must have at least one start event")
         elif len(start_events) > 1:
@@ -86,21 +254,27 @@ class ProcessValidator:
 
     def _validate_has_end_event(self, process: Process):
         """Valida que o processo tem pelo menos um evento de fim."""
-        end_events = process.get_end_events()
+        end_events = self._index.end_events
         if not end_events:
             self.errors.append("Process must have at least one end event")
 
     def _validate_unique_ids(self, process: Process):
         """Valida que todos os IDs são únicos."""
-        ids = [e.id for e in process.elements]
-        duplicates = [id for id in ids if ids.count(id) > 1]
+        # set.add + variação de tamanho: um único hash por ID
+        seen: Set[str] = set()
+        add = seen.add
+        duplicates: Dict[str, None] = {}  # dict mantém a ordem de ocorrência
+        for element in process.elements:
+            size = len(seen)
+            add(element.id)
+            if len(seen) == size:
+                duplicates[element.id] = None
         if duplicates:
-            unique_duplicates = list(set(duplicates))
-            self.errors.append(f"Duplicate element IDs found: {unique_duplicates}")
+            self.errors.append(f"Duplicate element IDs found: {list(duplicates)}")
 
     def _validate_flows_reference_valid_elements(self, process: Process):
         """Valida que todos os flows referenciam elementos que existem."""
-        element_ids = {e.id for e in process.elements}
+        element_ids = self._index.element_ids
 
         for flow in process.flows:
             if flow.from_element not in element_ids:
@@ -114,8 +288,8 @@ class ProcessValidator:
 
     def _validate_gateways_have_multiple_outputs(self, process: Process):
         """Valida que gateways têm pelo menos 2 saídas."""
-        for element in process.get_gateways():
-            outgoing = process.get_outgoing_flows(element.id)
+        for element in self._index.gateways:
+            outgoing = self._index.outgoing.get(element.id, ())
             if len(outgoing) < 2:
                 self.errors.append(
                     f"Gateway '{element.name}' ({element.id}) must have at least 2 outgoing flows, "
@@ -131,58 +305,109 @@ class ProcessValidator:
 
     def _validate_elements_are_reachable(self, process: Process):
         """Valida que todos os elementos são alcançáveis a partir do início."""
-        start_events = process.get_start_events()
+        start_events = self._index.start_events
         if not start_events:
             # Já validado em outra função
             return
 
         # BFS para encontrar elementos alcançáveis
+        start_ids = [e.id for e in start_events]
+        if len(process.elements) > _NUMBA_MIN_ELEMENTS and _use_jit_kernels():
+            reachable = self._reachable_csr(process, start_ids)
+        else:
+            reachable = self._reachable(start_ids)
+
+        # Verificar elementos não alcançáveis (exceto anotações)
+        index = self._index
+        unreachable = index.non_annotation_ids - reachable
+
+        if unreachable:
+            unreachable_names = [
+                index.id_to_elem[id].name for id in unreachable
+            ]
+            self.warnings.append(
+                f"Elements not reachable from start: {unreachable_names}"
+            )
+
+    def _reachable(self, start_ids: List[str]) -> Set[str]:
+        """
+        BFS em Python puro sobre a adjacência do índice.
+
+        Args:
+            start_ids: IDs dos eventos de início
+
+        Returns:
+            Conjunto de IDs alcançáveis
+        """
+        outgoing = self._index.outgoing
         reachable: Set[str] = set()
-        to_visit = [e.id for e in start_events]
+        to_visit = deque(start_ids)
 
         while to_visit:
-            current_id = to_visit.pop(0)
+            current_id = to_visit.popleft()
             if current_id in reachable:
                 continue
 
             reachable.add(current_id)
 
-            # Adicionar próximos elementos
-            for flow in process.get_outgoing_flows(current_id):
-                if flow.to_element not in reachable:
-                    to_visit.append(flow.to_element)
+            # Adicionar próximos elementos (repetidos são descartados no topo do laço)
+            for flow in outgoing.get(current_id, ()):
+                to_visit.append(flow.to_element)
 
-        # Verificar elementos não alcançáveis (exceto anotações)
-        all_ids = {e.id for e in process.elements if not e.is_annotation()}
-        unreachable = all_ids - reachable
+        return reachable
 
-        if unreachable:
-            unreachable_names = [
-                process.get_element(id).name for id in unreachable
-            ]
-            self.warnings.append(
-                f"Elements not reachable from start: {unreachable_names}"
-            )
+    def _reachable_csr(self, process: Process, start_ids: List[str]) -> Set[str]:
+        """
+        BFS compilada (Numba) sobre adjacência CSR com IDs inteiros.
+
+        Args:
+            process: Processo validado
+            start_ids: IDs dos eventos de início
+
+        Returns:
+            Conjunto de IDs alcançáveis
+        """
+        # IDs de elementos e de pontas de flows (inclusive inexistentes,
+        # que a BFS também percorre) -> índices inteiros
+        id_to_int: Dict[str, int] = {}
+        for element_id in self._index.id_to_elem:
+            id_to_int[element_id] = len(id_to_int)
+        sources = []
+        targets = []
+        for flow in process.flows:
+            sources.append(id_to_int.setdefault(flow.from_element, len(id_to_int)))
+            targets.append(id_to_int.setdefault(flow.to_element, len(id_to_int)))
+        n = len(id_to_int)
+
+        sources = np.asarray(sources, dtype=np.int32)
+        order = np.argsort(sources, kind='stable')
+        indices = np.asarray(targets, dtype=np.int32)[order]
+        indptr = np.zeros(n + 1, dtype=np.int32)
+        np.cumsum(np.bincount(sources, minlength=n), out=indptr[1:])
+        starts = np.asarray([id_to_int[i] for i in start_ids], dtype=np.int32)
+
+        visited = _bfs_kernel(indptr, indices, starts, n)
+        ids = list(id_to_int)
+        return {ids[i] for i in np.flatnonzero(visited)}
 
     def _validate_no_orphan_elements(self, process: Process):
         """Valida que não há elementos órfãos (sem conexões)."""
+        skip_types = ('annotation', 'event')
+        connected_ids = self._index.connected_ids
         for element in process.elements:
             # Skip anotações e eventos
-            if element.is_annotation() or element.is_event():
+            if element.type in skip_types:
                 continue
 
-            incoming = process.get_incoming_flows(element.id)
-            outgoing = process.get_outgoing_flows(element.id)
-
-            if not incoming and not outgoing:
+            if element.id not in connected_ids:
                 self.warnings.append(
                     f"Orphan element (no connections): '{element.name}' ({element.id})"
                 )
 
     def _validate_actors_exist(self, process: Process):
         """Valida que todos os atores referenciados existem na lista de atores."""
-        declared_actors = set(process.actors)
-        used_actors = {e.actor for e in process.elements if e.actor}
+        declared_actors = frozenset(process.actors)
+        used_actors = self._index.used_actors
 
         # Atores usados mas não declarados
         undeclared = used_actors - declared_actors
@@ -200,15 +425,14 @@ class ProcessValidator:
 
     def _validate_annotations_reference_valid_elements(self, process: Process):
         """Valida que anotações referenciam elementos válidos."""
-        element_ids = {e.id for e in process.elements}
+        element_ids = self._index.element_ids
 
-        for element in process.elements:
-            if element.is_annotation():
-                attached_to = element.metadata.get('attached_to')
-                if attached_to and attached_to not in element_ids:
-                    self.warnings.append(
-                        f"Annotation '{element.name}' references non-existent element: {attached_to}"
-                    )
+        for element in self._index.annotations:
+            attached_to = element.metadata.get('attached_to')
+            if attached_to and attached_to not in element_ids:
+                self.warnings.append(
+                    f"Annotation '{element.name}' references non-existent element: {attached_to}"
+                )
 
     def get_errors(self) -> List[str]:
         """Retorna lista de erros encontrados."""
@@ -268,6 +492,6 @@ def validate_and_fix_process(process: Process) -> Process:
     if validator.errors:
         logger.warning("Process has validation errors that require manual fix:")
         for error in validator.errors:
-            logger.warning(f"  - {error}")
+            logger.warning("  - {}", error)
 
     return process
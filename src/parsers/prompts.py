@@ -0,0 +1,182 @@
+"""
+Prompts usados na extração de processos.
+Módulo sem dependências pesadas, compartilhado pelos extratores.
+"""
+
+
+# Prompt principal para extração de processos
+EXTRACTION_PROMPT_TEMPLATE = """Você é um especialista em análise de processos de negócio. Sua tarefa é analisar uma transcrição de processo e extrair elementos estruturados.
+
+IMPORTANTE: Esta empresa tem baixa maturidade em modelagem de processos, então use elementos SIMPLES e intuitivos:
+- Tarefas: atividades que alguém executa
+- Decisões: pontos onde há escolha entre caminhos
+- Eventos: início e fim do processo
+- Notas: observações importantes sobre o processo
+
+TRANSCRIÇÃO:
+{markdown_content}
+
+Extraia os elementos do processo no formato JSON seguindo EXATAMENTE esta estrutura:
+
+{{
+  "process_name": "Nome claro e descritivo do processo",
+  "description": "Breve descrição do que o processo faz",
+  "actors": ["Lista", "de", "responsáveis/atores"],
+  "elements": [
+    {{
+      "id": "identificador_unico",
+      "type": "task",
+      "name": "Nome da tarefa",
+      "description": "Descrição detalhada (opcional)",
+      "actor": "Nome do responsável",
+      "metadata": {{}}
+    }},
+    {{
+      "id": "gateway_1",
+      "type": "gateway",
+      "name": "Pergunta ou decisão a ser tomada",
+      "description": "Contexto da decisão",
+      "actor": "Quem decide",
+      "metadata": {{
+        "gateway_type": "exclusive",
+        "conditions": ["Opção 1", "Opção 2", "Opção 3"]
+      }}
+    }},
+    {{
+      "id": "event_start",
+      "type": "event",
+      "name": "Descrição do que inicia o processo",
+      "description": null,
+      "actor": null,
+      "metadata": {{
+        "event_type": "start"
+      }}
+    }},
+    {{
+      "id": "event_end",
+      "type": "event",
+      "name": "Descrição do que finaliza o processo",
+      "description": null,
+      "actor": null,
+      "metadata": {{
+        "event_type": "end"
+      }}
+    }},
+    {{
+      "id": "annotation_1",
+      "type": "annotation",
+      "name": "Nota ou observação importante",
+      "description": "Detalhes da nota",
+      "actor": null,
+      "metadata": {{
+        "attached_to": "id_do_elemento_relacionado"
+      }}
+    }}
+  ],
+  "flows": [
+    {{
+      "from_element": "event_start",
+      "to_element": "task_1",
+      "condition": null
+    }},
+    {{
+      "from_element": "gateway_1",
+      "to_element": "task_2",
+      "condition": "Se aprovado"
+    }},
+    {{
+      "from_element": "task_3",
+      "to_element": "event_end",
+      "condition": null
+    }}
+  ]
+}}
+
+REGRAS IMPORTANTES:
+
+1. **Tipos de elementos:**
+   - "task": atividades executadas por alguém
+   - "gateway": pontos de decisão (sempre com tipo "exclusive" para simplicidade)
+   - "event": início ou fim do processo (event_type: "start" ou "end")
+   - "annotation": notas, observações, lembretes
+
+2. **IDs únicos:**
+   - Use formato: task_1, task_2, gateway_1, event_start, event_end, annotation_1
+   - IDs devem ser únicos e descritivos
+
+3. **Atores (responsáveis):**
+   - Identifique claramente quem faz cada tarefa
+   - Use nomes de cargos ou departamentos
+   - Eventos e anotações não têm ator (usar null)
+
+4. **Decisões (gateways):**
+   - Sempre use "exclusive" para gateway_type
+   - Liste todas as opções possíveis em "conditions"
+   - Cada opção deve ter um flow correspondente
+
+5. **Fluxos (flows):**
+   - Conecte elementos na ordem correta
+   - Todo processo deve ter: event_start → tarefas → event_end
+   - Gateways devem ter múltiplos flows de saída (um para cada condição)
+   - Flows de gateways DEVEM ter "condition" preenchida
+
+6. **Completude:**
+   - Todo processo deve ter pelo menos 1 evento de início
+   - Todo processo deve ter pelo menos 1 evento de fim
+   - Todos os elementos devem estar conectados (alcançáveis do início)
+
+7. **Simplicidade:**
+   - Evite complexidade desnecessária
+   - Use linguagem clara e direta
+   - Foque no fluxo principal
+
+Retorne APENAS o JSON válido, sem markdown, sem comentários, sem explicações adicionais.
+"""
+
+# Template dividido uma única vez (já sem os escapes {{ }}): montar o prompt
+# vira uma concatenação em vez de re-parsear o template a cada chamada
+_PROMPT_SPLIT_MARKER = '\0SPLIT\0'
+_PROMPT_PREFIX, _PROMPT_SUFFIX = EXTRACTION_PROMPT_TEMPLATE.format(
+    markdown_content=_PROMPT_SPLIT_MARKER
+).split(_PROMPT_SPLIT_MARKER)
+
+
+def build_prompt(markdown_content: str) -> str:
+    """
+    Monta o prompt de extração para uma transcrição.
+
+    Equivalente a EXTRACTION_PROMPT_TEMPLATE.format(markdown_content=...).
+
+    Args:
+        markdown_content: Conteúdo markdown pré-processado
+
+    Returns:
+        Prompt completo
+    """
+    return _PROMPT_PREFIX + markdown_content + _PROMPT_SUFFIX
+
+
+def extract_json_object(response_text: str) -> str:
+    """
+    Isola o objeto JSON de uma resposta do modelo.
+
+    Apesar das instruções, a resposta às vezes vem entre cercas ```json
+    ou com texto antes/depois do JSON. Recorta do primeiro '{' ao último
+    '}'; sem chaves, devolve o texto sem espaços nas pontas (e o parse
+    acusa o erro de JSON).
+
+    Args:
+        response_text: Texto bruto da resposta
+
+    Returns:
+        Texto a ser validado como JSON
+    """
+    text = response_text.strip()
+    if text[:1] == '{' and text[-1:] == '}':
+        return text
+
+    start = text.find('{')
+    end = text.rfind('}')
+    if start == -1 or end < start:
+        return text
+    return text[start:end + 1]
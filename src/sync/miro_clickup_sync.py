@@ -3,9 +3,14 @@ Sincronizacao entre Miro e ClickUp.
 Mantem referencias cruzadas entre boards Miro e tarefas ClickUp.
 """
 
+import hashlib
+import random
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from src.models.process_model import Process, ProcessElement, ProcessIntegrationMetadata
 from src.models.hierarchy_model import (
@@ -17,19 +22,25 @@ from src.integrations.miro_client import MiroClient
 from src.integrations.clickup_client import ClickUpClient
 from src.layout.value_chain_layout import ValueChainLayout
 from src.layout.sipoc_layout import SIPOCLayout
-from src.layout.process_layout import ProcessLayout
+from src.layout.auto_layout import create_visual_diagram_with_layout
 from src.converters.visual_to_miro import VisualToMiroConverter
 from src.generators.pop_generator import POPGenerator
 from src.generators.it_generator import ITGenerator
 from src.generators.checklist_generator import ChecklistGenerator
+from src.utils.exceptions import ClickUpAPIError
 from src.utils.logger import get_logger
 
 logger = get_logger()
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncResult:
-    """Resultado de uma operacao de sincronizacao."""
+    """
+    Resultado de uma operacao de sincronizacao.
+
+    Usa __slots__ (um por macroprocesso em sync_value_chain): nao aceita
+    atributos alem dos campos declarados.
+    """
 
     success: bool
     operation: str
@@ -96,6 +107,18 @@ class MiroClickUpSync:
     - Gerar documentacao (POP, IT, Checklist) para ambas
     """
 
+    # Comentarios no ClickUp: requisicoes simultaneas e novas tentativas
+    # em falhas transitorias (rate limit, 5xx, erro de conexao)
+    COMMENT_MAX_WORKERS = 8
+    COMMENT_RETRIES = 2
+    RETRY_BASE_DELAY = 1.0  # segundos; dobra a cada tentativa (+ jitter de ate 1s)
+
+    # Macroprocessos sincronizados simultaneamente em sync_value_chain
+    MACRO_MAX_WORKERS = 6
+
+    # Processos com documentacao mantida em cache (LRU)
+    DOCUMENTATION_CACHE_SIZE = 128
+
     def __init__(
         self,
         miro_client: Optional[MiroClient] = None,
@@ -114,7 +137,6 @@ class MiroClickUpSync:
         # Layouts
         self.value_chain_layout = ValueChainLayout()
         self.sipoc_layout = SIPOCLayout()
-        self.process_layout = ProcessLayout()
 
         # Geradores de documentacao
         self.pop_generator = POPGenerator()
@@ -122,7 +144,51 @@ class MiroClickUpSync:
         self.checklist_generator = ChecklistGenerator()
 
         # Conversor visual -> Miro
-        self.miro_converter = VisualToMiroConverter()
+        self.miro_converter = VisualToMiroConverter(self.miro)
+
+        # Documentacao gerada por conteudo do processo (reaproveitada ao
+        # sincronizar de novo o mesmo processo, ex. apos falha parcial)
+        self._documentation_cache: OrderedDict = OrderedDict()
+
+    def clear_cache(self) -> None:
+        """Descarta a documentacao gerada em cache."""
+        self._documentation_cache.clear()
+
+    def _generate_documentation(
+        self,
+        process: Process,
+        task_elements: List[ProcessElement]
+    ) -> Tuple[POP, Dict[str, IT], Dict[str, Checklist]]:
+        """
+        Gera POP e, para cada tarefa, IT e Checklist.
+
+        O resultado fica em cache pelo hash do conteudo do processo; os
+        documentos devolvidos sao compartilhados entre chamadas.
+
+        Returns:
+            Tupla (pop, its, checklists), com its/checklists por element_id
+        """
+        key = hashlib.sha256(process.model_dump_json().encode('utf-8')).hexdigest()
+        cached = self._documentation_cache.get(key)
+        if cached is not None:
+            self._documentation_cache.move_to_end(key)
+            return cached
+
+        pop = self.pop_generator.generate(process)
+
+        # IT e Checklist por tarefa (renderizacao local, sem I/O: em serie)
+        its = {}
+        checklists = {}
+        for element in task_elements:
+            its[element.id] = self.it_generator.generate_for_activity(element, process)
+            checklists[element.id] = self.checklist_generator.generate_for_activity(
+                element, process
+            )
+
+        self._documentation_cache[key] = (pop, its, checklists)
+        if len(self._documentation_cache) > self.DOCUMENTATION_CACHE_SIZE:
+            self._documentation_cache.popitem(last=False)
+        return pop, its, checklists
 
     def sync_process_to_both(
         self,
@@ -147,7 +213,7 @@ class MiroClickUpSync:
         Returns:
             SyncResult com referencias e status
         """
-        logger.info(f"Iniciando sincronizacao do processo: {process.name}")
+        logger.info("Iniciando sincronizacao do processo: {}", process.name)
 
         result = SyncResult(
             success=True,
@@ -155,6 +221,9 @@ class MiroClickUpSync:
             metadata={'process_name': process.name, 'process_id': process.process_id}
         )
 
+        # Tarefas do processo, filtradas uma vez para documentacao e ClickUp
+        task_elements = process.get_tasks()
+
         # Gerar documentacao se solicitado
         pop = None
         its = {}
@@ -162,68 +231,62 @@ class MiroClickUpSync:
 
         if generate_documentation:
             try:
-                pop = self.pop_generator.generate(process)
+                pop, its, checklists = self._generate_documentation(process, task_elements)
                 result.metadata['pop_code'] = pop.code
 
-                # Gerar IT e Checklist para cada tarefa
-                for element in process.elements:
-                    if element.is_task():
-                        it = self.it_generator.generate_for_activity(element, process)
-                        its[element.id] = it
-
-                        cl = self.checklist_generator.generate_for_activity(element, process)
-                        checklists[element.id] = cl
-
-                logger.info(f"Documentacao gerada: 1 POP, {len(its)} ITs, {len(checklists)} Checklists")
+                logger.info(
+                    "Documentacao gerada: 1 POP, {} ITs, {} Checklists",
+                    len(its), len(checklists)
+                )
 
             except Exception as e:
                 result.add_warning(f"Erro ao gerar documentacao: {str(e)}")
 
-        # Criar board no Miro
-        if create_miro_board:
-            try:
-                miro_result = self._create_miro_board(process, pop, **kwargs)
-                result.miro_board_id = miro_result.get('board_id')
-                result.miro_board_url = miro_result.get('board_url')
-                result.miro_item_ids = miro_result.get('item_ids', {})
-                logger.info(f"Board Miro criado: {result.miro_board_url}")
+        create_clickup = bool(create_clickup_tasks and self.clickup)
+        if create_clickup and not space_id:
+            result.add_warning("space_id nao fornecido, pulando criacao no ClickUp")
+            create_clickup = False
+
+        # Board Miro e estrutura ClickUp sao independentes (ambos limitados
+        # por HTTP): criados em paralelo; o link do Miro entra depois
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            miro_future = None
+            clickup_future = None
+            if create_miro_board:
+                miro_future = executor.submit(self._create_miro_board, process, pop, **kwargs)
+            if create_clickup:
+                clickup_future = executor.submit(
+                    self._create_clickup_structure,
+                    process, space_id, its, checklists,
+                    task_elements=task_elements,
+                    **kwargs
+                )
 
-            except Exception as e:
-                result.add_error(f"Erro ao criar board Miro: {str(e)}")
+            if miro_future is not None:
+                try:
+                    miro_result = miro_future.result()
+                    result.miro_board_id = miro_result.get('board_id')
+                    result.miro_board_url = miro_result.get('board_url')
+                    result.miro_item_ids = miro_result.get('item_ids', {})
+                    logger.info("Board Miro criado: {}", result.miro_board_url)
 
-        # Criar tarefas no ClickUp
-        if create_clickup_tasks and self.clickup:
-            if not space_id:
-                result.add_warning("space_id nao fornecido, pulando criacao no ClickUp")
-            else:
+                except Exception as e:
+                    result.add_error(f"Erro ao criar board Miro: {str(e)}")
+
+            if clickup_future is not None:
                 try:
-                    clickup_result = self._create_clickup_structure(
-                        process, space_id, its, checklists,
-                        miro_board_url=result.miro_board_url,
-                        **kwargs
-                    )
+                    clickup_result = clickup_future.result()
                     result.clickup_space_id = space_id
                     result.clickup_folder_id = clickup_result.get('folder_id')
                     result.clickup_list_id = clickup_result.get('list_id')
                     result.clickup_task_ids = clickup_result.get('task_ids', {})
-                    logger.info(f"Estrutura ClickUp criada: folder={result.clickup_folder_id}")
+                    logger.info("Estrutura ClickUp criada: folder={}", result.clickup_folder_id)
 
                 except Exception as e:
                     result.add_error(f"Erro ao criar estrutura ClickUp: {str(e)}")
 
-        # Adicionar links cruzados
-        if result.miro_board_url and result.clickup_list_id:
-            try:
-                self._add_cross_references(
-                    result.miro_board_id,
-                    result.clickup_list_id,
-                    result.miro_item_ids,
-                    result.clickup_task_ids
-                )
-                logger.info("Referencias cruzadas adicionadas")
-
-            except Exception as e:
-                result.add_warning(f"Erro ao adicionar referencias cruzadas: {str(e)}")
+        # Adicionar links cruzados (embed no Miro + link em cada tarefa)
+        self._finalize_cross_links(result)
 
         return result
 
@@ -244,7 +307,10 @@ class MiroClickUpSync:
         Returns:
             SyncResult com referencias
         """
-        logger.info(f"Sincronizando Cadeia de Valor: {hierarchy.value_chain.name if hierarchy.value_chain else 'N/A'}")
+        logger.info(
+            "Sincronizando Cadeia de Valor: {}",
+            hierarchy.value_chain.name if hierarchy.value_chain else 'N/A'
+        )
 
         result = SyncResult(
             success=True,
@@ -269,21 +335,33 @@ class MiroClickUpSync:
             if board_id:
                 # Renderizar diagrama no board
                 miro_items = self.miro_converter.convert_and_upload(
-                    self.miro, board_id, vc_diagram
+                    board_id, vc_diagram
                 )
 
                 result.miro_board_id = board_id
                 result.miro_board_url = self.miro.get_board_url(board_id)
                 result.miro_item_ids = miro_items
 
-                # Criar boards para cada macroprocesso
+                # Criar boards para cada macroprocesso (em paralelo; cada um
+                # faz suas proprias chamadas Miro/ClickUp). O conversor e o
+                # layout SIPOC sao compartilhados: o mapa de IDs do conversor
+                # e local a cada convert_and_upload e o layout nao guarda estado
+                # por chamada
                 macro_boards = {}
-                for macro_id, macro in hierarchy.macroprocesses.items():
-                    macro_result = self._sync_macroprocess(
-                        macro, hierarchy, space_id, **kwargs
-                    )
-                    macro_boards[macro_id] = macro_result
-                    result.metadata[f'macro_{macro_id}'] = macro_result.to_dict()
+                if hierarchy.macroprocesses:
+                    workers = min(self.MACRO_MAX_WORKERS, len(hierarchy.macroprocesses))
+                    with ThreadPoolExecutor(max_workers=workers) as executor:
+                        futures = {
+                            macro_id: executor.submit(
+                                self._sync_macroprocess, macro, hierarchy, space_id, **kwargs
+                            )
+                            for macro_id, macro in hierarchy.macroprocesses.items()
+                        }
+                        # Coleta na ordem da hierarquia, nao na de conclusao
+                        for macro_id, future in futures.items():
+                            macro_result = future.result()
+                            macro_boards[macro_id] = macro_result
+                            result.metadata[f'macro_{macro_id}'] = macro_result.to_dict()
 
                 result.metadata['macro_boards'] = {
                     mid: mb.miro_board_url for mid, mb in macro_boards.items()
@@ -313,7 +391,7 @@ class MiroClickUpSync:
         Returns:
             SyncResult com referencias
         """
-        logger.info(f"Sincronizando Macroprocesso: {macroprocess.name}")
+        logger.info("Sincronizando Macroprocesso: {}", macroprocess.name)
 
         result = SyncResult(
             success=True,
@@ -340,7 +418,7 @@ class MiroClickUpSync:
                         sipoc, macroprocess.name
                     )
                     miro_items = self.miro_converter.convert_and_upload(
-                        self.miro, board_id, sipoc_diagram
+                        board_id, sipoc_diagram
                     )
                     result.miro_item_ids = miro_items
 
@@ -396,11 +474,11 @@ class MiroClickUpSync:
             raise ValueError("Falha ao criar board no Miro")
 
         # Gerar layout do processo
-        diagram = self.process_layout.create_layout(process)
+        diagram = create_visual_diagram_with_layout(process)
 
         # Converter e enviar para Miro
         item_ids = self.miro_converter.convert_and_upload(
-            self.miro, board_id, diagram
+            board_id, diagram
         )
 
         # Adicionar frame com info do POP se disponivel
@@ -424,65 +502,39 @@ class MiroClickUpSync:
         space_id: str,
         its: Dict[str, IT],
         checklists: Dict[str, Checklist],
-        miro_board_url: Optional[str] = None,
+        task_elements: Optional[List[ProcessElement]] = None,
         **kwargs
     ) -> Dict[str, Any]:
         """
         Cria estrutura no ClickUp para um processo.
 
+        Args:
+            task_elements: Tarefas do processo ja filtradas (usa
+                process.get_tasks() se nao fornecido)
+
         Returns:
             Dict com folder_id, list_id, task_ids
         """
         if not self.clickup:
             raise ValueError("ClickUp client nao configurado")
 
-        # Preparar atividades para o ClickUp
-        activities = []
-        for element in process.elements:
-            if element.is_task():
-                it = its.get(element.id)
-                cl = checklists.get(element.id)
-
-                # Gerar descricao da tarefa a partir da IT
-                description = ""
-                if it:
-                    description = self.it_generator.to_markdown(it)
-
-                # Preparar checklist items
-                checklist_items = []
-                if cl:
-                    checklist_items = [item.description for item in cl.items]
-
-                activities.append({
-                    'name': element.name,
-                    'numbering': element.numbering or "",
-                    'actor': element.actor or "",
-                    'description': description,
-                    'checklist_items': checklist_items,
-                    'element_id': element.id
-                })
-
-        # Criar estrutura completa no ClickUp
-        result = self.clickup.create_process_structure(
-            space_id=space_id,
-            process_name=process.name,
-            activities=activities
-        )
+        if task_elements is None:
+            task_elements = process.get_tasks()
+
+        # Atividades geradas sob demanda: a proxima (markdown da IT) e montada
+        # em segundo plano enquanto a tarefa atual e criada no ClickUp
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            result = self.clickup.create_process_structure(
+                space_id=space_id,
+                process_name=process.name,
+                activities=self._iter_activities(executor, task_elements, its, checklists)
+            )
 
         folder_id = result.get('folder_id')
         list_id = result.get('list_id')
-        task_ids = {a['element_id']: result['tasks'][i]['id'] for i, a in enumerate(activities) if i < len(result.get('tasks', []))}
-
-        # Adicionar link do Miro em cada tarefa
-        if miro_board_url:
-            for task_id in task_ids.values():
-                try:
-                    self.clickup.add_comment(
-                        task_id,
-                        f"📊 [Board Miro do Processo]({miro_board_url})"
-                    )
-                except Exception:
-                    pass
+        # zip para na lista mais curta (tarefas que falharam nao voltam)
+        tasks = result.get('tasks') or []
+        task_ids = {element.id: t['id'] for element, t in zip(task_elements, tasks)}
 
         return {
             'folder_id': folder_id,
@@ -490,6 +542,136 @@ class MiroClickUpSync:
             'task_ids': task_ids
         }
 
+    def _iter_activities(
+        self,
+        executor: ThreadPoolExecutor,
+        task_elements: List[ProcessElement],
+        its: Dict[str, IT],
+        checklists: Dict[str, Checklist]
+    ) -> Iterator[Dict[str, Any]]:
+        """Gera as atividades do ClickUp, montando a seguinte no executor."""
+        pending = None
+        for element in task_elements:
+            future = executor.submit(self._build_activity, element, its, checklists)
+            if pending is not None:
+                yield pending.result()
+            pending = future
+        if pending is not None:
+            yield pending.result()
+
+    def _build_activity(
+        self,
+        element: ProcessElement,
+        its: Dict[str, IT],
+        checklists: Dict[str, Checklist]
+    ) -> Dict[str, Any]:
+        """Monta a atividade do ClickUp para uma tarefa do processo."""
+        it = its.get(element.id)
+        cl = checklists.get(element.id)
+
+        return {
+            'name': element.name,
+            'numbering': element.numbering or "",
+            'actor': element.actor or "",
+            # Descricao da tarefa a partir da IT
+            'description': self.it_generator.to_markdown(it) if it else "",
+            'checklist_items': [item.description for item in cl.items] if cl else [],
+            'element_id': element.id
+        }
+
+    def _finalize_cross_links(self, result: SyncResult) -> None:
+        """
+        Liga o board Miro e as tarefas ClickUp de um resultado.
+
+        O embed da lista ClickUp no board e os comentarios com o link do
+        board em cada tarefa sao enviados em paralelo; falhas viram avisos
+        em result.
+        """
+        if not result.miro_board_url:
+            return
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            embed_future = None
+            links_future = None
+            if result.clickup_list_id:
+                embed_future = executor.submit(
+                    self._add_cross_references,
+                    result.miro_board_id,
+                    result.clickup_list_id,
+                    result.miro_item_ids,
+                    result.clickup_task_ids
+                )
+            if result.clickup_task_ids:
+                links_future = executor.submit(
+                    self._attach_miro_links,
+                    result.clickup_task_ids,
+                    result.miro_board_url
+                )
+
+            if embed_future is not None:
+                try:
+                    embed_future.result()
+                    logger.info("Referencias cruzadas adicionadas")
+                except Exception as e:
+                    result.add_warning(f"Erro ao adicionar referencias cruzadas: {str(e)}")
+
+            if links_future is not None:
+                failed = links_future.result()
+                if failed:
+                    result.add_warning(
+                        f"Link do board Miro nao adicionado em {failed} tarefa(s) do ClickUp"
+                    )
+
+    def _attach_miro_links(
+        self,
+        task_ids: Dict[str, str],
+        miro_board_url: str
+    ) -> int:
+        """
+        Adiciona o link do board Miro como comentario em cada tarefa.
+
+        Returns:
+            Numero de tarefas em que o comentario falhou
+        """
+        comment = f"📊 [Board Miro do Processo]({miro_board_url})"
+        failures = self._post_comments_bulk([(task_id, comment) for task_id in task_ids.values()])
+        return sum(error is not None for error in failures)
+
+    def _post_comments_bulk(
+        self,
+        comments: List[Tuple[str, str]]
+    ) -> List[Optional[Exception]]:
+        """
+        Publica comentarios em varias tarefas do ClickUp em paralelo.
+
+        Args:
+            comments: Pares (task_id, texto do comentario)
+
+        Returns:
+            Para cada par, na mesma ordem, a excecao da ultima tentativa
+            ou None se o comentario foi publicado
+        """
+        if not comments:
+            return []
+        workers = min(self.COMMENT_MAX_WORKERS, len(comments))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda pair: self._post_comment(*pair), comments))
+
+    def _post_comment(self, task_id: str, comment: str) -> Optional[Exception]:
+        """Publica um comentario, repetindo apenas em falhas transitorias."""
+        for attempt in range(self.COMMENT_RETRIES + 1):
+            try:
+                self.clickup.add_comment(task_id, comment)
+                return None
+            except ClickUpAPIError as e:
+                status = e.status_code
+                transient = status is None or status == 429 or status >= 500
+                if not transient or attempt == self.COMMENT_RETRIES:
+                    return e
+                time.sleep(self.RETRY_BASE_DELAY * (2 ** attempt) + random.random())
+            except Exception as e:
+                return e
+
     def _add_cross_references(
         self,
         miro_board_id: str,
@@ -509,13 +691,14 @@ class MiroClickUpSync:
                 title="Tarefas no ClickUp"
             )
         except Exception as e:
-            logger.warning(f"Nao foi possivel criar embed ClickUp no Miro: {e}")
+            logger.warning("Nao foi possivel criar embed ClickUp no Miro: {}", e)
 
     def update_clickup_from_miro(
         self,
         board_id: str,
         list_id: str,
-        element_mapping: Dict[str, str]
+        element_mapping: Dict[str, str],
+        miro_item_ids: Optional[Dict[str, str]] = None
     ) -> SyncResult:
         """
         Atualiza tarefas ClickUp com base em mudancas no Miro.
@@ -524,11 +707,14 @@ class MiroClickUpSync:
             board_id: ID do board Miro
             list_id: ID da lista ClickUp
             element_mapping: Mapeamento element_id -> task_id
+            miro_item_ids: Mapeamento element_id -> item Miro (como em
+                SyncResult.miro_item_ids); sem ele, os IDs dos items sao
+                procurados nos valores de element_mapping
 
         Returns:
             SyncResult com status
         """
-        logger.info(f"Atualizando ClickUp a partir do board Miro: {board_id}")
+        logger.info("Atualizando ClickUp a partir do board Miro: {}", board_id)
 
         result = SyncResult(
             success=True,
@@ -540,24 +726,27 @@ class MiroClickUpSync:
             result.add_error("ClickUp client nao configurado")
             return result
 
+        # Indice reverso item Miro -> element_id
+        item_to_element = {
+            miro_id: element_id
+            for element_id, miro_id in (miro_item_ids or element_mapping).items()
+        }
+
         try:
-            # Buscar items do Miro
-            miro_items = self.miro.list_items(board_id, limit=100)
-
-            for item in miro_items.get('data', []):
-                item_id = item.get('id')
-                # Buscar element_id correspondente
-                for element_id, miro_id in element_mapping.items():
-                    if miro_id == item_id:
-                        task_id = element_mapping.get(element_id)
-                        if task_id:
-                            # Atualizar tarefa no ClickUp
-                            content = item.get('data', {}).get('content', '')
-                            if content:
-                                self.clickup.update_task(
-                                    task_id,
-                                    name=content
-                                )
+            # Percorrer todos os items do Miro (paginado)
+            for item in self.miro.iter_items(board_id):
+                element_id = item_to_element.get(item.get('id'))
+                if element_id is None:
+                    continue
+                task_id = element_mapping.get(element_id)
+                if task_id:
+                    # Atualizar tarefa no ClickUp
+                    content = item.get('data', {}).get('content', '')
+                    if content:
+                        self.clickup.update_task(
+                            task_id,
+                            name=content
+                        )
 
         except Exception as e:
             result.add_error(f"Erro na sincronizacao: {str(e)}")
@@ -592,18 +781,21 @@ class MiroClickUpSync:
             result.add_error("URL do board Miro nao disponivel")
             return result
 
+        element_ids = []
+        comments = []
         for element_id, task_id in metadata.clickup_task_ids.items():
-            try:
-                miro_item_id = metadata.miro_element_ids.get(element_id)
-                if miro_item_id:
-                    item_url = f"{metadata.miro_board_url}?moveToWidget={miro_item_id}"
-                    self.clickup.add_comment(
-                        task_id,
-                        f"📊 [Ver no Miro]({item_url})"
-                    )
-                    result.clickup_task_ids[element_id] = task_id
-            except Exception as e:
-                result.add_warning(f"Erro ao adicionar link para {element_id}: {str(e)}")
+            miro_item_id = metadata.miro_element_ids.get(element_id)
+            if miro_item_id:
+                item_url = f"{metadata.miro_board_url}?moveToWidget={miro_item_id}"
+                element_ids.append(element_id)
+                comments.append((task_id, f"📊 [Ver no Miro]({item_url})"))
+
+        failures = self._post_comments_bulk(comments)
+        for element_id, (task_id, _), error in zip(element_ids, comments, failures):
+            if error is None:
+                result.clickup_task_ids[element_id] = task_id
+            else:
+                result.add_warning(f"Erro ao adicionar link para {element_id}: {str(error)}")
 
         return result
 
@@ -623,6 +815,8 @@ class MiroClickUpSync:
             ProcessIntegrationMetadata preenchido
         """
         return ProcessIntegrationMetadata(
+            process_id=process.process_id or process.name,
+            process_name=process.name,
             miro_board_id=sync_result.miro_board_id,
             miro_board_url=sync_result.miro_board_url,
             miro_element_ids=sync_result.miro_item_ids,
@@ -632,7 +826,7 @@ class MiroClickUpSync:
             clickup_task_ids=sync_result.clickup_task_ids,
             pop_code=sync_result.metadata.get('pop_code'),
             it_codes={},  # Seria preenchido durante geracao
-            last_sync=sync_result.timestamp
+            last_synced_at=sync_result.timestamp
         )
 
 
@@ -12,34 +12,36 @@ class ProcessMapperError(Exception):
         super().__init__(message)
         self.message = message
         self.details = details or {}
+        # Texto formatado, montado no primeiro str() (details não muda depois)
+        self._str: Optional[str] = None
+
+    @staticmethod
+    def _details(**fields) -> dict:
+        """Monta details só com os campos preenchidos."""
+        return {k: v for k, v in fields.items() if v}
 
     def __str__(self):
-        if self.details:
-            details_str = ", ".join(f"{k}={v}" for k, v in self.details.items())
-            return f"{self.message} ({details_str})"
-        return self.message
+        if self._str is None:
+            if self.details:
+                details_str = ", ".join([f"{k}={v}" for k, v in self.details.items()])
+                self._str = f"{self.message} ({details_str})"
+            else:
+                self._str = self.message
+        return self._str
 
 
 class ParsingError(ProcessMapperError):
     """Erro ao fazer parsing do arquivo markdown."""
 
     def __init__(self, message: str, file_path: Optional[str] = None, line_number: Optional[int] = None):
-        details = {}
-        if file_path:
-            details['file'] = file_path
-        if line_number:
-            details['line'] = line_number
-        super().__init__(message, details)
+        super().__init__(message, self._details(file=file_path, line=line_number))
 
 
 class LLMExtractionError(ProcessMapperError):
     """Erro na extração de elementos via LLM."""
 
     def __init__(self, message: str, raw_response: Optional[str] = None, model: Optional[str] = None):
-        details = {}
-        if model:
-            details['model'] = model
-        super().__init__(message, details)
+        super().__init__(message, self._details(model=model))
         self.raw_response = raw_response
 
 
@@ -50,52 +52,35 @@ class ValidationError(ProcessMapperError):
         self.validation_errors = errors
         error_list = "\n  - ".join(errors)
         message = f"Validation failed with {len(errors)} error(s):\n  - {error_list}"
-        details = {}
-        if process_name:
-            details['process'] = process_name
-        super().__init__(message, details)
+        super().__init__(message, self._details(process=process_name))
 
 
 class BPMNConversionError(ProcessMapperError):
     """Erro ao converter para BPMN."""
 
     def __init__(self, message: str, element_id: Optional[str] = None):
-        details = {}
-        if element_id:
-            details['element'] = element_id
-        super().__init__(message, details)
+        super().__init__(message, self._details(element=element_id))
 
 
 class LayoutError(ProcessMapperError):
     """Erro no cálculo de layout."""
 
     def __init__(self, message: str, layout_type: Optional[str] = None):
-        details = {}
-        if layout_type:
-            details['layout'] = layout_type
-        super().__init__(message, details)
+        super().__init__(message, self._details(layout=layout_type))
 
 
 class MCPConnectionError(ProcessMapperError):
     """Erro de conexão com servidor MCP."""
 
     def __init__(self, message: str, server_name: Optional[str] = None):
-        details = {}
-        if server_name:
-            details['server'] = server_name
-        super().__init__(message, details)
+        super().__init__(message, self._details(server=server_name))
 
 
 class MiroAPIError(ProcessMapperError):
     """Erro na API do Miro."""
 
     def __init__(self, message: str, status_code: Optional[int] = None, board_id: Optional[str] = None):
-        details = {}
-        if status_code:
-            details['status_code'] = status_code
-        if board_id:
-            details['board_id'] = board_id
-        super().__init__(message, details)
+        super().__init__(message, self._details(status_code=status_code, board_id=board_id))
         self.status_code = status_code
 
 
@@ -103,16 +88,11 @@ class ClickUpAPIError(ProcessMapperError):
     """Erro na API do ClickUp."""
 
     def __init__(self, message: str, status_code: Optional[int] = None, task_id: Optional[str] = None):
-        details = {}
-        if status_code:
-            details['status_code'] = status_code
-        if task_id:
-            details['task_id'] = task_id
-        super().__init__(message, details)
+        super().__init__(message, self._details(status_code=status_code, task_id=task_id))
         self.status_code = status_code
 
 
-class FileNotFoundError(ProcessMapperError):
+class ProcessFileNotFoundError(ProcessMapperError):
     """Erro quando arquivo não é encontrado."""
 
     def __init__(self, file_path: str):
@@ -133,7 +113,4 @@ class ConfigurationError(ProcessMapperError):
     """Erro de configuração do sistema."""
 
     def __init__(self, message: str, config_key: Optional[str] = None):
-        details = {}
-        if config_key:
-            details['config_key'] = config_key
-        super().__init__(message, details)
+        super().__init__(message, self._details(config_key=config_key))
@@ -6,10 +6,19 @@ de ícones do arquivo YAML e resolve caminhos de ícones SVG baseado
 em tipos BPMN.
 """
 
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Union, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Union, Dict, Any, List, Mapping, Set, Tuple
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML sem libyaml: parser em Python puro
+    from yaml import SafeLoader as _SafeLoader
+
 from src.models.icon_model import IconLibrary, IconLibraryConfig, TypeMapping
 from src.utils.logger import get_logger
 from src.utils.exceptions import ProcessMapperError
@@ -46,23 +55,50 @@ class IconResolver:
         '<svg xmlns="http://www.w3.org/2000/svg">...</svg>'
     """
 
+    # Threads para a leitura paralela dos SVGs no carregamento
+    SVG_PRELOAD_WORKERS = 8
+
     def __init__(self, icons_yaml_path: Union[Path, str]):
         """
         Inicializa o resolver com o arquivo YAML de ícones.
 
+        A biblioteca só é carregada no primeiro acesso (library, base_path
+        ou qualquer consulta de ícone).
+
         Args:
             icons_yaml_path: Caminho para o arquivo icons.yaml
-
-        Raises:
-            IconLoadError: Se o arquivo não puder ser carregado
         """
         self.yaml_path = Path(icons_yaml_path)
-        self.library: Optional[IconLibrary] = None
-        self.base_path: Optional[Path] = None
+        self._library: Optional[IconLibrary] = None
+        self._base_path: Optional[Path] = None
+        self._loaded = False
         self.type_mapping = TypeMapping()
         self._svg_cache: Dict[str, str] = {}
+        # (element_type, bpmn_type) -> caminho absoluto (ver _build_path_index)
+        self._flat_paths: Mapping[Tuple[str, str], str] = MappingProxyType({})
+        # Caminhos da biblioteca que existem em disco (ver _preload_svgs e _icon_exists)
+        self._existing_paths: Set[str] = set()
 
-        self._load_library()
+    @property
+    def library(self) -> Optional[IconLibrary]:
+        """
+        Biblioteca de ícones, carregada no primeiro acesso.
+
+        Raises:
+            IconLoadError: Se o arquivo não puder ser carregado
+        """
+        if not self._loaded:
+            self._load_library()
+            self._loaded = True
+        return self._library
+
+    @property
+    def base_path(self) -> Optional[Path]:
+        """Caminho base dos arquivos de ícones (carrega a biblioteca)."""
+        if not self._loaded:
+            self._load_library()
+            self._loaded = True
+        return self._base_path
 
     def _load_library(self) -> None:
         """
@@ -77,13 +113,14 @@ class IconResolver:
                 f"Sistema usará fallback."
             )
             # Criar biblioteca vazia com configuração padrão
-            self.library = IconLibrary()
-            self.base_path = Path("data/icons")
+            self._library = IconLibrary()
+            self._base_path = Path("data/icons")
+            self._flat_paths = MappingProxyType({})
+            self._existing_paths = set()
             return
 
         try:
-            with open(self.yaml_path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            data = self._read_yaml()
 
             if not data:
                 raise IconLoadError("Arquivo YAML vazio")
@@ -98,25 +135,153 @@ class IconResolver:
             config = IconLibraryConfig(**config_data)
 
             # Criar biblioteca
-            self.library = IconLibrary(
+            self._library = IconLibrary(
                 tasks=tasks, events=events, gateways=gateways, config=config
             )
 
-            self.base_path = Path(config.base_path)
+            self._base_path = Path(config.base_path)
+            self._flat_paths = self._build_path_index()
 
             logger.info(
                 f"Biblioteca de ícones carregada: "
                 f"{len(tasks)} tasks, {len(events)} events, {len(gateways)} gateways"
             )
 
+            self._preload_svgs()
+
         except yaml.YAMLError as e:
             raise IconLoadError(f"Erro ao parsear YAML: {e}")
         except Exception as e:
             raise IconLoadError(f"Erro ao carregar biblioteca de ícones: {e}")
 
+    def _build_path_index(self) -> Mapping[Tuple[str, str], str]:
+        """
+        Pré-calcula o caminho de cada ícone declarado na biblioteca.
+
+        Os caminhos vêm de IconLibrary.get_icon_path, então o índice segue
+        exatamente a mesma resolução; combinações fora dele (fallbacks)
+        continuam delegadas à biblioteca.
+
+        Returns:
+            Mapeamento somente leitura (element_type, bpmn_type) -> caminho
+        """
+        index: Dict[Tuple[str, str], str] = {}
+        for element_type, icon_map in (
+            ("task", self._library.tasks),
+            ("event", self._library.events),
+            ("gateway", self._library.gateways),
+        ):
+            for bpmn_type in icon_map:
+                icon_path = self._library.get_icon_path(element_type, bpmn_type)
+                if icon_path:
+                    index[(element_type, bpmn_type)] = icon_path
+        return MappingProxyType(index)
+
+    def _preload_svgs(self) -> None:
+        """
+        Lê todos os SVGs da biblioteca para o cache de uma só vez.
+
+        A biblioteca é pequena (dezenas de arquivos de poucos KB) e quase
+        todos os ícones são usados na renderização; ler tudo no carregamento
+        (em paralelo) sai mais barato que abrir arquivo a arquivo sob demanda.
+        A mesma leitura registra quais arquivos existem, o que dispensa
+        chamadas a exists() em has_icon e get_icon_svg para esses caminhos
+        (arquivos ausentes no load são reverificados por _icon_exists).
+        Ícones ilegíveis são ignorados e seguem o caminho normal de
+        get_icon_svg.
+        """
+        entries: List[Tuple[str, str]] = [
+            (f"{element_type}:{bpmn_type}", icon_path)
+            for (element_type, bpmn_type), icon_path in self._flat_paths.items()
+        ]
+
+        if not entries:
+            self._existing_paths = set()
+            return
+
+        def read(entry: Tuple[str, str]) -> Tuple[str, str, Optional[str], bool]:
+            cache_key, icon_path = entry
+            try:
+                return cache_key, icon_path, self._read_svg_file(icon_path), True
+            except UnicodeDecodeError:
+                return cache_key, icon_path, None, True
+            except OSError:
+                return cache_key, icon_path, None, os.path.exists(icon_path)
+
+        existing = set()
+        workers = min(self.SVG_PRELOAD_WORKERS, len(entries))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for cache_key, icon_path, svg_content, exists in executor.map(
+                read, entries
+            ):
+                if exists:
+                    existing.add(icon_path)
+                if svg_content is not None:
+                    self._svg_cache[cache_key] = svg_content
+        self._existing_paths = existing
+
+        logger.debug(f"SVGs pré-carregados: {len(self._svg_cache)}/{len(entries)}")
+
+    def _icon_exists(self, icon_path: str) -> bool:
+        """
+        Verifica se o arquivo do ícone existe, consultando primeiro o conjunto
+        montado em _preload_svgs.
+
+        Caminhos fora do conjunto (ex: arquivo criado após o load) custam um
+        os.path.exists; se o arquivo existir, passa a constar no conjunto.
+        """
+        if icon_path in self._existing_paths:
+            return True
+        if os.path.exists(icon_path):
+            self._existing_paths.add(icon_path)
+            return True
+        return False
+
+    @staticmethod
+    def _read_svg_file(icon_path: str) -> str:
+        """Lê um arquivo SVG (bytes em uma chamada + decode único)."""
+        with open(icon_path, "rb") as f:
+            return f.read().decode("utf-8")
+
+    def _read_yaml(self) -> Any:
+        """
+        Lê o icons.yaml, reaproveitando o cache JSON ao lado do arquivo.
+
+        O cache (icons.yaml.cache.json) guarda o conteúdo já parseado junto
+        com mtime e tamanho do YAML; só é usado se ambos forem iguais.
+
+        Returns:
+            Conteúdo parseado do YAML
+        """
+        stat = self.yaml_path.stat()
+        stamp = [stat.st_mtime_ns, stat.st_size]
+        cache_path = self.yaml_path.with_name(self.yaml_path.name + ".cache.json")
+
+        try:
+            cached = json.loads(cache_path.read_bytes())
+            if cached.get("stamp") == stamp:
+                return cached["data"]
+        except (OSError, ValueError, AttributeError, KeyError):
+            pass  # sem cache ou cache inválido: parsear o YAML
+
+        with open(self.yaml_path, "rb") as f:
+            data = yaml.load(f.read(), Loader=_SafeLoader)
+
+        # Escrita atômica; falha ao gravar não impede o carregamento
+        try:
+            tmp_path = cache_path.with_suffix(".tmp")
+            tmp_path.write_text(
+                json.dumps({"stamp": stamp, "data": data}), encoding="utf-8"
+            )
+            os.replace(tmp_path, cache_path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Cache de ícones não gravado: {e}")
+
+        return data
+
     def get_icon_path(
         self, element_type: str, bpmn_type: Optional[str] = None
-    ) -> Optional[Path]:
+    ) -> Optional[str]:
         """
         Resolve o caminho completo do arquivo de ícone.
 
@@ -126,11 +291,11 @@ class IconResolver:
                       Se None, usa element_type como fallback
 
         Returns:
-            Path absoluto do arquivo SVG ou None se não encontrado
+            Caminho absoluto do arquivo SVG ou None se não encontrado
 
         Examples:
             >>> resolver.get_icon_path('task', 'user_task')
-            Path('/path/to/data/icons/tasks/user-task.svg')
+            '/path/to/data/icons/tasks/user-task.svg'
         """
         if not self.library:
             return None
@@ -138,7 +303,10 @@ class IconResolver:
         if not bpmn_type:
             bpmn_type = element_type
 
-        return self.library.get_icon_path(element_type, bpmn_type)
+        icon_path = self._flat_paths.get((element_type, bpmn_type))
+        if icon_path is None:
+            icon_path = self.library.get_icon_path(element_type, bpmn_type)
+        return icon_path
 
     def get_icon_svg(
         self, element_type: str, bpmn_type: Optional[str] = None
@@ -168,7 +336,7 @@ class IconResolver:
 
         # Resolver caminho
         icon_path = self.get_icon_path(element_type, bpmn_type)
-        if not icon_path or not icon_path.exists():
+        if not icon_path or not self._icon_exists(icon_path):
             logger.debug(
                 f"Ícone não encontrado para {element_type}:{bpmn_type} "
                 f"(path: {icon_path})"
@@ -177,7 +345,7 @@ class IconResolver:
 
         try:
             # Ler arquivo SVG
-            svg_content = icon_path.read_text(encoding="utf-8")
+            svg_content = self._read_svg_file(icon_path)
 
             # Adicionar ao cache
             self._svg_cache[cache_key] = svg_content
@@ -224,7 +392,7 @@ class IconResolver:
             return False
 
         icon_path = self.get_icon_path(element_type, bpmn_type)
-        return icon_path is not None and icon_path.exists()
+        return icon_path is not None and self._icon_exists(icon_path)
 
     def get_icon_size(self, element_type: str) -> int:
         """
@@ -281,6 +449,7 @@ class IconResolver:
         """
         self.clear_cache()
         self._load_library()
+        self._loaded = True
         logger.info("Biblioteca de ícones recarregada")
 
     def get_stats(self) -> Dict[str, Any]:
@@ -308,6 +477,7 @@ class IconResolver:
 
 # Singleton global para uso em todo o sistema
 _icon_resolver_instance: Optional[IconResolver] = None
+_DEFAULT_ICONS_YAML = Path("data/icons/icons.yaml")
 
 
 def get_icon_resolver(
@@ -329,10 +499,8 @@ def get_icon_resolver(
     """
     global _icon_resolver_instance
 
-    if icons_yaml_path is None:
-        icons_yaml_path = Path("data/icons/icons.yaml")
-
     if _icon_resolver_instance is None or reload:
-        _icon_resolver_instance = IconResolver(icons_yaml_path)
+        # Construção barata: o YAML só é lido no primeiro uso
+        _icon_resolver_instance = IconResolver(icons_yaml_path or _DEFAULT_ICONS_YAML)
 
     return _icon_resolver_instance
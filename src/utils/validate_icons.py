@@ -12,17 +12,23 @@ Pode ser executado como script de linha de comando:
     python -m src.utils.validate_icons --list
 """
 
+import os
 import sys
 import argparse
-import xml.etree.ElementTree as ET
+from xml.parsers import expat
 from pathlib import Path
-from typing import Tuple, List, Dict, Any
+from typing import Tuple, List, Dict, Any, Optional
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML sem libyaml: parser em Python puro
+    from yaml import SafeLoader as _SafeLoader
+
 from src.utils.logger import get_logger
 from src.utils.icon_library import IconResolver, IconLoadError
 
-logger = get_logger(__name__)
+logger = get_logger()
 
 
 class ValidationResult:
@@ -80,6 +86,36 @@ class ValidationResult:
         print("=" * 70 + "\n")
 
 
+def _read_svg_root(file_path: Path) -> Tuple[str, Dict[str, str]]:
+    """
+    Lê a tag e os atributos do elemento raiz de um arquivo XML.
+
+    Usa expat diretamente: o documento inteiro é verificado (XML bem
+    formado), mas nenhum Element é criado para os nós internos.
+
+    Args:
+        file_path: Caminho do arquivo
+
+    Returns:
+        Tupla (tag, atributos) da raiz, com a tag no formato do ElementTree
+        ("{namespace}nome")
+
+    Raises:
+        expat.ExpatError: Se o XML for inválido
+    """
+    root: List[Tuple[str, Dict[str, str]]] = []
+
+    def start_element(name: str, attrs: Dict[str, str]) -> None:
+        if not root:
+            root.append(("{" + name if "}" in name else name, attrs))
+
+    parser = expat.ParserCreate(namespace_separator="}")
+    parser.StartElementHandler = start_element
+    with open(file_path, "rb") as f:
+        parser.ParseFile(f)
+    return root[0]
+
+
 def validate_svg_file(file_path: Path, max_size_kb: int = 5) -> ValidationResult:
     """
     Valida um arquivo SVG individual.
@@ -114,24 +150,23 @@ def validate_svg_file(file_path: Path, max_size_kb: int = 5) -> ValidationResult
 
     # Verificar se é XML válido
     try:
-        tree = ET.parse(file_path)
-        root = tree.getroot()
-    except ET.ParseError as e:
+        root_tag, root_attrib = _read_svg_root(file_path)
+    except expat.ExpatError as e:
         result.add_error(f"XML inválido: {e}")
         return result
 
     # Verificar tag <svg>
     # Namespace SVG
-    if not (root.tag.endswith("svg") or root.tag == "svg"):
-        result.add_error(f"Tag raiz não é <svg>: {root.tag}")
+    if not (root_tag.endswith("svg") or root_tag == "svg"):
+        result.add_error(f"Tag raiz não é <svg>: {root_tag}")
         return result
 
     # Verificar viewBox (recomendado mas não obrigatório)
-    if "viewBox" not in root.attrib:
+    if "viewBox" not in root_attrib:
         result.add_warning("Atributo 'viewBox' não encontrado (recomendado)")
 
     # Verificar xmlns
-    if "xmlns" not in root.attrib and not root.tag.startswith("{"):
+    if "xmlns" not in root_attrib and not root_tag.startswith("{"):
         result.add_info("Namespace SVG não declarado explicitamente")
 
     result.add_info(f"Arquivo válido: {file_path.name} ({size_kb:.1f}KB)")
@@ -155,8 +190,8 @@ def validate_yaml_syntax(yaml_path: Path) -> ValidationResult:
         return result
 
     try:
-        with open(yaml_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        with open(yaml_path, "rb") as f:
+            data = yaml.load(f.read(), Loader=_SafeLoader)
 
         if not data:
             result.add_error("Arquivo YAML vazio")
@@ -179,6 +214,65 @@ def validate_yaml_syntax(yaml_path: Path) -> ValidationResult:
     return result
 
 
+def _scan_icon_files(base_path: Path, data: Dict[str, Any]) -> Dict[str, os.DirEntry]:
+    """
+    Lista os arquivos existentes nos diretórios referenciados pelo YAML.
+
+    Faz um único os.scandir por diretório em vez de um stat() por ícone.
+    As chaves passam por os.path.normcase, então em sistemas que ignoram
+    maiúsculas/minúsculas (Windows) a busca também as ignora.
+
+    Args:
+        base_path: Diretório base dos ícones
+        data: Conteúdo parseado do icons.yaml
+
+    Returns:
+        Dicionário caminho relativo normalizado -> DirEntry do arquivo
+        (consultar com _find_icon_file)
+    """
+    directories = {
+        os.path.dirname(os.path.normpath(icon_path))
+        for category in ("tasks", "events", "gateways")
+        for icon_path in (data.get(category) or {}).values()
+    }
+
+    files: Dict[str, os.DirEntry] = {}
+    for directory in directories:
+        try:
+            with os.scandir(base_path / directory) as it:
+                for entry in it:
+                    if entry.is_file():
+                        key = os.path.normcase(os.path.join(directory, entry.name))
+                        files[key] = entry
+        except OSError:
+            continue  # diretório ausente: ícones dele contam como faltantes
+    return files
+
+
+def _find_icon_file(
+    files: Dict[str, os.DirEntry], base_path: Path, icon_path: str
+) -> Optional[Path]:
+    """
+    Localiza um ícone referenciado no YAML usando o resultado do scan.
+
+    Se o nome não aparece no scan, confirma no disco: sistemas de arquivos
+    que ignoram maiúsculas sem que normcase o indique (macOS) aceitam
+    'User-Task.svg' para 'user-task.svg', como o antigo Path.exists().
+
+    Args:
+        files: Resultado de _scan_icon_files
+        base_path: Diretório base dos ícones
+        icon_path: Caminho relativo como escrito no YAML
+
+    Returns:
+        Caminho do arquivo ou None se não existir
+    """
+    full_path = base_path / icon_path
+    if os.path.normcase(os.path.normpath(icon_path)) in files:
+        return full_path
+    return full_path if full_path.is_file() else None
+
+
 def validate_icon_references(yaml_path: Path) -> ValidationResult:
     """
     Valida se todos os arquivos referenciados no YAML existem.
@@ -192,10 +286,11 @@ def validate_icon_references(yaml_path: Path) -> ValidationResult:
     result = ValidationResult()
 
     try:
-        with open(yaml_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        with open(yaml_path, "rb") as f:
+            data = yaml.load(f.read(), Loader=_SafeLoader)
 
         base_path = Path(data.get("config", {}).get("base_path", "data/icons"))
+        existing = _scan_icon_files(base_path, data)
 
         # Verificar todas as referências
         total_refs = 0
@@ -207,9 +302,8 @@ def validate_icon_references(yaml_path: Path) -> ValidationResult:
 
             for icon_type, icon_path in data[category].items():
                 total_refs += 1
-                full_path = base_path / icon_path
 
-                if not full_path.exists():
+                if _find_icon_file(existing, base_path, icon_path) is None:
                     result.add_error(
                         f"Arquivo não encontrado: {icon_type} → {icon_path}"
                     )
@@ -275,10 +369,11 @@ def validate_icon_library(yaml_path: Path) -> ValidationResult:
     # 3. Validar cada arquivo SVG
     print("3️⃣  Validando arquivos SVG...")
     try:
-        with open(yaml_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        with open(yaml_path, "rb") as f:
+            data = yaml.load(f.read(), Loader=_SafeLoader)
 
         base_path = Path(data.get("config", {}).get("base_path", "data/icons"))
+        existing = _scan_icon_files(base_path, data)
         svg_count = 0
 
         for category in ["tasks", "events", "gateways"]:
@@ -286,9 +381,9 @@ def validate_icon_library(yaml_path: Path) -> ValidationResult:
                 continue
 
             for icon_type, icon_path in data[category].items():
-                full_path = base_path / icon_path
+                full_path = _find_icon_file(existing, base_path, icon_path)
 
-                if full_path.exists():
+                if full_path is not None:
                     svg_result = validate_svg_file(full_path)
                     svg_count += 1
 
@@ -336,10 +431,11 @@ def list_available_icons(yaml_path: Path) -> None:
         yaml_path: Caminho do arquivo icons.yaml
     """
     try:
-        with open(yaml_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        with open(yaml_path, "rb") as f:
+            data = yaml.load(f.read(), Loader=_SafeLoader)
 
         base_path = Path(data.get("config", {}).get("base_path", "data/icons"))
+        existing = _scan_icon_files(base_path, data)
 
         print("\n" + "=" * 70)
         print("ÍCONES DISPONÍVEIS")
@@ -353,12 +449,10 @@ def list_available_icons(yaml_path: Path) -> None:
             print("-" * 70)
 
             for icon_type, icon_path in sorted(data[category].items()):
-                full_path = base_path / icon_path
-                status = "✓" if full_path.exists() else "✗"
+                full_path = _find_icon_file(existing, base_path, icon_path)
+                status = "✓" if full_path else "✗"
                 size = (
-                    f"{full_path.stat().st_size / 1024:.1f}KB"
-                    if full_path.exists()
-                    else "N/A"
+                    f"{full_path.stat().st_size / 1024:.1f}KB" if full_path else "N/A"
                 )
 
                 print(f"  {status} {icon_type:25} → {icon_path:40} ({size})")
@@ -4,10 +4,19 @@ Testes para conversores e layout.
 
 import pytest
 from src.models.process_model import Process, ProcessElement, ProcessFlow
-from src.models.visual_model import VisualDiagram, Position, Size
+import os
+from unittest.mock import Mock, patch
+from src.models.visual_model import (
+    VisualDiagram, VisualElement, Connector, VisualStyle, Color, Position, Size
+)
+from src.converters.visual_to_miro import VisualToMiroConverter
 from src.converters.process_to_visual import convert_process_to_visual
 from src.layout.swimlane_layout import apply_swimlane_layout
 from src.layout.auto_layout import apply_auto_layout, create_visual_diagram_with_layout
+from src.layout.value_chain_layout import ValueChainLayout
+from src.layout.sipoc_layout import SIPOCLayout, MacroprocessSIPOCLayout
+from src.generators.sipoc_generator import SIPOCGenerator
+from src.models.hierarchy_model import SIPOC, SIPOCItem, Macroprocess, ValueChain
 
 
 @pytest.fixture
@@ -83,6 +92,23 @@ class TestProcessToVisualConverter:
         assert 'circle' in visual_types  # Events
         assert 'diamond' in visual_types  # Gateway
 
+    def test_icon_path_on_other_drive_falls_back_to_absolute(self, simple_process):
+        """Testa que relpath com ValueError (Windows, outro drive) não quebra"""
+        with patch(
+            'src.converters.process_to_visual.os.path.relpath',
+            side_effect=ValueError("path is on mount 'D:', start on mount 'C:'")
+        ):
+            diagram = convert_process_to_visual(simple_process)
+
+        icon_paths = [
+            e.metadata['icon_relative_path']
+            for e in diagram.elements
+            if e.metadata.get('icon_relative_path')
+        ]
+        if not icon_paths:
+            pytest.skip("Ícones SVG desabilitados nas configurações")
+        assert all(os.path.isabs(path) for path in icon_paths)
+
     def test_connectors_have_labels_for_conditions(self, simple_process):
         """Testa que conectores têm labels quando há condições"""
         diagram = convert_process_to_visual(simple_process)
@@ -227,6 +253,42 @@ class TestAutoLayout:
         assert diagram.canvas_size.width >= 0
         assert diagram.canvas_size.height >= 0
 
+    def test_diagram_bounds(self, simple_process):
+        """Testa limites do diagrama a partir dos elementos"""
+        diagram = convert_process_to_visual(simple_process)
+        diagram = apply_auto_layout(diagram, simple_process)
+
+        x_min, y_min, x_max, y_max = diagram.get_bounds()
+
+        assert x_min == min(e.position.x for e in diagram.elements)
+        assert y_max == max(e.position.y + e.size.height for e in diagram.elements)
+        assert VisualDiagram(name="Vazio").get_bounds() == (0, 0, 0, 0)
+
+    def test_diagram_element_index(self, simple_process):
+        """Testa busca indexada de elementos após add_element"""
+        diagram = convert_process_to_visual(simple_process)
+        first = diagram.elements[0]
+        assert diagram.get_element(first.id) is first
+        assert diagram.get_element("inexistente") is None
+
+        extra = first.model_copy(update={"id": "extra"})
+        diagram.add_element(extra)
+        assert diagram.get_element("extra") is extra
+
+        diagram.elements = [extra]
+        assert diagram.get_element(first.id) is None
+
+    def test_resolve_connectors(self, simple_process):
+        """Testa resolução das extremidades dos conectores"""
+        diagram = convert_process_to_visual(simple_process)
+
+        resolved = diagram.resolve_connectors()
+
+        assert len(resolved) == len(diagram.connectors)
+        for source, target, connector in resolved:
+            assert source.id == connector.from_element
+            assert target.id == connector.to_element
+
 
 class TestCompleteLayoutPipeline:
     """Testes para pipeline completo"""
@@ -271,6 +333,109 @@ class TestCompleteLayoutPipeline:
             assert connector.to_element in element_ids
 
 
+class TestVisualToMiroConverter:
+    """Testes para envio de diagramas ao Miro"""
+
+    @staticmethod
+    def _diagram() -> VisualDiagram:
+        """Diagrama com dois elementos ligados por um conector."""
+        style = VisualStyle(color=Color(fill="#FFF9C4", border="#FBC02D"))
+        elements = [
+            VisualElement(
+                id=visual_id, element_id=visual_id, type="sticky_note",
+                content=visual_id, position=Position(x=0, y=0),
+                size=Size(width=100, height=60), style=style
+            )
+            for visual_id in ("v1", "v2")
+        ]
+        connector = Connector(id="c1", from_element="v1", to_element="v2")
+        return VisualDiagram(name="D", elements=elements, connectors=[connector])
+
+    def test_upload_id_map_is_local_to_each_call(self):
+        """Testa que uploads intercalados não misturam IDs entre boards"""
+        miro = Mock()
+        converter = VisualToMiroConverter(miro)
+        uploads = {}
+
+        def create_sticky_note(board_id, content, **kwargs):
+            # Simula outro upload rodando no meio deste (como em threads)
+            if board_id == "board_a" and content == "v2" and "board_b" not in uploads:
+                uploads["board_b"] = converter.convert_and_upload(
+                    "board_b", self._diagram()
+                )
+            return {'id': f"{board_id}:{content}"}
+
+        miro.create_sticky_note.side_effect = create_sticky_note
+        miro.create_connector.side_effect = (
+            lambda board_id, start_item_id, end_item_id, **kwargs:
+            {'id': f"{board_id}:{start_item_id}->{end_item_id}"}
+        )
+        uploads["board_a"] = converter.convert_and_upload("board_a", self._diagram())
+
+        assert uploads["board_a"] == {"v1": "board_a:v1", "v2": "board_a:v2"}
+        assert uploads["board_b"] == {"v1": "board_b:v1", "v2": "board_b:v2"}
+        for call in miro.create_connector.call_args_list:
+            board_id = call.kwargs["board_id"]
+            assert call.kwargs["start_item_id"] == f"{board_id}:v1"
+            assert call.kwargs["end_item_id"] == f"{board_id}:v2"
+
+
+@pytest.fixture
+def simple_sipoc():
+    """Cria um SIPOC simples para testes."""
+    return SIPOC(
+        suppliers=[SIPOCItem(name="Fornecedor")],
+        inputs=[SIPOCItem(name="Pedido")],
+        process_steps=["Receber", "Analisar"],
+        outputs=[SIPOCItem(name="Relatório")],
+        customers=[SIPOCItem(name="Cliente")]
+    )
+
+
+class TestHierarchyLayouts:
+    """Testes para layouts de Cadeia de Valor e SIPOC"""
+
+    def test_value_chain_layout(self):
+        """Testa layout da Cadeia de Valor (canvas_size calculado)"""
+        macroprocesses = {
+            "M1": Macroprocess(id="M1", name="Vender", type="primario"),
+            "M2": Macroprocess(id="M2", name="Entregar", type="primario"),
+            "M3": Macroprocess(id="M3", name="Financeiro", type="apoio"),
+            "M4": Macroprocess(id="M4", name="Planejar", type="gestao"),
+        }
+        value_chain = ValueChain(
+            id="VC",
+            name="Cadeia",
+            macroprocesses=list(macroprocesses),
+            primary_macroprocesses=["M1", "M2"],
+            support_macroprocesses=["M3"],
+            management_macroprocesses=["M4"]
+        )
+
+        diagram = ValueChainLayout().create_layout(value_chain, macroprocesses)
+
+        assert isinstance(diagram.canvas_size, Size)
+        assert diagram.canvas_size.width > 0
+        assert diagram.canvas_size.height > 0
+        assert len(diagram.elements) > len(macroprocesses)
+
+    def test_sipoc_layouts(self, simple_sipoc):
+        """Testa layouts SIPOC (simples, com processos e do gerador)"""
+        diagrams = [
+            SIPOCLayout().create_layout(simple_sipoc, title="SIPOC"),
+            MacroprocessSIPOCLayout().create_layout_with_processes(
+                simple_sipoc, "SIPOC", [{"id": "P1", "name": "Processo 1"}]
+            ),
+            SIPOCGenerator().to_visual_diagram(simple_sipoc),
+        ]
+
+        for diagram in diagrams:
+            assert isinstance(diagram.canvas_size, Size)
+            assert diagram.canvas_size.width > 0
+            assert diagram.canvas_size.height > 0
+            assert len(diagram.elements) > 0
+
+
 @pytest.fixture
 def complex_process():
     """Cria um processo mais complexo para testes"""
@@ -2,6 +2,9 @@
 Testes para os modelos de hierarquia organizacional.
 """
 
+import json
+import sys
+
 import pytest
 from datetime import datetime
 
@@ -322,6 +325,86 @@ class TestOrganizationHierarchy:
         assert len(apoio) == 1
         assert len(gestao) == 1
 
+    def test_snapshot(self):
+        """Testa agrupamento de IDs de macroprocessos por tipo."""
+        org = OrganizationHierarchy()
+        org.add_macroprocess(Macroprocess(id="m1", name="M1", type="primario"))
+        org.add_macroprocess(Macroprocess(id="m2", name="M2", type="apoio"))
+        org.add_macroprocess(Macroprocess(id="m3", name="M3", type="primario"))
+
+        snapshot = org.snapshot()
+
+        assert snapshot["primary"] == ["m1", "m3"]
+        assert snapshot["support"] == ["m2"]
+        assert snapshot["management"] == []
+
+    def test_from_trusted_roundtrip(self):
+        """Testa reconstrucao sem validacao a partir de snapshot JSON."""
+        org = OrganizationHierarchy()
+        org.add_macroprocess(Macroprocess(
+            id="m1", name="M1", type="primario",
+            sipoc=SIPOC(suppliers=[SIPOCItem(name="Fornecedor")])
+        ))
+        org.add_activity(Activity(
+            id="a1", name="Atividade", process_id="p1",
+            tasks=[Task(id="t1", name="Tarefa", activity_id="a1", step_number=1)]
+        ))
+
+        restored = OrganizationHierarchy.from_trusted(json.loads(org.model_dump_json()))
+
+        assert restored.get_macroprocess("m1").is_primary()
+        assert restored.get_macroprocess("m1").sipoc.suppliers[0].name == "Fornecedor"
+        assert restored.get_activity("a1").tasks[0].step_number == 1
+        assert restored.created_at == org.created_at
+        assert restored == org
+
+    def test_bulk_load(self):
+        """Testa carga em lote de macroprocessos."""
+        org = OrganizationHierarchy()
+        before = org.updated_at
+
+        org.bulk_load(macroprocesses={
+            "m1": Macroprocess(id="m1", name="M1", type="primario"),
+            "m2": Macroprocess(id="m2", name="M2", type="apoio")
+        })
+
+        assert len(org.macroprocesses) == 2
+        assert org.updated_at >= before
+
+    def test_batch_updates(self):
+        """Testa que batch_updates adia a atualizacao de updated_at."""
+        org = OrganizationHierarchy()
+        before = org.updated_at
+
+        with org.batch_updates():
+            org.add_macroprocess(Macroprocess(id="m1", name="M1", type="primario"))
+            org.add_macroprocess(Macroprocess(id="m2", name="M2", type="gestao"))
+            assert org.updated_at == before
+
+        assert len(org.macroprocesses) == 2
+        assert org.updated_at >= before
+
+    def test_ids_are_interned(self):
+        """Testa que IDs e chaves da hierarquia sao internados."""
+        org = OrganizationHierarchy()
+        parent_id = "".join(["macro_", "vendas"])
+        org.add_process(ProcessHierarchy(
+            id="".join(["proc_", "1"]), name="P1", parent_id=parent_id
+        ))
+
+        process = org.get_process("proc_1")
+        key = next(iter(org.processes))
+        assert key is process.id
+        assert process.parent_id is sys.intern("macro_vendas")
+
+    def test_json_dates_are_iso(self):
+        """Testa serializacao JSON das datas em formato ISO."""
+        org = OrganizationHierarchy()
+        data = json.loads(org.model_dump_json())
+
+        assert data["created_at"] == org.created_at.isoformat()
+        assert isinstance(org.model_dump()["updated_at"], datetime)
+
 
 class TestIntegration:
     """Testes de integracao entre modelos."""
@@ -32,7 +32,8 @@ class TestIconLibrary:
         )
 
         path = library.get_icon_path("task", "user_task")
-        assert path == Path("data/icons/tasks/user-task.svg")
+        assert path == str(Path("data/icons/tasks/user-task.svg").resolve())
+        assert library.get_icon_path_obj("task", "user_task") == Path(path)
 
     def test_get_icon_path_fallback(self):
         """Testa fallback para tipo genérico."""
@@ -43,7 +44,7 @@ class TestIconLibrary:
 
         # Tipo específico não existe, deve usar fallback genérico
         path = library.get_icon_path("task", "unknown_task")
-        assert path == Path("data/icons/tasks/generic-task.svg")
+        assert path == str(Path("data/icons/tasks/generic-task.svg").resolve())
 
     def test_get_icon_size(self):
         """Testa obtenção de tamanho de ícone."""
@@ -154,6 +155,34 @@ config:
         assert stats["total_gateways"] == 1
         assert stats["mode"] == "svg"
 
+    def test_library_loaded_on_first_use(self, tmp_path):
+        """Testa que o YAML só é lido na primeira consulta."""
+        yaml_path = tmp_path / "icons.yaml"
+        yaml_path.write_text("tasks: [invalido")
+
+        # Construir não lê o arquivo; o erro aparece no primeiro uso
+        resolver = IconResolver(yaml_path)
+        with pytest.raises(IconLoadError):
+            resolver.get_stats()
+
+    def test_parsed_yaml_cache(self, tmp_path):
+        """Testa o cache JSON do YAML parseado e sua invalidação."""
+        yaml_path = tmp_path / "icons.yaml"
+        yaml_path.write_text('tasks:\n  user_task: "tasks/user-task.svg"\n')
+
+        IconResolver(yaml_path).get_stats()
+        assert (tmp_path / "icons.yaml.cache.json").exists()
+
+        # Reaproveita o cache enquanto o YAML não muda
+        assert IconResolver(yaml_path).get_stats()["total_tasks"] == 1
+
+        # YAML alterado (tamanho diferente) invalida o cache
+        yaml_path.write_text(
+            'tasks:\n  user_task: "tasks/user-task.svg"\n'
+            '  service_task: "tasks/service-task.svg"\n'
+        )
+        assert IconResolver(yaml_path).get_stats()["total_tasks"] == 2
+
     def test_get_icon_svg(self, tmp_path):
         """Testa leitura de arquivo SVG."""
         # Criar estrutura
@@ -211,6 +240,55 @@ config:
         stats = resolver.get_stats()
         assert stats["cache_size"] == 1
 
+    def test_svgs_preloaded_on_load(self, tmp_path):
+        """Testa que os SVGs existentes são lidos no carregamento."""
+        yaml_content = f"""
+tasks:
+  user_task: "tasks/user-task.svg"
+  service_task: "tasks/ausente.svg"
+config:
+  base_path: "{tmp_path}"
+"""
+        yaml_path = tmp_path / "icons.yaml"
+        yaml_path.write_text(yaml_content)
+
+        svg_file = tmp_path / "tasks" / "user-task.svg"
+        svg_file.parent.mkdir(parents=True)
+        svg_file.write_text('<svg></svg>')
+
+        resolver = IconResolver(yaml_path)
+        assert resolver.get_stats()["cache_size"] == 1
+
+        # Conteúdo já está em memória: não depende mais do arquivo
+        svg_file.unlink()
+        assert resolver.get_icon_svg("task", "user_task") == '<svg></svg>'
+        assert resolver.get_icon_svg("task", "service_task") is None
+
+        # Existência resolvida no carregamento, sem novo acesso ao disco
+        assert resolver.has_icon("task", "user_task") is True
+        assert resolver.has_icon("task", "service_task") is False
+
+    def test_icon_created_after_load(self, tmp_path):
+        """Testa que um SVG criado após o carregamento é encontrado."""
+        yaml_content = f"""
+tasks:
+  user_task: "tasks/user-task.svg"
+config:
+  base_path: "{tmp_path}"
+"""
+        yaml_path = tmp_path / "icons.yaml"
+        yaml_path.write_text(yaml_content)
+
+        resolver = IconResolver(yaml_path)
+        assert resolver.has_icon("task", "user_task") is False
+
+        svg_file = tmp_path / "tasks" / "user-task.svg"
+        svg_file.parent.mkdir(parents=True)
+        svg_file.write_text('<svg></svg>')
+
+        assert resolver.has_icon("task", "user_task") is True
+        assert resolver.get_icon_svg("task", "user_task") == '<svg></svg>'
+
     def test_clear_cache(self, tmp_path):
         """Testa limpeza de cache."""
         yaml_content = f"""
@@ -271,6 +349,105 @@ class TestIconValidation:
         assert result.is_valid is False
         assert len(result.errors) > 0
 
+    def test_malformed_after_root(self, tmp_path):
+        """Testa que erros de XML após a raiz também são detectados."""
+        from src.utils.validate_icons import validate_svg_file
+
+        svg_file = tmp_path / "test.svg"
+        svg_file.write_text('<svg viewBox="0 0 24 24"><g></svg>')
+
+        result = validate_svg_file(svg_file)
+        assert result.is_valid is False
+        assert "XML inválido" in result.errors[0]
+
+    def test_svg_root_tag_matches_elementtree(self, tmp_path):
+        """Testa que a tag raiz lida via expat segue o formato do ElementTree."""
+        import xml.etree.ElementTree as ET
+        from src.utils.validate_icons import _read_svg_root
+
+        documents = [
+            '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24"/>',
+            '<svg viewBox="0 0 24 24"><g/></svg>',
+            '<s:svg xmlns:s="http://www.w3.org/2000/svg"/>',
+        ]
+        for index, document in enumerate(documents):
+            svg_file = tmp_path / f"test{index}.svg"
+            svg_file.write_text(document)
+
+            root = ET.parse(svg_file).getroot()
+            assert _read_svg_root(svg_file)[0] == root.tag
+
+    def test_yaml_syntax(self, tmp_path):
+        """Testa validação de sintaxe do icons.yaml (UTF-8 lido em bytes)."""
+        from src.utils.validate_icons import validate_yaml_syntax
+
+        yaml_path = tmp_path / "icons.yaml"
+        yaml_path.write_text(
+            'tasks:\n  user_task: "tarefas/usuário.svg"\nevents: {}\n',
+            encoding="utf-8",
+        )
+
+        result = validate_yaml_syntax(yaml_path)
+        assert result.is_valid is True
+        assert "Seção 'tasks': 1 entradas" in result.info
+        assert any("gateways" in warning for warning in result.warnings)
+
+        yaml_path.write_text("tasks: [invalido")
+        result = validate_yaml_syntax(yaml_path)
+        assert result.is_valid is False
+        assert "Erro de sintaxe YAML" in result.errors[0]
+
+    def test_icon_references(self, tmp_path):
+        """Testa a verificação de referências baseada no scan de diretórios."""
+        from src.utils.validate_icons import validate_icon_references
+
+        (tmp_path / "tasks").mkdir()
+        (tmp_path / "tasks" / "user-task.svg").write_text('<svg/>')
+        (tmp_path / "start.svg").write_text('<svg/>')
+
+        yaml_path = tmp_path / "icons.yaml"
+        yaml_path.write_text(
+            f"""
+tasks:
+  user_task: "tasks/user-task.svg"
+  service_task: "tasks/service-task.svg"
+events:
+  start_event: "start.svg"
+gateways:
+  exclusive_gateway: "gateways/exclusive.svg"
+config:
+  base_path: "{tmp_path}"
+"""
+        )
+
+        result = validate_icon_references(yaml_path)
+        assert result.is_valid is False
+        assert any("service_task" in error for error in result.errors)
+        assert any("exclusive_gateway" in error for error in result.errors)
+        assert any("2 de 4" in error for error in result.errors)
+
+    def test_icon_references_case_insensitive(self, tmp_path, monkeypatch):
+        """Testa que normcase (Windows) faz a busca ignorar maiúsculas."""
+        import os
+        from src.utils.validate_icons import validate_icon_references
+
+        (tmp_path / "tasks").mkdir()
+        (tmp_path / "tasks" / "user-task.svg").write_text('<svg/>')
+
+        yaml_path = tmp_path / "icons.yaml"
+        yaml_path.write_text(
+            f"""
+tasks:
+  user_task: "tasks/User-Task.svg"
+config:
+  base_path: "{tmp_path}"
+"""
+        )
+
+        monkeypatch.setattr(os.path, "normcase", str.lower)
+        result = validate_icon_references(yaml_path)
+        assert result.is_valid is True
+
     def test_missing_file(self, tmp_path):
         """Testa validação de arquivo inexistente."""
         from src.utils.validate_icons import validate_svg_file
@@ -11,6 +11,7 @@ from src.models.process_model import Process, ProcessElement, ProcessIntegration
 from src.models.hierarchy_model import (
     OrganizationHierarchy, ValueChain, Macroprocess, SIPOC, SIPOCItem
 )
+from src.utils.exceptions import ClickUpAPIError
 
 
 class TestSyncResult:
@@ -117,7 +118,7 @@ class TestMiroClickUpSyncProcess:
         return process
 
     @patch('src.sync.miro_clickup_sync.MiroClient')
-    @patch('src.sync.miro_clickup_sync.ProcessLayout')
+    @patch('src.sync.miro_clickup_sync.create_visual_diagram_with_layout')
     @patch('src.sync.miro_clickup_sync.VisualToMiroConverter')
     @patch('src.sync.miro_clickup_sync.POPGenerator')
     @patch('src.sync.miro_clickup_sync.ITGenerator')
@@ -136,10 +137,6 @@ class TestMiroClickUpSyncProcess:
         mock_converter_instance.convert_and_upload.return_value = {'elem_1': 'miro_1'}
         mock_converter.return_value = mock_converter_instance
 
-        mock_layout_instance = Mock()
-        mock_layout_instance.create_layout.return_value = Mock()
-        mock_layout.return_value = mock_layout_instance
-
         mock_pop_gen.return_value.generate.return_value = Mock(code='POP-001')
         mock_it_gen.return_value.generate_for_activity.return_value = Mock()
         mock_cl_gen.return_value.generate_for_activity.return_value = Mock()
@@ -158,7 +155,7 @@ class TestMiroClickUpSyncProcess:
         assert result.miro_board_id == 'board_123'
         assert result.miro_board_url == 'https://miro.com/board_123'
 
-    @patch('src.sync.miro_clickup_sync.ProcessLayout')
+    @patch('src.sync.miro_clickup_sync.create_visual_diagram_with_layout')
     @patch('src.sync.miro_clickup_sync.VisualToMiroConverter')
     @patch('src.sync.miro_clickup_sync.POPGenerator')
     @patch('src.sync.miro_clickup_sync.ITGenerator')
@@ -192,10 +189,6 @@ class TestMiroClickUpSyncProcess:
         mock_converter_instance.convert_and_upload.return_value = {'elem_1': 'miro_1'}
         mock_converter.return_value = mock_converter_instance
 
-        mock_layout_instance = Mock()
-        mock_layout_instance.create_layout.return_value = Mock()
-        mock_layout.return_value = mock_layout_instance
-
         mock_pop = Mock()
         mock_pop.code = 'POP-001'
         mock_pop_gen.return_value.generate.return_value = mock_pop
@@ -223,6 +216,8 @@ class TestMiroClickUpSyncProcess:
         assert result.miro_board_id == 'board_123'
         assert result.clickup_folder_id == 'folder_1'
         assert result.clickup_list_id == 'list_1'
+        # Link do board Miro comentado em cada tarefa criada
+        assert mock_clickup.add_comment.call_count == 2
 
     def test_sync_process_no_space_id_warning(self):
         """Testa aviso quando space_id nao e fornecido."""
@@ -234,7 +229,7 @@ class TestMiroClickUpSyncProcess:
 
         process = self._create_mock_process()
 
-        with patch('src.sync.miro_clickup_sync.ProcessLayout'):
+        with patch('src.sync.miro_clickup_sync.create_visual_diagram_with_layout'):
             with patch('src.sync.miro_clickup_sync.VisualToMiroConverter') as mock_conv:
                 mock_conv.return_value.convert_and_upload.return_value = {}
                 with patch('src.sync.miro_clickup_sync.POPGenerator'):
@@ -255,12 +250,82 @@ class TestMiroClickUpSyncProcess:
         assert any('space_id' in w for w in result.warnings)
 
 
+    @patch('src.sync.miro_clickup_sync.create_visual_diagram_with_layout')
+    @patch('src.sync.miro_clickup_sync.VisualToMiroConverter')
+    @patch('src.sync.miro_clickup_sync.POPGenerator')
+    @patch('src.sync.miro_clickup_sync.ITGenerator')
+    @patch('src.sync.miro_clickup_sync.ChecklistGenerator')
+    def test_resync_reuses_documentation(
+        self, mock_cl_gen, mock_it_gen, mock_pop_gen,
+        mock_converter, mock_layout
+    ):
+        """Testa que ressincronizar o mesmo processo reaproveita a documentacao."""
+        mock_miro = Mock()
+        mock_miro.create_board.return_value = {'id': 'board_1'}
+        mock_converter.return_value.convert_and_upload.return_value = {}
+        mock_pop_gen.return_value.generate.return_value = Mock(code='POP-001')
+
+        process = self._create_mock_process()
+        sync = MiroClickUpSync(miro_client=mock_miro)
+
+        sync.sync_process_to_both(process, create_clickup_tasks=False)
+        result = sync.sync_process_to_both(process, create_clickup_tasks=False)
+
+        assert result.metadata['pop_code'] == 'POP-001'
+        mock_pop_gen.return_value.generate.assert_called_once()
+        assert mock_it_gen.return_value.generate_for_activity.call_count == 2
+
+        # Conteudo alterado (ou cache limpo) gera de novo
+        process.name = "Processo de Vendas v2"
+        sync.sync_process_to_both(process, create_clickup_tasks=False)
+        assert mock_pop_gen.return_value.generate.call_count == 2
+
+    @patch('src.sync.miro_clickup_sync.VisualToMiroConverter')
+    @patch('src.sync.miro_clickup_sync.POPGenerator')
+    @patch('src.sync.miro_clickup_sync.ITGenerator')
+    @patch('src.sync.miro_clickup_sync.ChecklistGenerator')
+    def test_documentation_cache_evicts_least_recent(
+        self, mock_cl_gen, mock_it_gen, mock_pop_gen, mock_converter
+    ):
+        """Testa chave por conteudo e descarte do item menos usado."""
+        sync = MiroClickUpSync(miro_client=Mock())
+        sync.DOCUMENTATION_CACHE_SIZE = 2
+        generate = mock_pop_gen.return_value.generate
+
+        processes = []
+        for name in ("A", "B", "C"):
+            process = self._create_mock_process()
+            process.name = name
+            processes.append(process)
+        process_a, process_b, process_c = processes
+
+        sync._generate_documentation(process_a, process_a.get_tasks())
+        sync._generate_documentation(process_b, process_b.get_tasks())
+        # Copia com o mesmo conteudo usa a mesma entrada (e a torna recente)
+        sync._generate_documentation(
+            process_a.model_copy(deep=True), process_a.get_tasks()
+        )
+        assert generate.call_count == 2
+
+        # C entra no lugar de B, o menos usado
+        sync._generate_documentation(process_c, process_c.get_tasks())
+        sync._generate_documentation(process_a, process_a.get_tasks())
+        assert generate.call_count == 3
+        sync._generate_documentation(process_b, process_b.get_tasks())
+        assert generate.call_count == 4
+
+        sync.clear_cache()
+        sync._generate_documentation(process_a, process_a.get_tasks())
+        assert generate.call_count == 5
+
+
 class TestMiroClickUpSyncValueChain:
     """Testes de sincronizacao de Cadeia de Valor."""
 
     def _create_mock_hierarchy(self):
         """Cria uma hierarquia mock para testes."""
         value_chain = ValueChain(
+            id="VC-001",
             name="Empresa Teste",
             primary_macroprocesses=["macro_vendas"],
             support_macroprocesses=["macro_ti"]
@@ -293,10 +358,6 @@ class TestMiroClickUpSyncValueChain:
         mock_miro.create_board.return_value = {'id': 'vc_board'}
         mock_miro.get_board_url.return_value = 'https://miro.com/vc_board'
 
-        mock_layout_instance = Mock()
-        mock_layout_instance.create_layout.return_value = Mock()
-        mock_layout.return_value = mock_layout_instance
-
         mock_converter_instance = Mock()
         mock_converter_instance.convert_and_upload.return_value = {}
         mock_converter.return_value = mock_converter_instance
@@ -311,6 +372,9 @@ class TestMiroClickUpSyncValueChain:
 
         assert result.success is True
         assert result.miro_board_id == 'vc_board'
+        # Macroprocessos rodam em paralelo, mas o resultado segue a hierarquia
+        assert mock_sync_macro.call_count == 2
+        assert list(result.metadata['macro_boards']) == ['macro_vendas', 'macro_ti']
 
     def test_sync_value_chain_no_vc(self):
         """Testa erro quando hierarquia nao tem Cadeia de Valor."""
@@ -334,10 +398,6 @@ class TestMiroClickUpSyncMacroprocess:
         mock_miro.create_board.return_value = {'id': 'macro_board'}
         mock_miro.get_board_url.return_value = 'https://miro.com/macro_board'
 
-        mock_layout_instance = Mock()
-        mock_layout_instance.create_layout.return_value = Mock()
-        mock_layout.return_value = mock_layout_instance
-
         mock_converter_instance = Mock()
         mock_converter_instance.convert_and_upload.return_value = {}
         mock_converter.return_value = mock_converter_instance
@@ -393,6 +453,29 @@ class TestMiroClickUpSyncCrossReferences:
         mock_clickup.add_comment.return_value = {}
 
         metadata = ProcessIntegrationMetadata(
+            process_id='PROC-001',
+            process_name='Processo de Vendas',
+            miro_board_id='board_1',
+            miro_board_url='https://miro.com/board_1',
+            miro_element_ids={'elem_1': 'miro_item_1'},
+            clickup_task_ids={'elem_1': 'task_1'}
+        )
+
+        sync = MiroClickUpSync(miro_client=mock_miro, clickup_client=mock_clickup)
+        result = sync.add_miro_links_to_clickup(metadata)
+
+        assert result.success is True
+        mock_clickup.add_comment.assert_called_once()
+
+    def test_add_miro_links_client_error_becomes_warning(self):
+        """Testa que erro 4xx vira aviso sem nova tentativa."""
+        mock_miro = Mock()
+        mock_clickup = Mock()
+        mock_clickup.add_comment.side_effect = ClickUpAPIError("not found", status_code=404)
+
+        metadata = ProcessIntegrationMetadata(
+            process_id='PROC-001',
+            process_name='Processo de Vendas',
             miro_board_id='board_1',
             miro_board_url='https://miro.com/board_1',
             miro_element_ids={'elem_1': 'miro_item_1'},
@@ -403,14 +486,54 @@ class TestMiroClickUpSyncCrossReferences:
         result = sync.add_miro_links_to_clickup(metadata)
 
         assert result.success is True
+        assert any('elem_1' in w for w in result.warnings)
+        assert result.clickup_task_ids == {}
         mock_clickup.add_comment.assert_called_once()
 
+    @patch('src.sync.miro_clickup_sync.time.sleep')
+    def test_post_comment_retries_only_transient_errors(self, mock_sleep):
+        """Testa que so status None/429/5xx sao repetidos."""
+        mock_clickup = Mock()
+        sync = MiroClickUpSync(miro_client=Mock(), clickup_client=mock_clickup)
+        attempts = sync.COMMENT_RETRIES + 1
+
+        # Transitorios: repete ate conseguir
+        for status in (None, 429, 500, 503):
+            mock_clickup.add_comment.reset_mock()
+            mock_clickup.add_comment.side_effect = [
+                ClickUpAPIError("falha", status_code=status), {}
+            ]
+            assert sync._post_comment('task_1', 'link') is None
+            assert mock_clickup.add_comment.call_count == 2
+
+        # Transitorio persistente: desiste apos COMMENT_RETRIES
+        mock_clickup.add_comment.reset_mock()
+        mock_clickup.add_comment.side_effect = ClickUpAPIError("falha", status_code=502)
+        error = sync._post_comment('task_1', 'link')
+        assert error.status_code == 502
+        assert mock_clickup.add_comment.call_count == attempts
+
+        # Erros do cliente (4xx) e outras excecoes: sem nova tentativa
+        for side_effect in (
+            ClickUpAPIError("bad request", status_code=400),
+            ClickUpAPIError("not found", status_code=404),
+            ValueError("inesperado"),
+        ):
+            mock_clickup.add_comment.reset_mock()
+            mock_clickup.add_comment.side_effect = side_effect
+            assert sync._post_comment('task_1', 'link') is side_effect
+            assert mock_clickup.add_comment.call_count == 1
+
+        assert mock_sleep.call_count == 4 + (attempts - 1)
+
     def test_add_miro_links_no_url(self):
         """Testa erro quando URL do Miro nao esta disponivel."""
         mock_miro = Mock()
         mock_clickup = Mock()
 
         metadata = ProcessIntegrationMetadata(
+            process_id='PROC-001',
+            process_name='Processo de Vendas',
             miro_board_id='board_1',
             miro_board_url=None  # Sem URL
         )
@@ -422,6 +545,49 @@ class TestMiroClickUpSyncCrossReferences:
         assert len(result.errors) > 0
 
 
+class TestMiroClickUpSyncUpdate:
+    """Testes de atualizacao do ClickUp a partir do Miro."""
+
+    def test_update_clickup_from_miro_uses_item_mapping(self):
+        """Testa que items Miro sao ligados as tarefas via element_id."""
+        mock_miro = Mock()
+        mock_miro.iter_items.return_value = iter([
+            {'id': 'miro_1', 'data': {'content': 'Analisar Pedido v2'}},
+            {'id': 'miro_x', 'data': {'content': 'Sem mapeamento'}}
+        ])
+        mock_clickup = Mock()
+
+        sync = MiroClickUpSync(miro_client=mock_miro, clickup_client=mock_clickup)
+        result = sync.update_clickup_from_miro(
+            'board_1', 'list_1',
+            element_mapping={'elem_1': 'task_1'},
+            miro_item_ids={'elem_1': 'miro_1'}
+        )
+
+        assert result.success is True
+        mock_clickup.update_task.assert_called_once_with('task_1', name='Analisar Pedido v2')
+        mock_miro.iter_items.assert_called_once_with('board_1')
+
+    def test_update_clickup_from_miro_without_item_mapping(self):
+        """Testa o fallback: IDs dos items procurados em element_mapping."""
+        mock_miro = Mock()
+        mock_miro.iter_items.return_value = iter([
+            {'id': 'item_1', 'data': {'content': 'Aprovar Pedido v2'}},
+            {'id': 'item_2', 'data': {'content': ''}}
+        ])
+        mock_clickup = Mock()
+
+        sync = MiroClickUpSync(miro_client=mock_miro, clickup_client=mock_clickup)
+        result = sync.update_clickup_from_miro(
+            'board_1', 'list_1',
+            element_mapping={'item_1': 'item_1', 'item_2': 'item_2'}
+        )
+
+        assert result.success is True
+        # Item sem conteudo nao gera atualizacao
+        mock_clickup.update_task.assert_called_once_with('item_1', name='Aprovar Pedido v2')
+
+
 class TestMiroClickUpSyncMetadata:
     """Testes de geracao de metadata."""
 